@@ -18,11 +18,29 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """This module provides the base dataset class."""
+# pylint: disable=too-many-lines
 from __future__ import annotations
 
+import inspect
+import json
+import os
 import re
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from functools import wraps
 from pathlib import Path
 from typing import Any
+from typing import Protocol
+from typing import TypeVar
+from urllib.parse import quote
+from urllib.parse import unquote
 
 import polars as pl
 from tqdm.auto import tqdm
@@ -32,7 +50,55 @@ from pymovements.events.events import EventDataFrame
 from pymovements.events.events import EventDetectionCallable
 from pymovements.gaze import GazeDataFrame
 from pymovements.gaze.experiment import Experiment
+from pymovements.utils.cache import StageCache
+from pymovements.utils.paths import create_temporary_file
 from pymovements.utils.paths import match_filepaths
+from pymovements.utils.prefetching import Prefetcher
+from pymovements.utils.profiling import Profiler
+
+_T = TypeVar('_T')
+_FrameT = TypeVar('_FrameT', pl.DataFrame, pl.LazyFrame)
+
+
+class _SaveFunction(Protocol):
+    """Save method with all arguments bound except for the verbosity."""
+
+    def __call__(self, *, verbose: int) -> None:
+        ...
+
+
+def _processing_step(method: Callable[..., None]) -> Callable[..., None]:
+    """Register a dataset method as a processing step for incremental and out-of-core processing.
+
+    If the dataset was loaded with ``incremental=True`` or a ``memory_budget``, the call is
+    recorded and skipped files that were processed with different steps are reloaded. The method is
+    then applied if there are any files left to process. In out-of-core mode, the method is only
+    applied when the recorded steps are replayed on each window of files while saving.
+    """
+    signature = inspect.signature(method)
+
+    @wraps(method)
+    def wrapper(self: Dataset, *args: Any, **kwargs: Any) -> None:
+        # pylint: disable=protected-access
+        if not self._incremental and not self._is_deferred:
+            method(self, *args, **kwargs)
+            return
+
+        bound_arguments = signature.bind(self, *args, **kwargs)
+        bound_arguments.apply_defaults()
+
+        step_kwargs: dict[str, Any] = {}
+        for name, value in list(bound_arguments.arguments.items())[1:]:
+            if signature.parameters[name].kind == inspect.Parameter.VAR_KEYWORD:
+                step_kwargs.update(value)
+            elif name not in {'verbose', 'cache'}:
+                step_kwargs[name] = value
+
+        self._add_processing_step(method, step_kwargs)
+        if not self._is_deferred and len(self.fileinfo) > 0:
+            method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class Dataset:
@@ -40,6 +106,21 @@ class Dataset:
     # pylint: disable=too-many-instance-attributes
     # The Dataset class is exceptionally complex and needs many attributes.
 
+    _valid_extensions = ['csv', 'feather', 'parquet']
+
+    _fileinfo_index_dirname = '.pymovements'
+
+    _file_id_column = 'file_id'
+
+    _valid_float_dtypes = {'float32': pl.Float32, 'float64': pl.Float64}
+
+    # Keyword arguments of `custom_read_kwargs` which also apply to preprocessed and event files.
+    _csv_tuning_kwargs = ('n_threads', 'low_memory')
+
+    _event_csv_dtypes = {
+        'name': pl.Utf8, 'onset': pl.Int64, 'offset': pl.Int64, 'duration': pl.Int64,
+    }
+
     def __init__(
             self,
             root: str | Path,
@@ -51,6 +132,7 @@ class Dataset:
             raw_dirname: str = 'raw',
             preprocessed_dirname: str = 'preprocessed',
             events_dirname: str = 'events',
+            float_dtype: str | None = None,
     ):
         """Initialize the dataset object.
 
@@ -88,6 +170,20 @@ class Dataset:
         events_dirname : str, optional
             Name of directory under dataset path that will be used to store event data. We advise
             the user to keep the event data separate from the original raw data. Default: `events`
+        float_dtype : str, optional
+            Floating point precision of the pixel, position and velocity columns. Valid options are
+            `float32` and `float64`. The columns are cast after reading and before writing files.
+            Position and velocity columns computed from single precision columns are single
+            precision as well. Single precision halves memory and disk usage, while the error is
+            well below the precision of eye trackers. If None, the dtypes are not changed.
+            Default: None
+
+        Raises
+        ------
+        ValueError
+            If `filename_regex` is None or `float_dtype` is not a valid floating point dtype.
+        TypeError
+            If `filename_regex` is not of type str.
         """
         self.fileinfo: pl.DataFrame = pl.DataFrame()
         self.gaze: list[GazeDataFrame] = []
@@ -115,6 +211,29 @@ class Dataset:
             custom_read_kwargs = {}
         self._custom_read_kwargs = custom_read_kwargs
 
+        if float_dtype is not None and float_dtype not in self._valid_float_dtypes:
+            raise ValueError(
+                f'unsupported float_dtype "{float_dtype}".'
+                f' Supported dtypes are: {list(self._valid_float_dtypes)}',
+            )
+        self._float_dtype = float_dtype
+
+        self._unified = False
+
+        self._incremental = False
+        self._memory_budget: int | None = None
+        self._is_window_resident = False
+        self._gaze_load_kwargs: dict[str, Any] = {}
+        self._processing_steps: list[tuple[Callable[..., None], dict[str, Any]]] = []
+        self._skipped_fileinfo = pl.DataFrame()
+        self._raw_file_states: dict[str, tuple[int, int]] = {}
+        self._manifest: dict[str, dict[str, Any]] = {}
+        self._gaze_fingerprints: weakref.WeakKeyDictionary[
+            GazeDataFrame, tuple[weakref.ref[pl.DataFrame | pl.LazyFrame], str]
+        ] = weakref.WeakKeyDictionary()
+
+        self._profiler: Profiler | None = None
+
     def load(
             self,
             events: bool = False,
@@ -123,6 +242,16 @@ class Dataset:
             events_dirname: str | None = None,
             preprocessed_dirname: str | None = None,
             extension: str = 'feather',
+            num_workers: int = 1,
+            lazy: bool = False,
+            predicate: pl.Expr | None = None,
+            fileinfo_index: bool = False,
+            memory_map: bool = True,
+            columns: list[str] | None = None,
+            event_columns: list[str] | None = None,
+            unified: bool = False,
+            incremental: bool = False,
+            memory_budget: int | None = None,
     ):
         """Parse file information and load all gaze files.
 
@@ -147,28 +276,285 @@ class Dataset:
             This argument is used only for this single call and does not alter
             :py:meth:`pymovements.Dataset.preprocessed_rootpath`.
         extension:
-            Specifies the file format for loading data. Valid options are: `csv`, `feather`.
+            Specifies the file format for loading data. Valid options are: `csv`, `feather`,
+            `parquet`.
             :Default: `feather`.
+        num_workers : int
+            Number of worker threads used for reading files concurrently. Files are still returned
+            in the order of the `fileinfo` dataframe. Default: 1
+        lazy : bool
+            If ``True``, gaze files are only scanned and the gaze dataframes hold
+            :py:class:`polars.LazyFrame` objects. Subsequent transformations are deferred until
+            :py:meth:`collect` or :py:meth:`save` is called. Default: False
+        predicate : pl.Expr, optional
+            If specified, only gaze samples matching this expression are loaded, e.g.
+            ``pl.col('time') < 1000``. The predicate is pushed down into the file reader, which
+            skips row groups of parquet files based on their min/max statistics.
+        fileinfo_index : bool
+            If ``True``, use a persisted fileinfo index instead of traversing the raw data
+            directory. See :py:meth:`infer_fileinfo` for details. Default: False
+        memory_map : bool
+            If ``True``, feather files are memory-mapped instead of being read into memory. The
+            loaded dataframes are backed by the page cache and are not copied. This only applies
+            to uncompressed feather files, compressed files are always decompressed into memory.
+            Default: True
+        columns : list[str], optional
+            If specified, only these columns are loaded from the gaze files. Columns are selected
+            by their names after renaming, fileinfo columns can be selected as well. The selection
+            is pushed down into the file readers, so that other columns are not parsed at all.
+        event_columns : list[str], optional
+            If specified, only these columns are loaded from the event files.
+        unified : bool
+            If ``True``, all gaze files are concatenated into a single gaze dataframe and all event
+            files into a single event dataframe. The `gaze` and `events` attributes then hold a
+            single dataframe each. A ``file_id`` column holds the row index of the corresponding
+            file in the `fileinfo` dataframe. All processing methods run as a single vectorized
+            pass over the whole dataset, windowed over ``file_id`` where needed. This reduces the
+            per-file overhead for datasets consisting of many short files. Saving still writes
+            one file per `fileinfo` row. Default: False
+        incremental : bool
+            If ``True``, only raw files which have not been processed and saved with the same
+            processing steps before are loaded. A manifest of the raw file modification times and
+            sizes, the applied processing steps and the saved output files is kept in
+            :py:attr:`~.Dataset.preprocessed_rootpath`. It is updated after each saved file, so
+            that an interrupted run resumes where it stopped. The `fileinfo` and `gaze` attributes
+            then only hold the files to process. Files which were processed with different steps
+            or are missing an output are reloaded as soon as this is noticed while calling
+            processing or save methods. Default: False
+        memory_budget : int, optional
+            If specified, the dataset is processed out-of-core. No gaze files are loaded and calls
+            of :py:meth:`pix2deg`, :py:meth:`pos2vel`, :py:meth:`detect_events` and
+            :py:meth:`compute_event_properties` are only recorded. The save methods then load the
+            files in windows, apply the recorded steps to each window, write the results and
+            release the window before loading the next one. Windows are sized so that the
+            resident gaze and event dataframes stay within this number of bytes. The size per
+            byte of raw data is measured on the first file and adjusted to the largest ratio seen
+            so far. A single file exceeding the budget is processed on its own. Memory for
+            temporary arrays during processing is not accounted for. Can be combined with
+            `incremental`.
 
         The parsed file information is assigned to the `fileinfo` attribute.
         All gaze files will be loaded as dataframes and assigned to the `gaze` attribute.
+
+        Raises
+        ------
+        ValueError
+            If `incremental` is combined with `events`, `preprocessed` or `unified`, if
+            `memory_budget` is combined with `events`, `preprocessed`, `unified` or `lazy` or if
+            `memory_budget` is not positive.
         """
-        fileinfo = self.infer_fileinfo()
+        if incremental and (events or preprocessed or unified):
+            raise ValueError(
+                'incremental loading is only supported for raw data without events and unified',
+            )
+        if memory_budget is not None:
+            if events or preprocessed or unified or lazy:
+                raise ValueError(
+                    'out-of-core loading is only supported for raw data without events, unified'
+                    ' and lazy',
+                )
+            if memory_budget <= 0:
+                raise ValueError(f'memory_budget must be positive but is {memory_budget}')
+
+        fileinfo = self.infer_fileinfo(fileinfo_index=fileinfo_index, subset=subset)
         self.fileinfo = self.take_subset(fileinfo=fileinfo, subset=subset)
-        self.gaze = self.load_gaze_files(
-            preprocessed=preprocessed, preprocessed_dirname=preprocessed_dirname,
-            extension=extension,
-        )
+
+        self._incremental = incremental
+        self._gaze_load_kwargs = {
+            'num_workers': num_workers, 'lazy': lazy, 'predicate': predicate,
+            'memory_map': memory_map, 'columns': columns,
+        }
+        self._memory_budget = memory_budget
+        self._is_window_resident = False
+        self._processing_steps = []
+        self._skipped_fileinfo = self.fileinfo.clear()
+        self._raw_file_states = {}
+        self._manifest = {}
+        if incremental:
+            for filepath in self.fileinfo['filepath']:
+                raw_file_stat = os.stat(self.raw_rootpath / filepath)
+                self._raw_file_states[filepath] = (raw_file_stat.st_mtime_ns, raw_file_stat.st_size)
+
+            self._manifest = self._read_manifest()
+            is_up_to_date = self._get_up_to_date_mask(self.fileinfo)
+            self._skipped_fileinfo = self.fileinfo.filter(is_up_to_date)
+            self.fileinfo = self.fileinfo.filter(~is_up_to_date)
+
+        if self._is_deferred or (incremental and len(self.fileinfo) == 0):
+            self.gaze = []
+        else:
+            self.gaze = self.load_gaze_files(
+                preprocessed=preprocessed, preprocessed_dirname=preprocessed_dirname,
+                extension=extension, num_workers=num_workers, lazy=lazy, predicate=predicate,
+                memory_map=memory_map, columns=columns,
+            )
+            self._fingerprint_gaze_files(
+                preprocessed=preprocessed, preprocessed_dirname=preprocessed_dirname,
+                extension=extension, predicate=predicate, columns=columns,
+            )
+
+        self._unified = unified
+        if unified:
+            # Gaze frames are either all eager or all lazy. Concatenating lazily covers both.
+            unified_gaze = self._concat_files([gaze_df.frame.lazy() for gaze_df in self.gaze])
+            file_fingerprints = [self._get_gaze_fingerprint(gaze_df) for gaze_df in self.gaze]
+            self.gaze = [
+                GazeDataFrame(
+                    unified_gaze if lazy else unified_gaze.collect(),
+                    experiment=self.experiment, copy=False,
+                ),
+            ]
+            self._set_gaze_fingerprint(
+                self.gaze[0], StageCache.make_key('concat_files', None, files=file_fingerprints),
+            )
 
         if events:
             self.events = self.load_event_files(
                 events_dirname=events_dirname,
                 extension=extension,
+                num_workers=num_workers,
+                memory_map=memory_map,
+                columns=event_columns,
+            )
+
+            if unified:
+                event_df = self._concat_files([event_df.frame for event_df in self.events])
+                self.events = [EventDataFrame(event_df)]
+
+    def _concat_files(self, dfs: list[_FrameT]) -> _FrameT:
+        """Concatenate dataframes of all files and add a file id column.
+
+        Parameters
+        ----------
+        dfs : list[pl.DataFrame] | list[pl.LazyFrame]
+            Dataframes in the order of the fileinfo rows.
+
+        Returns
+        -------
+        pl.DataFrame | pl.LazyFrame
+            Single dataframe with the row index of the fileinfo dataframe as first column.
+        """
+        return pl.concat(
+            [
+                df.select([
+                    pl.lit(file_id, dtype=pl.UInt32).alias(self._file_id_column),
+                    pl.all(),
+                ])
+                for file_id, df in enumerate(dfs)
+            ],
+            how='diagonal',
+        )
+
+    def _split_files(
+            self,
+            dfs: Sequence[pl.DataFrame | pl.LazyFrame],
+            verbose: bool = True,
+    ) -> Iterator[tuple[dict[str, Any], pl.DataFrame | pl.LazyFrame]]:
+        """Iterate over the dataframes of all files together with their fileinfo rows.
+
+        In unified mode, the single dataframe is partitioned by its file id column. Files without
+        any rows are yielded as empty dataframes.
+
+        Parameters
+        ----------
+        dfs : Sequence[pl.DataFrame | pl.LazyFrame]
+            Dataframes of the `gaze` or `events` attribute.
+        verbose : bool
+            If ``True``, show progress bar.
+
+        Yields
+        ------
+        tuple[dict[str, Any], pl.DataFrame | pl.LazyFrame]
+            Fileinfo row and dataframe of a single file.
+        """
+        fileinfo_rows = self.fileinfo.to_dicts()
+        disable_progressbar = not verbose
+
+        if not self._unified:
+            yield from tqdm(
+                zip(fileinfo_rows, dfs),
+                total=min(len(fileinfo_rows), len(dfs)),
+                disable=disable_progressbar,
             )
+            return
+
+        df = dfs[0]
+        if isinstance(df, pl.LazyFrame):
+            df = df.collect()
+
+        partitions = {}
+        if self._file_id_column in df.columns:
+            partitions = df.partition_by(self._file_id_column, as_dict=True)
+
+        for file_id, fileinfo_row in enumerate(tqdm(fileinfo_rows, disable=disable_progressbar)):
+            yield fileinfo_row, partitions.get(file_id, df.head(0))
+
+    def _drop_fileinfo_columns(
+            self,
+            df: pl.DataFrame | pl.LazyFrame,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """Drop fileinfo columns and the file id column in unified mode before saving."""
+        drop_columns = set(self.fileinfo.columns)
+        if self._unified:
+            drop_columns.add(self._file_id_column)
+        return df.drop([column for column in df.columns if column in drop_columns])
+
+    def _cast_float_columns(self, df: _FrameT) -> _FrameT:
+        """Cast pixel, position and velocity columns to the floating point dtype of the dataset.
+
+        Parameters
+        ----------
+        df : pl.DataFrame | pl.LazyFrame
+            Gaze dataframe.
+
+        Returns
+        -------
+        pl.DataFrame | pl.LazyFrame
+            Gaze dataframe with cast columns. Unchanged if no `float_dtype` has been specified.
+        """
+        if self._float_dtype is None:
+            return df
+
+        gaze_df: GazeDataFrame = GazeDataFrame(df, copy=False)
+        gaze_columns = [
+            *gaze_df.pixel_position_columns, *gaze_df.position_columns, *gaze_df.velocity_columns,
+        ]
+        if not gaze_columns:
+            return df
 
-    def infer_fileinfo(self) -> pl.DataFrame:
+        float_dtype = self._valid_float_dtypes[self._float_dtype]
+        return df.with_columns(pl.col(gaze_columns).cast(float_dtype))
+
+    def infer_fileinfo(
+            self,
+            fileinfo_index: bool = False,
+            subset: None | dict[
+                str, bool | float | int | str | list[bool | float | int | str],
+            ] = None,
+    ) -> pl.DataFrame:
         """Infer information from filepaths and filenames.
 
+        The fileinfo index directory and the :py:attr:`~.Dataset.preprocessed_rootpath` and
+        :py:attr:`~.Dataset.events_rootpath` directories are skipped if they are located in the raw
+        data directory, so that saving preprocessed data or events does not invalidate the index.
+
+        Parameters
+        ----------
+        fileinfo_index : bool
+            If ``True``, the matched file information is persisted in an index under
+            :py:attr:`~.Dataset.path` and reused on subsequent calls. The index is invalidated
+            as soon as the modification time of any directory under
+            :py:attr:`~.Dataset.raw_rootpath` changes, which is the case if files are added,
+            removed or renamed. Validating the index only requires a single stat per directory
+            instead of traversing all files. Default: False
+        subset : dict, optional
+            If specified, files are rejected during matching if a named group of the filename
+            regular expression does not match the subset values. Directories named ``key=value``
+            are skipped entirely if ``key`` is a subset key and ``value`` is not part of the
+            subset. The subset is only used to speed up file discovery. Use :py:meth:`take_subset`
+            to filter the returned dataframe. It is ignored if ``fileinfo_index`` is ``True``, as
+            the index always holds the full file information.
+
         Returns
         -------
         pl.DataFrame :
@@ -181,19 +567,72 @@ class Dataset:
         RuntimeError
             If an error occurred during matching filenames or no files have been found.
         """
-        # Get all filepaths that match regular expression.
-        fileinfo_dicts = match_filepaths(
-            path=self.raw_rootpath,
-            regex=re.compile(self._filename_regex),
-            relative=True,
-        )
+        fileinfo_df = None
+        if fileinfo_index:
+            fileinfo_df = self._read_fileinfo_index()
+
+        if fileinfo_df is None:
+            directory_mtimes: dict[str, int] = {}
+            if fileinfo_index:
+                # Directory modification times must be recorded before matching the files. Any
+                # modification during matching will then invalidate the index on the next call.
+                self._fileinfo_index_dirpath.mkdir(parents=True, exist_ok=True)
+                directory_mtimes = self._get_raw_directory_mtimes()
+
+            # The raw data directory may contain the dataset directory. Skip its output files.
+            output_dirpaths = {
+                os.path.relpath(dirpath, self.raw_rootpath) for dirpath in self._output_dirpaths
+                if self.raw_rootpath in dirpath.parents
+            }
+
+            subset_filters = {}
+            if subset is not None and not fileinfo_index:
+                subset_filters = self._get_subset_filters(subset)
+
+            def prune(dirpath: str) -> bool:
+                if dirpath in output_dirpaths:
+                    return True
+                key, separator, value = os.path.basename(dirpath).partition('=')
+                return bool(separator) and key in subset_filters and not subset_filters[key](
+                    unquote(value),
+                )
+
+            def match_filter(match: re.Match) -> bool:
+                return all(
+                    value_filter(match.group(key))
+                    for key, value_filter in subset_filters.items()
+                    if key in match.re.groupindex
+                )
+
+            # Get all filepaths that match regular expression.
+            fileinfo_dicts = match_filepaths(
+                path=self.raw_rootpath,
+                regex=re.compile(self._filename_regex),
+                relative=True,
+                prune=prune,
+                match_filter=match_filter if subset_filters else None,
+            )
+
+            if len(fileinfo_dicts) == 0:
+                if not subset_filters:
+                    raise RuntimeError(f'no matching files found in {self.raw_rootpath}')
 
-        if len(fileinfo_dicts) == 0:
-            raise RuntimeError(f'no matching files found in {self.raw_rootpath}')
+                # All files have been rejected by the subset. Return empty file information.
+                fileinfo_schema = {
+                    key: pl.Utf8 for key in re.compile(self._filename_regex).groupindex
+                }
+                fileinfo_schema['filepath'] = pl.Utf8
+                return pl.DataFrame(schema=fileinfo_schema).with_columns([
+                    pl.col(fileinfo_key).cast(fileinfo_dtype)
+                    for fileinfo_key, fileinfo_dtype in self._filename_regex_dtypes.items()
+                ])
 
-        # Create dataframe from all fileinfo records.
-        fileinfo_df = pl.from_dicts(data=fileinfo_dicts, infer_schema_length=1)
-        fileinfo_df = fileinfo_df.sort(by='filepath')
+            # Create dataframe from all fileinfo records.
+            fileinfo_df = pl.from_dicts(data=fileinfo_dicts, infer_schema_length=1)
+            fileinfo_df = fileinfo_df.sort(by='filepath')
+
+            if fileinfo_index:
+                self._write_fileinfo_index(fileinfo_df, directory_mtimes)
 
         fileinfo_df = fileinfo_df.with_columns([
             pl.col(fileinfo_key).cast(fileinfo_dtype)
@@ -202,6 +641,415 @@ class Dataset:
 
         return fileinfo_df
 
+    def _get_subset_filters(
+            self,
+            subset: dict[str, bool | float | int | str | list[bool | float | int | str]],
+    ) -> dict[str, Callable[[str], bool]]:
+        """Get filters for raw fileinfo strings from subset values.
+
+        The raw strings are converted to the values they will have after casting the fileinfo
+        dataframe with the filename regex dtypes. Keys with dtypes that cannot be converted
+        reliably are not filtered.
+
+        Parameters
+        ----------
+        subset : dict
+            Subset dictionary. Values can be either bool, float, int , str or a list of these.
+
+        Returns
+        -------
+        dict[str, Callable[[str], bool]]
+            Filter function for each subset key. A filter returns ``True`` if the string value
+            is part of the subset.
+        """
+        subset_values = self._normalize_subset(subset)
+
+        subset_filters: dict[str, Callable[[str], bool]] = {}
+        for subset_key, column_values in subset_values.items():
+            dtype = self._filename_regex_dtypes.get(subset_key, pl.Utf8)
+            is_numeric = all(
+                isinstance(value, (int, float)) and not isinstance(value, bool)
+                for value in column_values
+            )
+            is_string = all(isinstance(value, str) for value in column_values)
+
+            if dtype in pl.INTEGER_DTYPES and is_numeric:
+                converter: Callable[[str], Any] = int
+            elif dtype in pl.FLOAT_DTYPES and is_numeric:
+                converter = float
+            elif dtype == pl.Utf8 and is_string:
+                converter = str
+            else:
+                continue
+
+            subset_filters[subset_key] = partial(
+                self._is_subset_value, converter=converter, accepted_values=set(column_values),
+            )
+        return subset_filters
+
+    @staticmethod
+    def _is_subset_value(value: str, converter: Callable[[str], Any], accepted_values: set) -> bool:
+        """Check if a raw fileinfo string is part of the accepted subset values.
+
+        Strings that fail to convert are accepted, so that the error is raised while casting the
+        fileinfo dataframe.
+        """
+        try:
+            return converter(value) in accepted_values
+        except (TypeError, ValueError):
+            return True
+
+    @property
+    def _fileinfo_index_dirpath(self) -> Path:
+        """The path to the directory holding the persisted fileinfo index."""
+        return self.path / self._fileinfo_index_dirname
+
+    @property
+    def _output_dirpaths(self) -> list[Path]:
+        """The paths to the directories written by the dataset itself."""
+        return [self._fileinfo_index_dirpath, self.preprocessed_rootpath, self.events_rootpath]
+
+    def _get_raw_directory_mtimes(self) -> dict[str, int]:
+        """Get modification times of all directories under the raw data directory.
+
+        Returns
+        -------
+        dict[str, int]
+            Modification times in nanoseconds keyed by directory path relative to the raw data
+            directory.
+        """
+        # Output directories are excluded, as writing the index, preprocessed data or events
+        # changes their mtimes.
+        output_dirpaths = set(self._output_dirpaths)
+        directory_mtimes = {}
+        for dirpath, dirnames, _ in os.walk(self.raw_rootpath):
+            dirnames[:] = [
+                dirname for dirname in dirnames if Path(dirpath) / dirname not in output_dirpaths
+            ]
+            relative_dirpath = os.path.relpath(dirpath, self.raw_rootpath)
+            directory_mtimes[relative_dirpath] = os.stat(dirpath).st_mtime_ns
+        return directory_mtimes
+
+    def _read_fileinfo_index(self) -> pl.DataFrame | None:
+        """Read the persisted fileinfo index if it is still valid.
+
+        Returns
+        -------
+        pl.DataFrame, optional
+            The uncasted fileinfo dataframe or None if there is no valid index.
+        """
+        index_dirpath = self._fileinfo_index_dirpath
+        try:
+            with open(index_dirpath / 'fileinfo.json', encoding='utf-8') as index_file:
+                index_metadata = json.load(index_file)
+
+            if index_metadata['filename_regex'] != self._filename_regex:
+                return None
+            if index_metadata['raw_rootpath'] != str(self.raw_rootpath.resolve()):
+                return None
+
+            for relative_dirpath, mtime in index_metadata['directory_mtimes'].items():
+                if os.stat(self.raw_rootpath / relative_dirpath).st_mtime_ns != mtime:
+                    return None
+
+            return pl.read_ipc(index_dirpath / 'fileinfo.feather', memory_map=False)
+
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_fileinfo_index(
+            self,
+            fileinfo_df: pl.DataFrame,
+            directory_mtimes: dict[str, int],
+    ) -> None:
+        """Persist fileinfo index.
+
+        Parameters
+        ----------
+        fileinfo_df : pl.DataFrame
+            The uncasted fileinfo dataframe.
+        directory_mtimes : dict[str, int]
+            Modification times of all directories under the raw data directory.
+        """
+        index_dirpath = self._fileinfo_index_dirpath
+        index_metadata = {
+            'filename_regex': self._filename_regex,
+            'raw_rootpath': str(self.raw_rootpath.resolve()),
+            'directory_mtimes': directory_mtimes,
+        }
+
+        fileinfo_df.write_ipc(index_dirpath / 'fileinfo.feather')
+        with open(index_dirpath / 'fileinfo.json', 'w', encoding='utf-8') as index_file:
+            json.dump(index_metadata, index_file)
+
+    @property
+    def _manifest_filepath(self) -> Path:
+        """The path to the manifest file of incremental processing."""
+        return self.preprocessed_rootpath / self._fileinfo_index_dirname / 'manifest.jsonl'
+
+    def _read_manifest(self) -> dict[str, dict[str, Any]]:
+        """Read and compact the manifest of incremental processing.
+
+        The manifest is a log with one JSON record per saved output file. Records of a raw file are
+        merged if the raw file state and the processing steps are equal, otherwise the later record
+        replaces the earlier one. Incomplete records of an interrupted run are ignored.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            Manifest entries keyed by the raw filepath relative to the raw data directory.
+        """
+        manifest: dict[str, dict[str, Any]] = {}
+        try:
+            with open(self._manifest_filepath, encoding='utf-8') as manifest_file:
+                lines = manifest_file.readlines()
+        except OSError:
+            return manifest
+
+        for line in lines:
+            try:
+                self._merge_manifest_record(manifest, json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                continue
+
+        if len(lines) > len(manifest):
+            manifest_filepath = self._manifest_filepath
+            temp_filepath = manifest_filepath.with_name(f'.{manifest_filepath.name}.tmp')
+            with open(temp_filepath, 'w', encoding='utf-8') as manifest_file:
+                for entry in manifest.values():
+                    manifest_file.write(json.dumps(entry) + '\n')
+            os.replace(temp_filepath, manifest_filepath)
+
+        return manifest
+
+    @staticmethod
+    def _merge_manifest_record(
+            manifest: dict[str, dict[str, Any]],
+            record: dict[str, Any],
+    ) -> None:
+        """Merge a manifest record into the manifest entry of its raw file.
+
+        Parameters
+        ----------
+        manifest : dict[str, dict[str, Any]]
+            Manifest entries keyed by the raw filepath.
+        record : dict[str, Any]
+            Manifest record with the keys `filepath`, `raw_mtime_ns`, `raw_size`, `steps` and
+            `outputs`.
+        """
+        record = {
+            'filepath': str(record['filepath']),
+            'raw_mtime_ns': int(record['raw_mtime_ns']),
+            'raw_size': int(record['raw_size']),
+            'steps': list(record['steps']),
+            'outputs': dict(record['outputs']),
+        }
+
+        entry = manifest.get(record['filepath'])
+        if entry is not None and all(
+            entry[key] == record[key] for key in ('raw_mtime_ns', 'raw_size', 'steps')
+        ):
+            entry['outputs'].update(record['outputs'])
+        else:
+            manifest[record['filepath']] = record
+
+    def _get_up_to_date_mask(self, fileinfo: pl.DataFrame) -> pl.Series:
+        """Check which files are unchanged since they have been processed and saved.
+
+        Parameters
+        ----------
+        fileinfo : pl.DataFrame
+            Fileinfo rows to check.
+
+        Returns
+        -------
+        pl.Series
+            Boolean mask with ``True`` for files with an unchanged raw file and existing outputs.
+        """
+        is_up_to_date = []
+        for filepath in fileinfo['filepath']:
+            entry = self._manifest.get(filepath)
+            is_up_to_date.append(
+                entry is not None
+                and (entry['raw_mtime_ns'], entry['raw_size']) == self._raw_file_states[filepath]
+                and len(entry['outputs']) > 0
+                and all(
+                    (self.path / output_filepath).is_file()
+                    for output_filepath in entry['outputs'].values()
+                ),
+            )
+        return pl.Series(is_up_to_date, dtype=pl.Boolean)
+
+    def _describe_processing_steps(self) -> list[dict[str, Any]]:
+        """Describe the recorded processing steps as JSON compatible objects."""
+        return [
+            {
+                'name': method.__name__,
+                'kwargs': json.loads(
+                    json.dumps(kwargs, sort_keys=True, default=self._describe_step_argument),
+                ),
+            }
+            for method, kwargs in self._processing_steps
+        ]
+
+    @staticmethod
+    def _describe_step_argument(value: Any) -> str:
+        """Describe a processing step argument which is not JSON serializable."""
+        if callable(value) and hasattr(value, '__qualname__'):
+            return f'{value.__module__}.{value.__qualname__}'
+        return repr(value)
+
+    def _add_processing_step(self, method: Callable[..., None], kwargs: dict[str, Any]) -> None:
+        """Record a processing step and reload skipped files processed with different steps.
+
+        Parameters
+        ----------
+        method : Callable[..., None]
+            Undecorated dataset method of the processing step.
+        kwargs : dict[str, Any]
+            Keyword arguments of the processing step without `verbose`.
+        """
+        self._processing_steps.append((method, kwargs))
+
+        steps = self._describe_processing_steps()
+        self._reload_skipped_files(
+            lambda filepath: self._manifest[filepath]['steps'][:len(steps)] != steps,
+            num_replayed_steps=len(steps) - 1,
+        )
+
+    def _is_skipped_output_stale(
+            self,
+            filepath: str,
+            output_name: str,
+            output_filepath: Path,
+    ) -> bool:
+        """Check if a skipped file lacks an up to date output.
+
+        Parameters
+        ----------
+        filepath : str
+            Raw filepath relative to the raw data directory.
+        output_name : str
+            Name of the output, either `events` or `preprocessed`.
+        output_filepath : Path
+            Filepath of the output to be saved.
+
+        Returns
+        -------
+        bool
+            ``True`` if the file has been processed with different steps or the output has not been
+            saved to `output_filepath`.
+        """
+        entry = self._manifest[filepath]
+        relative_output_filepath = str(output_filepath.relative_to(self.path))
+        return (
+            entry['steps'] != self._describe_processing_steps()
+            or entry['outputs'].get(output_name) != relative_output_filepath
+            or not output_filepath.is_file()
+        )
+
+    def _reload_skipped_files(
+            self,
+            is_stale: Callable[[str], bool],
+            num_replayed_steps: int | None = None,
+    ) -> None:
+        """Reload skipped files and replay the recorded processing steps on them.
+
+        The reloaded files are merged into the `fileinfo`, `gaze` and `events` attributes in the
+        order of their filepaths. In out-of-core mode, the files are only merged into the
+        `fileinfo` attribute, they are loaded window by window while saving.
+
+        Parameters
+        ----------
+        is_stale : Callable[[str], bool]
+            Returns ``True`` for the raw filepath of each skipped file that needs to be reloaded.
+        num_replayed_steps : int, optional
+            Number of recorded processing steps to replay. If None, all steps are replayed.
+        """
+        if len(self._skipped_fileinfo) == 0:
+            return
+
+        is_stale_mask = pl.Series(
+            [is_stale(filepath) for filepath in self._skipped_fileinfo['filepath']],
+            dtype=pl.Boolean,
+        )
+        if not is_stale_mask.any():
+            return
+
+        fileinfo, gaze, events = self.fileinfo, self.gaze, self.events
+        self.fileinfo = self._skipped_fileinfo.filter(is_stale_mask)
+        self._skipped_fileinfo = self._skipped_fileinfo.filter(~is_stale_mask)
+
+        if self._is_deferred:
+            # Files are only loaded while saving in out-of-core mode.
+            self.fileinfo = pl.concat([fileinfo, self.fileinfo]).sort('filepath')
+            return
+
+        self.gaze = self.load_gaze_files(**self._gaze_load_kwargs)
+        self._fingerprint_gaze_files(
+            predicate=self._gaze_load_kwargs['predicate'],
+            columns=self._gaze_load_kwargs['columns'],
+        )
+        self.events = []
+        for method, kwargs in self._processing_steps[:num_replayed_steps]:
+            method(self, verbose=False, **kwargs)
+
+        merged_fileinfo = pl.concat([fileinfo, self.fileinfo])
+        merged_gaze = [*gaze, *self.gaze]
+        merged_events = [*events, *self.events]
+
+        order = merged_fileinfo['filepath'].arg_sort().to_list()
+        self.fileinfo = merged_fileinfo.sort('filepath')
+        self.gaze = [merged_gaze[index] for index in order]
+        if len(merged_events) == len(order):
+            self.events = [merged_events[index] for index in order]
+        else:
+            self.events = []
+
+    def _get_manifest_recorder(
+            self,
+            output_name: str,
+            output_filepaths: list[Path],
+    ) -> Callable[[int], None] | None:
+        """Get a callback recording saved output files in the manifest.
+
+        Parameters
+        ----------
+        output_name : str
+            Name of the output, either `events` or `preprocessed`.
+        output_filepaths : list[Path]
+            Output filepaths in the order of the fileinfo rows.
+
+        Returns
+        -------
+        Callable[[int], None], optional
+            Callback taking the fileinfo row index of a saved file or None if the dataset has not
+            been loaded incrementally.
+        """
+        if not self._incremental:
+            return None
+
+        steps = self._describe_processing_steps()
+        filepaths = self.fileinfo['filepath'].to_list()
+        manifest_filepath = self._manifest_filepath
+        manifest_filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        def record(file_id: int) -> None:
+            filepath = filepaths[file_id]
+            raw_mtime_ns, raw_size = self._raw_file_states[filepath]
+            manifest_record = {
+                'filepath': filepath,
+                'raw_mtime_ns': raw_mtime_ns,
+                'raw_size': raw_size,
+                'steps': steps,
+                'outputs': {output_name: str(output_filepaths[file_id].relative_to(self.path))},
+            }
+            with open(manifest_filepath, 'a', encoding='utf-8') as manifest_file:
+                manifest_file.write(json.dumps(manifest_record) + '\n')
+            self._merge_manifest_record(self._manifest, manifest_record)
+
+        return record
+
     @staticmethod
     def take_subset(
             fileinfo: pl.DataFrame,
@@ -238,9 +1086,43 @@ class Dataset:
         if subset is None:
             return fileinfo
 
+        subset_values = Dataset._normalize_subset(subset)
+
+        for subset_key, column_values in subset_values.items():
+            if subset_key not in fileinfo.columns:
+                raise ValueError(
+                    f'subset key {subset_key} must be a column in the fileinfo attribute.'
+                    f' Available columns are: {fileinfo.columns}',
+                )
+
+            fileinfo = fileinfo.filter(pl.col(subset_key).is_in(column_values))
+        return fileinfo
+
+    @staticmethod
+    def _normalize_subset(
+            subset: dict[str, bool | float | int | str | list[bool | float | int | str]],
+    ) -> dict[str, list[bool | float | int | str]]:
+        """Check subset types and convert all subset values to lists.
+
+        Parameters
+        ----------
+        subset : dict
+            Subset dictionary. Values can be either bool, float, int , str or a list of these.
+
+        Returns
+        -------
+        dict[str, list]
+            Subset dictionary with each value being a list.
+
+        Raises
+        ------
+        TypeError
+            If dictionary key or value is not of valid type.
+        """
         if not isinstance(subset, dict):
             raise TypeError(f'subset must be of type dict but is of type {type(subset)}')
 
+        subset_values: dict[str, list[bool | float | int | str]] = {}
         for subset_key, subset_value in subset.items():
             if not isinstance(subset_key, str):
                 raise TypeError(
@@ -248,30 +1130,27 @@ class Dataset:
                     f' {type(subset_key)}',
                 )
 
-            if subset_key not in fileinfo.columns:
-                raise ValueError(
-                    f'subset key {subset_key} must be a column in the fileinfo attribute.'
-                    f' Available columns are: {fileinfo.columns}',
-                )
-
             if isinstance(subset_value, (bool, float, int, str)):
-                column_values = [subset_value]
+                subset_values[subset_key] = [subset_value]
             elif isinstance(subset_value, (list, tuple)):
-                column_values = subset_value
+                subset_values[subset_key] = list(subset_value)
             else:
                 raise TypeError(
                     f'subset value must be of type bool, float, int, str or a list of these but'
                     f' key-value pair {subset_key}: {subset_value} is of type {type(subset_value)}',
                 )
-
-            fileinfo = fileinfo.filter(pl.col(subset_key).is_in(column_values))
-        return fileinfo
+        return subset_values
 
     def load_gaze_files(
             self,
             preprocessed: bool = False,
             preprocessed_dirname: str | None = None,
             extension: str = 'feather',
+            num_workers: int = 1,
+            lazy: bool = False,
+            predicate: pl.Expr | None = None,
+            memory_map: bool = True,
+            columns: list[str] | None = None,
     ) -> list[GazeDataFrame]:
         """Load all available gaze data files.
 
@@ -285,8 +1164,26 @@ class Dataset:
             This argument is used only for this single call and does not alter
             :py:meth:`pymovements.Dataset.preprocessed_rootpath`.
         extension:
-            Specifies the file format for loading data. Valid options are: `csv`, `feather`.
+            Specifies the file format for loading data. Valid options are: `csv`, `feather`,
+            `parquet`.
             :Default: `feather`.
+        num_workers : int
+            Number of worker threads used for reading files concurrently. Files are still returned
+            in the order of the `fileinfo` dataframe. Default: 1
+        lazy : bool
+            If ``True``, gaze files are only scanned and the returned gaze dataframes hold
+            :py:class:`polars.LazyFrame` objects. Default: False
+        predicate : pl.Expr, optional
+            If specified, only gaze samples matching this expression are loaded. The predicate is
+            pushed down into the file reader, which skips row groups of parquet files based on
+            their min/max statistics.
+        memory_map : bool
+            If ``True``, uncompressed feather files are memory-mapped instead of being read into
+            memory. Default: True
+        columns : list[str], optional
+            If specified, only these columns are loaded. Columns are selected by their names after
+            renaming, fileinfo columns can be selected as well. The selection is pushed down into
+            the file readers.
 
         Returns
         -------
@@ -299,43 +1196,161 @@ class Dataset:
             If `fileinfo` is None or the `fileinfo` dataframe is empty.
         RuntimeError
             If file type of gaze file is not supported.
+        ValueError
+            If `num_workers` is smaller than one.
         """
         self._check_fileinfo()
 
-        gaze_dfs: list[GazeDataFrame] = []
+        def load_gaze_file(fileinfo: dict[str, Any]) -> GazeDataFrame:
+            return self._load_gaze_file(
+                fileinfo=fileinfo,
+                preprocessed=preprocessed,
+                preprocessed_dirname=preprocessed_dirname,
+                extension=extension,
+                lazy=lazy,
+                predicate=predicate,
+                memory_map=memory_map,
+                columns=columns,
+            )
 
         # Read gaze files from fileinfo attribute.
-        for fileinfo in tqdm(self.fileinfo.to_dicts()):
-            filepath = Path(fileinfo['filepath'])
-            filepath = self.raw_rootpath / filepath
+        return self._map_fileinfo(load_gaze_file, num_workers=num_workers)
 
-            if preprocessed:
-                filepath = self._raw_to_preprocessed_filepath(
-                    filepath, preprocessed_dirname=preprocessed_dirname,
-                    extension=extension,
-                )
+    def _load_gaze_file(
+            self,
+            fileinfo: dict[str, Any],
+            preprocessed: bool = False,
+            preprocessed_dirname: str | None = None,
+            extension: str = 'feather',
+            lazy: bool = False,
+            predicate: pl.Expr | None = None,
+            memory_map: bool = True,
+            columns: list[str] | None = None,
+    ) -> GazeDataFrame:
+        """Load a single gaze data file.
+
+        Parameters
+        ----------
+        fileinfo : dict[str, Any]
+            Dictionary of fileinfo row.
+        preprocessed : bool
+            If ``True``, saved preprocessed data will be loaded, otherwise raw data will be loaded.
+        preprocessed_dirname : str
+            One-time usage of an alternative directory name to save data relative to
+            :py:meth:`pymovements.Dataset.path`.
+        extension:
+            Specifies the file format for loading data. Valid options are: `csv`, `feather`,
+            `parquet`.
+        lazy : bool
+            If ``True``, the file is only scanned and the gaze dataframe holds a
+            :py:class:`polars.LazyFrame`.
+        predicate : pl.Expr, optional
+            If specified, only gaze samples matching this expression are loaded.
+        memory_map : bool
+            If ``True``, an uncompressed feather file is memory-mapped instead of being read into
+            memory.
+        columns : list[str], optional
+            If specified, only these columns are loaded.
 
-            if filepath.suffix == '.csv':
-                if preprocessed:
-                    gaze_df = pl.read_csv(filepath)
-                else:
-                    gaze_df = pl.read_csv(filepath, **self._custom_read_kwargs)
-            elif filepath.suffix == '.feather':
-                gaze_df = pl.read_ipc(filepath)
+        Returns
+        -------
+        GazeDataFrame
+            Gaze dataframe with added fileinfo columns.
+
+        Raises
+        ------
+        RuntimeError
+            If file type of gaze file is not supported.
+        """
+        # Loading lazy gaze files is not measured, as the files are only scanned.
+        measurement_id = None if lazy else self._start_measurement()
+
+        filepath = Path(fileinfo['filepath'])
+        filepath = self.raw_rootpath / filepath
+
+        if preprocessed:
+            filepath = self._raw_to_preprocessed_filepath(
+                filepath, preprocessed_dirname=preprocessed_dirname,
+                extension=extension,
+            )
+
+        read_kwargs = self._custom_read_kwargs
+        if preprocessed and filepath.suffix == '.csv':
+            read_kwargs = self._get_preprocessed_csv_read_kwargs(filepath)
+        elif preprocessed:
+            read_kwargs = {}
+
+        # Scanning makes it possible to push down the predicate into the reader.
+        scan = lazy or predicate is not None
+
+        # Columns read from the file. Requested fileinfo columns are added afterwards.
+        file_columns = None
+        if columns is not None:
+            file_columns = [column for column in columns if column not in fileinfo]
+            fileinfo = {
+                key: value for key, value in fileinfo.items()
+                if key in columns or key == 'filepath'
+            }
+
+        # Scans are projected after filtering, as the predicate may refer to other columns.
+        read_columns = None if scan else file_columns
+
+        gaze_df: pl.DataFrame | pl.LazyFrame
+        if filepath.suffix == '.csv':
+            if read_columns is not None:
+                read_kwargs = self._project_read_kwargs(read_kwargs, read_columns)
+            if scan:
+                gaze_df = self._scan_csv(filepath, **read_kwargs)
             else:
-                raise RuntimeError(f'data files of type {filepath.suffix} are not supported')
+                gaze_df = pl.read_csv(filepath, **read_kwargs)
+        elif filepath.suffix == '.feather':
+            if scan:
+                gaze_df = pl.scan_ipc(filepath, memory_map=memory_map)
+            else:
+                # Rechunking would copy memory-mapped data into memory.
+                gaze_df = pl.read_ipc(
+                    filepath, columns=read_columns, memory_map=memory_map, rechunk=not memory_map,
+                )
+        elif filepath.suffix == '.parquet':
+            if scan:
+                gaze_df = pl.scan_parquet(filepath)
+            else:
+                gaze_df = pl.read_parquet(filepath, columns=read_columns)
+        else:
+            raise RuntimeError(f'data files of type {filepath.suffix} are not supported')
+
+        if predicate is not None:
+            gaze_df = gaze_df.filter(predicate)
+        if scan and file_columns is not None:
+            gaze_df = gaze_df.select(file_columns)
+
+        # Cast float columns and add fileinfo columns to dataframe.
+        if isinstance(gaze_df, pl.LazyFrame):
+            gaze_df = self._add_fileinfo(self._cast_float_columns(gaze_df), fileinfo)
+            if not lazy:
+                gaze_df = gaze_df.collect()
+        else:
+            gaze_df = self._add_fileinfo(self._cast_float_columns(gaze_df), fileinfo)
 
-            # Add fileinfo columns to dataframe.
-            gaze_df = self._add_fileinfo(gaze_df, fileinfo)
+        if columns is not None:
+            gaze_df = gaze_df.select(columns)
 
-            gaze_dfs.append(GazeDataFrame(gaze_df, experiment=self.experiment))
+        if isinstance(gaze_df, pl.DataFrame):
+            self._record_measurement(
+                'load_gaze', measurement_id, fileinfo['filepath'], frame=gaze_df,
+                bytes_read=filepath.stat().st_size,
+            )
 
-        return gaze_dfs
+        # The dataframe has just been read and is not referenced anywhere else.
+        return GazeDataFrame(gaze_df, experiment=self.experiment, copy=False)
 
     def load_event_files(
         self,
         events_dirname: str | None = None,
         extension: str = 'feather',
+        num_workers: int = 1,
+        memory_map: bool = True,
+        columns: list[str] | None = None,
     ) -> list[EventDataFrame]:
         """Load all available event files.
 
@@ -347,8 +1362,19 @@ class Dataset:
             This argument is used only for this single call and does not alter
             :py:meth:`pymovements.Dataset.events_rootpath`.
         extension:
-            Specifies the file format for loading data. Valid options are: `csv`, `feather`.
+            Specifies the file format for loading data. Valid options are: `csv`, `feather`,
+            `parquet`.
             :Default: `feather`.
+        num_workers : int
+            Number of worker threads used for reading files concurrently. Files are still returned
+            in the order of the `fileinfo` dataframe. Default: 1
+        memory_map : bool
+            If ``True``, uncompressed feather files are memory-mapped instead of being read into
+            memory. Default: True
+        columns : list[str], optional
+            If specified, only these columns are loaded. Fileinfo columns can be selected as well.
+            Missing ``name``, ``onset`` and ``offset`` columns are filled with null values by
+            :py:class:`~pymovements.events.EventDataFrame`.
 
         Returns
         -------
@@ -360,41 +1386,645 @@ class Dataset:
         AttributeError
             If `fileinfo` is None or the `fileinfo` dataframe is empty.
         ValueError
-            If extension is not in list of valid extensions.
+            If extension is not in list of valid extensions or `num_workers` is smaller than one.
         """
         self._check_fileinfo()
 
-        event_dfs: list[EventDataFrame] = []
+        def load_event_file(fileinfo: dict[str, Any]) -> EventDataFrame:
+            return self._load_event_file(
+                fileinfo=fileinfo,
+                events_dirname=events_dirname,
+                extension=extension,
+                memory_map=memory_map,
+                columns=columns,
+            )
 
         # read and preprocess input files
-        for fileinfo in tqdm(self.fileinfo.to_dicts()):
-            filepath = Path(fileinfo['filepath'])
-            filepath = self.raw_rootpath / filepath
+        return self._map_fileinfo(load_event_file, num_workers=num_workers)
 
-            filepath = self._raw_to_event_filepath(
-                filepath, events_dirname=events_dirname,
-                extension=extension,
+    def _load_event_file(
+            self,
+            fileinfo: dict[str, Any],
+            events_dirname: str | None = None,
+            extension: str = 'feather',
+            memory_map: bool = True,
+            columns: list[str] | None = None,
+    ) -> EventDataFrame:
+        """Load a single event file.
+
+        Parameters
+        ----------
+        fileinfo : dict[str, Any]
+            Dictionary of fileinfo row.
+        events_dirname : str
+            One-time usage of an alternative directory name to save data relative to
+            :py:meth:`pymovements.Dataset.path`.
+        extension:
+            Specifies the file format for loading data. Valid options are: `csv`, `feather`,
+            `parquet`.
+        memory_map : bool
+            If ``True``, an uncompressed feather file is memory-mapped instead of being read into
+            memory.
+        columns : list[str], optional
+            If specified, only these columns are loaded.
+
+        Returns
+        -------
+        EventDataFrame
+            Event dataframe with added fileinfo columns.
+
+        Raises
+        ------
+        ValueError
+            If extension is not in list of valid extensions.
+        """
+        measurement_id = self._start_measurement()
+
+        filepath = Path(fileinfo['filepath'])
+        filepath = self.raw_rootpath / filepath
+
+        filepath = self._raw_to_event_filepath(
+            filepath, events_dirname=events_dirname,
+            extension=extension,
+        )
+
+        file_columns = None
+        if columns is not None:
+            file_columns = [column for column in columns if column not in fileinfo]
+            fileinfo = {
+                key: value for key, value in fileinfo.items()
+                if key in columns or key == 'filepath'
+            }
+
+        if extension == 'feather':
+            event_df = pl.read_ipc(
+                filepath, columns=file_columns, memory_map=memory_map, rechunk=not memory_map,
+            )
+        elif extension == 'csv':
+            event_df = pl.read_csv(
+                filepath, columns=file_columns, **self._get_event_csv_read_kwargs(filepath),
+            )
+        elif extension == 'parquet':
+            event_df = pl.read_parquet(filepath, columns=file_columns)
+        else:
+            raise ValueError(
+                f'unsupported file format "{extension}".'
+                f'Supported formats are: {self._valid_extensions}',
             )
 
-            if extension == 'feather':
-                event_df = pl.read_ipc(filepath)
-            elif extension == 'csv':
-                event_df = pl.read_csv(filepath)
+        # Add fileinfo columns to dataframe.
+        event_df = self._add_fileinfo(event_df, fileinfo)
+
+        if columns is not None:
+            event_df = event_df.select(columns)
+
+        self._record_measurement(
+            'load_events', measurement_id, fileinfo['filepath'], bytes_read=filepath.stat().st_size,
+        )
+
+        return EventDataFrame(event_df)
+
+    def iter_gaze_batches(self, batch_size: int = 50_000) -> Iterator[GazeDataFrame]:
+        """Iterate over raw gaze data in batches of bounded size.
+
+        Raw csv files are read in chunks, so that files larger than the available memory can be
+        processed. The column selection and renaming of the dataset definition is applied and the
+        fileinfo columns are added to each batch. Batches never span multiple files and are
+        yielded in the order of the `fileinfo` dataframe.
+
+        If the `fileinfo` attribute is not set yet, it is inferred by :py:meth:`infer_fileinfo`.
+
+        Parameters
+        ----------
+        batch_size : int
+            Number of lines read per batch. Batches can be slightly smaller. Default: 50000
+
+        Yields
+        ------
+        GazeDataFrame
+            Gaze dataframe holding a single batch of samples.
+
+        Raises
+        ------
+        AttributeError
+            If the `fileinfo` dataframe is empty.
+        RuntimeError
+            If file type of gaze file is not supported.
+        ValueError
+            If `batch_size` is smaller than one.
+        """
+        if batch_size < 1:
+            raise ValueError(f'batch_size must be at least 1 but is {batch_size}')
+
+        if len(self.fileinfo.columns) == 0:
+            # The fileinfo has not been inferred yet.
+            self.fileinfo = self.infer_fileinfo()
+        self._check_fileinfo()
+
+        read_kwargs, column_dtypes = self._get_batched_csv_read_kwargs()
+        for fileinfo in self.fileinfo.to_dicts():
+            filepath = self.raw_rootpath / fileinfo['filepath']
+            if filepath.suffix != '.csv':
+                raise RuntimeError(f'data files of type {filepath.suffix} are not supported')
+
+            reader = pl.read_csv_batched(filepath, batch_size=batch_size, **read_kwargs)
+
+            batches = reader.next_batches(1)
+            while batches:
+                gaze_df = self._cast_csv_batch(batches[0], column_dtypes)
+                gaze_df = self._add_fileinfo(self._cast_float_columns(gaze_df), fileinfo)
+                yield GazeDataFrame(gaze_df, experiment=self.experiment, copy=False)
+                batches = reader.next_batches(1)
+
+    def _get_batched_csv_read_kwargs(self) -> tuple[dict[str, Any], dict[str, Any] | list[Any]]:
+        """Get keyword arguments for :py:func:`polars.read_csv_batched` and the column dtypes.
+
+        Polars ignores ``batch_size`` and reads the whole file as a single batch if ``dtypes`` are
+        passed. The dtypes of `custom_read_kwargs` are therefore removed and applied to each batch
+        by :py:meth:`_cast_csv_batch`. If they cover all selected columns, the columns are read as
+        strings, so that parsing does not depend on the schema inferred from the first rows.
+
+        Returns
+        -------
+        tuple[dict[str, Any], dict[str, Any] | list[Any]]
+            Keyword arguments without ``dtypes`` and the removed ``dtypes`` value.
+        """
+        read_kwargs = dict(self._custom_read_kwargs)
+        column_dtypes = read_kwargs.pop('dtypes', {})
+
+        selected_columns = read_kwargs.get('columns')
+        if selected_columns is not None and column_dtypes:
+            renamed_columns = dict(zip(selected_columns, read_kwargs.get('new_columns', [])))
+            if isinstance(column_dtypes, dict):
+                covers_selection = all(
+                    column in column_dtypes or renamed_columns.get(column) in column_dtypes
+                    for column in selected_columns
+                )
             else:
-                valid_extensions = ['csv', 'feather']
+                covers_selection = len(column_dtypes) >= len(selected_columns)
+            if covers_selection:
+                read_kwargs['infer_schema_length'] = 0
+
+        return read_kwargs, column_dtypes
+
+    def _cast_csv_batch(
+            self,
+            batch: pl.DataFrame,
+            column_dtypes: dict[str, Any] | list[Any],
+    ) -> pl.DataFrame:
+        """Cast a batch of a raw csv file to the dtypes of `custom_read_kwargs`.
+
+        Parameters
+        ----------
+        batch : pl.DataFrame
+            Batch as returned by :py:func:`polars.read_csv_batched`.
+        column_dtypes : dict[str, Any] | list[Any]
+            Dtypes keyed by original or renamed column names, or a list of dtypes in the order of
+            the batch columns, as accepted by the ``dtypes`` argument of :py:func:`polars.read_csv`.
+
+        Returns
+        -------
+        pl.DataFrame
+            The cast batch.
+        """
+        if not isinstance(column_dtypes, dict):
+            column_dtypes = dict(zip(batch.columns, column_dtypes))
+
+        renamed_columns = dict(
+            zip(
+                self._custom_read_kwargs.get('columns', []),
+                self._custom_read_kwargs.get('new_columns', []),
+            ),
+        )
+        cast_expressions = []
+        for column, dtype in column_dtypes.items():
+            column = renamed_columns.get(column, column)
+            if column in batch.columns:
+                cast_expressions.append(pl.col(column).cast(dtype))
+        return batch.with_columns(cast_expressions)
+
+    def iter_gaze(
+            self,
+            preprocessed: bool = False,
+            preprocessed_dirname: str | None = None,
+            extension: str = 'feather',
+            prefetch: int = 0,
+            num_workers: int = 1,
+            predicate: pl.Expr | None = None,
+            memory_map: bool = True,
+            columns: list[str] | None = None,
+    ) -> Iterator[tuple[dict[str, Any], GazeDataFrame]]:
+        """Iterate over gaze data files one file at a time.
+
+        In contrast to :py:meth:`load`, the gaze dataframes are not stored in the `gaze` attribute,
+        so that only the files currently held by the caller and the prefetched files are resident.
+        Files are yielded in the order of the `fileinfo` dataframe.
+
+        If the `fileinfo` attribute is not set yet, it is inferred by :py:meth:`infer_fileinfo`.
+
+        Parameters
+        ----------
+        preprocessed : bool
+            If ``True``, saved preprocessed data will be loaded, otherwise raw data will be loaded.
+        preprocessed_dirname : str
+            One-time usage of an alternative directory name to save data relative to
+            :py:meth:`pymovements.Dataset.path`.
+        extension:
+            Specifies the file format for loading data. Valid options are: `csv`, `feather`,
+            `parquet`.
+            :Default: `feather`.
+        prefetch : int
+            Number of files read ahead by worker threads while the caller processes the current
+            file. Reading blocks once `prefetch` files are waiting, so that at most ``prefetch + 1``
+            files are resident. Default: 0
+        num_workers : int
+            Number of worker threads used for prefetching files. Default: 1
+        predicate : pl.Expr, optional
+            If specified, only gaze samples matching this expression are loaded.
+        memory_map : bool
+            If ``True``, uncompressed feather files are memory-mapped instead of being read into
+            memory. Default: True
+        columns : list[str], optional
+            If specified, only these columns are loaded.
+
+        Returns
+        -------
+        Iterator[tuple[dict[str, Any], GazeDataFrame]]
+            Iterator over the fileinfo row and the gaze dataframe of each file.
+
+        Raises
+        ------
+        AttributeError
+            If the `fileinfo` dataframe is empty.
+        RuntimeError
+            If file type of gaze file is not supported.
+        ValueError
+            If `prefetch` is negative or `num_workers` is smaller than one.
+        """
+        load_gaze_file = partial(
+            self._load_gaze_file,
+            preprocessed=preprocessed,
+            preprocessed_dirname=preprocessed_dirname,
+            extension=extension,
+            predicate=predicate,
+            memory_map=memory_map,
+            columns=columns,
+        )
+        return self._iter_fileinfo(load_gaze_file, prefetch=prefetch, num_workers=num_workers)
+
+    def iter_events(
+            self,
+            events_dirname: str | None = None,
+            extension: str = 'feather',
+            prefetch: int = 0,
+            num_workers: int = 1,
+            memory_map: bool = True,
+            columns: list[str] | None = None,
+    ) -> Iterator[tuple[dict[str, Any], EventDataFrame]]:
+        """Iterate over event files one file at a time.
+
+        In contrast to :py:meth:`load`, the event dataframes are not stored in the `events`
+        attribute. Files are yielded in the order of the `fileinfo` dataframe.
+
+        If the `fileinfo` attribute is not set yet, it is inferred by :py:meth:`infer_fileinfo`.
+
+        Parameters
+        ----------
+        events_dirname : str
+            One-time usage of an alternative directory name to save data relative to
+            :py:meth:`pymovements.Dataset.path`.
+        extension:
+            Specifies the file format for loading data. Valid options are: `csv`, `feather`,
+            `parquet`.
+            :Default: `feather`.
+        prefetch : int
+            Number of files read ahead by worker threads while the caller processes the current
+            file. Reading blocks once `prefetch` files are waiting, so that at most ``prefetch + 1``
+            files are resident. Default: 0
+        num_workers : int
+            Number of worker threads used for prefetching files. Default: 1
+        memory_map : bool
+            If ``True``, uncompressed feather files are memory-mapped instead of being read into
+            memory. Default: True
+        columns : list[str], optional
+            If specified, only these columns are loaded.
+
+        Returns
+        -------
+        Iterator[tuple[dict[str, Any], EventDataFrame]]
+            Iterator over the fileinfo row and the event dataframe of each file.
+
+        Raises
+        ------
+        AttributeError
+            If the `fileinfo` dataframe is empty.
+        ValueError
+            If extension is not in list of valid extensions, `prefetch` is negative or
+            `num_workers` is smaller than one.
+        """
+        load_event_file = partial(
+            self._load_event_file,
+            events_dirname=events_dirname,
+            extension=extension,
+            memory_map=memory_map,
+            columns=columns,
+        )
+        return self._iter_fileinfo(load_event_file, prefetch=prefetch, num_workers=num_workers)
+
+    def _iter_fileinfo(
+            self,
+            function: Callable[[dict[str, Any]], _T],
+            prefetch: int = 0,
+            num_workers: int = 1,
+    ) -> Iterator[tuple[dict[str, Any], _T]]:
+        """Lazily apply function to each row of the fileinfo dataframe.
+
+        Parameters
+        ----------
+        function : Callable[[dict[str, Any]], Any]
+            Function to be applied on each fileinfo row dictionary.
+        prefetch : int
+            Number of rows processed ahead by worker threads. See
+            :py:class:`~pymovements.utils.prefetching.Prefetcher` for details. Default: 0
+        num_workers : int
+            Number of worker threads used for prefetching. Default: 1
+
+        Returns
+        -------
+        Iterator[tuple[dict[str, Any], Any]]
+            Iterator over the fileinfo rows and function results in the order of the fileinfo rows.
+
+        Raises
+        ------
+        ValueError
+            If `prefetch` is negative or `num_workers` is smaller than one.
+        """
+        # Arguments are checked eagerly instead of on the first call of next().
+        if prefetch < 0:
+            raise ValueError(f'prefetch must not be negative but is {prefetch}')
+        if num_workers < 1:
+            raise ValueError(f'num_workers must be at least 1 but is {num_workers}')
+
+        if len(self.fileinfo.columns) == 0:
+            # The fileinfo has not been inferred yet.
+            self.fileinfo = self.infer_fileinfo()
+        self._check_fileinfo()
+
+        fileinfo_rows = self.fileinfo.to_dicts()
+        if prefetch == 0:
+            return ((row, function(row)) for row in fileinfo_rows)
+        return Prefetcher(
+            lambda row: (row, function(row)), fileinfo_rows, depth=prefetch,
+            num_workers=num_workers,
+        )
+
+    @staticmethod
+    def _scan_csv(filepath: Path, **read_kwargs: Any) -> pl.LazyFrame:
+        """Lazily scan a csv file with keyword arguments intended for :py:func:`polars.read_csv`.
+
+        :py:func:`polars.scan_csv` does not support selecting columns while reading, so the column
+        selection and renaming is added to the query plan instead.
+
+        Parameters
+        ----------
+        filepath : Path
+            Path to the csv file.
+        **read_kwargs
+            Keyword arguments that would be passed to :py:func:`polars.read_csv`.
+
+        Returns
+        -------
+        pl.LazyFrame
+            Lazy frame scanning the csv file.
+        """
+        read_kwargs = dict(read_kwargs)
+        columns = read_kwargs.pop('columns', None)
+        new_columns = read_kwargs.pop('new_columns', None)
+        # The number of threads of a scan is determined by the polars thread pool.
+        read_kwargs.pop('n_threads', None)
+
+        lazy_df = pl.scan_csv(filepath, **read_kwargs)
+
+        if columns is not None:
+            all_columns = lazy_df.columns
+            columns = [
+                all_columns[column] if isinstance(column, int) else column
+                for column in columns
+            ]
+            lazy_df = lazy_df.select(columns)
+        else:
+            columns = lazy_df.columns
+
+        if new_columns is not None:
+            lazy_df = lazy_df.rename(dict(zip(columns, new_columns)))
+
+        return lazy_df
+
+    def _get_csv_tuning_read_kwargs(self) -> dict[str, Any]:
+        """Get the performance tuning keyword arguments of `custom_read_kwargs`."""
+        return {
+            key: value for key, value in self._custom_read_kwargs.items()
+            if key in self._csv_tuning_kwargs
+        }
+
+    def _get_preprocessed_csv_read_kwargs(self, filepath: Path) -> dict[str, Any]:
+        """Get keyword arguments for reading a preprocessed csv file with an explicit schema.
+
+        Pixel, position and velocity columns are parsed as floating point numbers instead of
+        relying on schema inference, which picks an integer dtype if the first rows of a column
+        hold integral values and then fails on the first fractional value.
+
+        Parameters
+        ----------
+        filepath : Path
+            Path to the preprocessed csv file.
+
+        Returns
+        -------
+        dict[str, Any]
+            Keyword arguments intended for :py:func:`polars.read_csv`.
+        """
+        # Polars mishandles dtypes of columns missing in the file, so the header is read first.
+        header_df = GazeDataFrame(pl.DataFrame(schema=self._read_csv_header(filepath)), copy=False)
+        float_columns = [
+            *header_df.pixel_position_columns,
+            *header_df.position_columns,
+            *header_df.velocity_columns,
+        ]
+        float_dtype: type[pl.DataType] = pl.Float64
+        if self._float_dtype is not None:
+            float_dtype = self._valid_float_dtypes[self._float_dtype]
+        read_kwargs: dict[str, Any] = self._get_csv_tuning_read_kwargs()
+        read_kwargs['dtypes'] = {column: float_dtype for column in float_columns}
+        return read_kwargs
+
+    def _get_event_csv_read_kwargs(self, filepath: Path) -> dict[str, Any]:
+        """Get keyword arguments for reading an event csv file with an explicit schema.
+
+        Parameters
+        ----------
+        filepath : Path
+            Path to the event csv file.
+
+        Returns
+        -------
+        dict[str, Any]
+            Keyword arguments intended for :py:func:`polars.read_csv`.
+        """
+        # Polars mishandles dtypes of columns missing in the file, so the header is read first.
+        header = self._read_csv_header(filepath)
+        return {
+            **self._get_csv_tuning_read_kwargs(),
+            'dtypes': {
+                column: dtype for column, dtype in self._event_csv_dtypes.items()
+                if column in header
+            },
+        }
+
+    @staticmethod
+    def _read_csv_header(filepath: Path) -> list[str]:
+        """Read the column names of a csv file without inferring its schema."""
+        # A single row is read, as polars reads the whole file for ``n_rows=0``.
+        return pl.read_csv(filepath, n_rows=1, infer_schema_length=0).columns
+
+    @staticmethod
+    def _project_read_kwargs(read_kwargs: dict[str, Any], columns: list[str]) -> dict[str, Any]:
+        """Restrict keyword arguments for :py:func:`polars.read_csv` to a selection of columns.
+
+        If the keyword arguments rename columns, the requested columns are mapped back to their
+        original names. The order of the original column selection is kept, as polars assigns the
+        new column names in this order.
+
+        Parameters
+        ----------
+        read_kwargs : dict[str, Any]
+            Keyword arguments intended for :py:func:`polars.read_csv`.
+        columns : list[str]
+            Names of columns to read after renaming.
+
+        Returns
+        -------
+        dict[str, Any]
+            Keyword arguments with adjusted ``columns`` and ``new_columns`` values.
+
+        Raises
+        ------
+        ValueError
+            If a requested column is not part of the renamed column selection.
+        """
+        if 'columns' not in read_kwargs or 'new_columns' not in read_kwargs:
+            return {**read_kwargs, 'columns': columns}
+
+        column_pairs = list(zip(read_kwargs['columns'], read_kwargs['new_columns']))
+        available_columns = [new_column for _, new_column in column_pairs]
+        for column in columns:
+            if column not in available_columns:
                 raise ValueError(
-                    f'unsupported file format "{extension}".'
-                    f'Supported formats are: {valid_extensions}',
+                    f'column {column} is not available. Available columns are: '
+                    f'{available_columns}',
                 )
 
-            # Add fileinfo columns to dataframe.
-            event_df = self._add_fileinfo(event_df, fileinfo)
+        column_pairs = [
+            (raw_column, new_column) for raw_column, new_column in column_pairs
+            if new_column in columns
+        ]
+        return {
+            **read_kwargs,
+            'columns': [raw_column for raw_column, _ in column_pairs],
+            'new_columns': [new_column for _, new_column in column_pairs],
+        }
+
+    def _map_fileinfo(
+            self,
+            function: Callable[[dict[str, Any]], _T],
+            num_workers: int = 1,
+            verbose: bool = True,
+    ) -> list[_T]:
+        """Apply function to each row of the fileinfo dataframe.
+
+        See :py:meth:`_map_parallel` for details.
+
+        Parameters
+        ----------
+        function : Callable[[dict[str, Any]], Any]
+            Function to be applied on each fileinfo row dictionary.
+        num_workers : int
+            Number of worker threads. Default: 1
+        verbose : bool
+            If ``True``, show progress bar.
+
+        Returns
+        -------
+        list
+            The function results in the order of the fileinfo rows.
+
+        Raises
+        ------
+        ValueError
+            If `num_workers` is smaller than one.
+        """
+        return self._map_parallel(
+            function, self.fileinfo.to_dicts(), num_workers=num_workers, verbose=verbose,
+        )
+
+    @staticmethod
+    def _map_parallel(
+            function: Callable[[Any], _T],
+            items: list[Any],
+            num_workers: int = 1,
+            verbose: bool = True,
+    ) -> list[_T]:
+        """Apply function to each item of a list.
+
+        With more than one worker, the items are processed concurrently by a thread pool. Polars
+        releases the GIL while reading, parsing and writing files, so threads are sufficient to keep
+        several cores busy. The results are always returned in the order of the items.
 
-            event_dfs.append(EventDataFrame(event_df))
+        Parameters
+        ----------
+        function : Callable[[Any], Any]
+            Function to be applied on each item.
+        items : list[Any]
+            Items to apply the function on.
+        num_workers : int
+            Number of worker threads. Default: 1
+        verbose : bool
+            If ``True``, show progress bar.
 
-        return event_dfs
+        Returns
+        -------
+        list
+            The function results in the order of the items.
 
-    def pix2deg(self, verbose: bool = True) -> None:
+        Raises
+        ------
+        ValueError
+            If `num_workers` is smaller than one.
+        """
+        if num_workers < 1:
+            raise ValueError(f'num_workers must be at least 1 but is {num_workers}')
+
+        disable_progressbar = not verbose
+
+        if num_workers == 1:
+            return [function(item) for item in tqdm(items, disable=disable_progressbar)]
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            return list(
+                tqdm(
+                    executor.map(function, items),
+                    total=len(items),
+                    disable=disable_progressbar,
+                ),
+            )
+
+    @_processing_step
+    def pix2deg(
+            self,
+            method: str = 'exact',
+            verbose: bool = True,
+            cache: StageCache | None = None,
+    ) -> None:
         """Compute gaze positions in degrees of visual angle from pixel coordinates.
 
         This method requires a properly initialized :py:attr:`~.Dataset.experiment` attribute.
@@ -403,22 +2033,49 @@ class Dataset:
 
         Parameters
         ----------
+        method : str
+            Conversion method. See :py:meth:`~pymovements.gaze.screen.Screen.pix2deg` for details.
+            Lazy gaze dataframes are always converted exactly. Default: exact
         verbose : bool
             If True, show progress of computation.
+        cache : StageCache, optional
+            If specified, the dva columns of each gaze dataframe are looked up in this cache before
+            they are computed. The cache is keyed by the state of the loaded gaze file, the
+            processing steps applied since loading, the experiment and the method. Gaze dataframes
+            which have been modified otherwise and lazy gaze dataframes are not cached.
 
         Raises
         ------
         AttributeError
             If `gaze` is None or there are no gaze dataframes present in the `gaze` attribute, or
             if experiment is None.
+        ValueError
+            If the method is not supported.
         """
         self._check_gaze_dataframe()
 
         disable_progressbar = not verbose
-        for gaze_df in tqdm(self.gaze, disable=disable_progressbar):
-            gaze_df.pix2deg()
+        for gaze_index, gaze_df in enumerate(tqdm(self.gaze, disable=disable_progressbar)):
+            measurement_id = self._start_measurement()
+            self._apply_gaze_step(
+                gaze_df, 'pix2deg', partial(gaze_df.pix2deg, method=method),
+                lambda gaze_df: gaze_df.position_columns, cache=cache,
+                experiment=gaze_df.experiment,
+                # Lazy gaze dataframes are always converted exactly.
+                method='exact' if gaze_df.is_lazy else method,
+            )
+            self._record_measurement(
+                'pix2deg', measurement_id, self._get_gaze_filepath(gaze_index), frame=gaze_df.frame,
+            )
 
-    def pos2vel(self, method: str = 'smooth', verbose: bool = True, **kwargs) -> None:
+    @_processing_step
+    def pos2vel(
+            self,
+            method: str = 'smooth',
+            verbose: bool = True,
+            cache: StageCache | None = None,
+            **kwargs,
+    ) -> None:
         """Compute gaze velocites in dva/s from dva coordinates.
 
         This method requires a properly initialized :py:attr:`~.Dataset.experiment` attribute.
@@ -431,6 +2088,12 @@ class Dataset:
             Computation method. See :func:`~transforms.pos2vel()` for details, default: smooth.
         verbose : bool
             If True, show progress of computation.
+        cache : StageCache, optional
+            If specified, the velocity columns of each gaze dataframe are looked up in this cache
+            before they are computed. The cache is keyed by the state of the loaded gaze file, the
+            processing steps applied since loading, the experiment, the method and its keyword
+            arguments. Gaze dataframes which have been modified otherwise and lazy gaze dataframes
+            are not cached.
         **kwargs
             Additional keyword arguments to be passed to the :func:`~transforms.pos2vel()` method.
 
@@ -442,16 +2105,29 @@ class Dataset:
         """
         self._check_gaze_dataframe()
 
+        # Velocities must not be computed across file boundaries.
+        over = self._file_id_column if self._unified else None
+
         disable_progressbar = not verbose
-        for gaze_df in tqdm(self.gaze, disable=disable_progressbar):
-            gaze_df.pos2vel(method=method, **kwargs)
+        for gaze_index, gaze_df in enumerate(tqdm(self.gaze, disable=disable_progressbar)):
+            measurement_id = self._start_measurement()
+            self._apply_gaze_step(
+                gaze_df, 'pos2vel', partial(gaze_df.pos2vel, method=method, over=over, **kwargs),
+                lambda gaze_df: gaze_df.velocity_columns, cache=cache,
+                experiment=gaze_df.experiment, method=method, over=over, kwargs=kwargs,
+            )
+            self._record_measurement(
+                'pos2vel', measurement_id, self._get_gaze_filepath(gaze_index), frame=gaze_df.frame,
+            )
 
+    @_processing_step
     def detect_events(
             self,
             method: EventDetectionCallable,
             eye: str | None = 'auto',
             clear: bool = False,
             verbose: bool = True,
+            cache: StageCache | None = None,
             **kwargs,
     ) -> None:
         """Detect events by applying a specific event detection method.
@@ -469,6 +2145,12 @@ class Dataset:
              merged into the existing one.
         verbose : bool
             If ``True``, show progress bar.
+        cache : StageCache, optional
+            If specified, the detected events of each file are looked up in this cache before they
+            are detected. The cache is keyed by the event detection method, its keyword arguments
+            and the selected gaze columns. The gaze columns are described by the state of the
+            loaded gaze file and the processing steps applied since loading. Gaze dataframes which
+            have been modified otherwise are described by their data, which is slower.
         **kwargs :
             Additional keyword arguments to be passed to the event detection method.
 
@@ -507,25 +2189,44 @@ class Dataset:
                 f', available columns: {self.gaze[0].columns}',
             )
 
-        disable_progressbar = not verbose
-
         event_dfs: list[EventDataFrame] = []
 
-        for gaze_df, fileinfo in tqdm(
-                zip(self.gaze, self.fileinfo.to_dicts()), disable=disable_progressbar,
-        ):
+        selected_columns = [*position_columns, *velocity_columns, 'time']
+        if self._unified:
+            selected_columns.append(self._file_id_column)
+        gaze_frames = [gaze_df.frame.select(selected_columns) for gaze_df in self.gaze]
 
-            positions = gaze_df.frame.select(position_columns).to_numpy()
-            velocities = gaze_df.frame.select(velocity_columns).to_numpy()
-            timesteps = gaze_df.frame.select('time').to_numpy()
+        for file_id, (fileinfo, gaze_frame) in enumerate(
+                self._split_files(gaze_frames, verbose=verbose),
+        ):
+            measurement_id = self._start_measurement()
+            if isinstance(gaze_frame, pl.LazyFrame):
+                gaze_frame = gaze_frame.collect()
+
+            gaze_fingerprint = None
+            if cache is not None:
+                gaze_index = 0 if self._unified else file_id
+                gaze_fingerprint = self._get_gaze_fingerprint(self.gaze[gaze_index])
+            if gaze_fingerprint is not None:
+                gaze_fingerprint = StageCache.make_key(
+                    'select_gaze', None, source=gaze_fingerprint, columns=selected_columns,
+                    file_id=file_id if self._unified else None,
+                )
 
-            event_df = method(
-                positions=positions, velocities=velocities, timesteps=timesteps, **kwargs,
+            event_df = self._detect_file_events(
+                method, gaze_frame, position_columns, velocity_columns, cache=cache,
+                gaze_fingerprint=gaze_fingerprint, **kwargs,
+            )
+            self._record_measurement(
+                'detect_events', measurement_id, fileinfo.get('filepath'), frame=gaze_frame,
             )
 
             event_df.frame = self._add_fileinfo(event_df.frame, fileinfo)
             event_dfs.append(event_df)
 
+        if self._unified:
+            event_dfs = [EventDataFrame(self._concat_files([df.frame for df in event_dfs]))]
+
         if not self.events or clear:
             self.events = event_dfs
             return
@@ -536,6 +2237,48 @@ class Dataset:
                 how='diagonal',
             )
 
+    @staticmethod
+    def _detect_file_events(
+            method: EventDetectionCallable,
+            gaze_frame: pl.DataFrame,
+            position_columns: list[str],
+            velocity_columns: list[str],
+            cache: StageCache | None = None,
+            gaze_fingerprint: str | None = None,
+            **kwargs: Any,
+    ) -> EventDataFrame:
+        """Detect events in the gaze dataframe of a single file.
+
+        If a fingerprint of the gaze dataframe is specified, it is used as cache key instead of the
+        data.
+        """
+        def detect() -> EventDataFrame:
+            return method(
+                positions=gaze_frame.select(position_columns).to_numpy(),
+                velocities=gaze_frame.select(velocity_columns).to_numpy(),
+                timesteps=gaze_frame.select('time').to_numpy(),
+                **kwargs,
+            )
+
+        if cache is None:
+            return detect()
+
+        if gaze_fingerprint is None:
+            return EventDataFrame(
+                cache.get_or_compute(
+                    'detect_events', gaze_frame, lambda: detect().frame,
+                    method=method, kwargs=kwargs,
+                ),
+            )
+
+        return EventDataFrame(
+            cache.get_or_compute(
+                'detect_events', None, lambda: detect().frame,
+                method=method, kwargs=kwargs, source=gaze_fingerprint,
+            ),
+        )
+
+    @_processing_step
     def compute_event_properties(
             self,
             event_properties: str | list[str],
@@ -559,16 +2302,228 @@ class Dataset:
         processor = EventGazeProcessor(event_properties)
 
         identifier_columns = [column for column in self.fileinfo.columns if column != 'filepath']
+        if self._unified:
+            identifier_columns.append(self._file_id_column)
 
         disable_progressbar = not verbose
-        for events, gaze in tqdm(zip(self.events, self.gaze), disable=disable_progressbar):
+        for gaze_index, (events, gaze) in enumerate(
+                tqdm(zip(self.events, self.gaze), disable=disable_progressbar),
+        ):
+            measurement_id = self._start_measurement()
             new_properties = processor.process(events, gaze, identifiers=identifier_columns)
+            self._record_measurement(
+                'compute_event_properties', measurement_id, self._get_gaze_filepath(gaze_index),
+                frame=gaze.frame,
+            )
+
+            if self._unified:
+                # All files are processed in a single pass. Join the properties back onto the
+                # events, as the processed rows are not ordered like the events.
+                events.frame = events.frame.join(
+                    new_properties, on=[*identifier_columns, 'name', 'onset', 'offset'], how='left',
+                )
+                continue
 
             new_properties = new_properties.drop(identifier_columns)
             new_properties = new_properties.drop(['name', 'onset', 'offset'])
 
             events.add_event_properties(new_properties)
 
+    @contextmanager
+    def profile(self) -> Iterator[Profiler]:
+        """Record wall time, throughput and peak memory of all processing stages within the context.
+
+        A measurement is recorded for each file and each of the stages ``load_gaze``,
+        ``load_events``, ``pix2deg``, ``pos2vel``, ``detect_events``, ``compute_event_properties``,
+        ``save_events``, ``save_preprocessed`` and ``save_partitioned``. Measurements of lazy gaze
+        dataframes only cover building the query plan. In unified mode, processing stages are
+        measured once for all files. The peak memory of each measurement is recorded as described
+        in :py:class:`~pymovements.utils.profiling.Profiler`. Files which are loaded or saved
+        concurrently share their peak memory.
+
+        Yields
+        ------
+        Profiler
+            Profiler holding the measurements. Use
+            :py:meth:`~pymovements.utils.profiling.Profiler.to_frame` to export them as a
+            :py:class:`polars.DataFrame`.
+        """
+        profiler = Profiler()
+        self._profiler = profiler
+        try:
+            yield profiler
+        finally:
+            self._profiler = None
+
+    def _start_measurement(self) -> int | None:
+        """Start a measurement if the dataset is profiled.
+
+        Returns
+        -------
+        int | None
+            Id of the started measurement or None if the dataset is not profiled.
+        """
+        if self._profiler is None:
+            return None
+        return self._profiler.start()
+
+    def _record_measurement(
+            self,
+            stage: str,
+            measurement_id: int | None,
+            filepath: str | Path | None = None,
+            frame: pl.DataFrame | pl.LazyFrame | None = None,
+            **values: Any,
+    ) -> None:
+        """Record a measurement started with :py:meth:`_start_measurement`.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the processing stage.
+        measurement_id : int | None
+            Id of the measurement as returned by :py:meth:`_start_measurement`. Nothing is recorded
+            if it is None.
+        filepath : str | Path, optional
+            File the measurement refers to.
+        frame : pl.DataFrame | pl.LazyFrame, optional
+            Processed gaze dataframe. Its height is recorded as number of samples.
+        **values
+            Additional values passed to :py:meth:`~pymovements.utils.profiling.Profiler.record`.
+        """
+        if self._profiler is None or measurement_id is None:
+            return
+
+        if isinstance(frame, pl.DataFrame):
+            values['num_samples'] = frame.height
+        self._profiler.stop(measurement_id, stage, filepath=filepath, **values)
+
+    def _get_gaze_filepath(self, gaze_index: int) -> str | None:
+        """Get the raw filepath of a gaze dataframe, or None if it does not hold a single file."""
+        if self._unified or gaze_index >= len(self.fileinfo):
+            return None
+        return self.fileinfo['filepath'][gaze_index]
+
+    def _fingerprint_gaze_files(
+            self,
+            preprocessed: bool = False,
+            preprocessed_dirname: str | None = None,
+            extension: str = 'feather',
+            predicate: pl.Expr | None = None,
+            columns: list[str] | None = None,
+    ) -> None:
+        """Fingerprint the gaze dataframes which have just been loaded from the fileinfo rows.
+
+        A fingerprint describes a file by its fileinfo row, its modification time and its size,
+        together with the settings the file has been loaded with. It is computed instead of hashing
+        the loaded data when looking up cached results of processing steps.
+        """
+        settings = {
+            'preprocessed': preprocessed,
+            'extension': extension,
+            'predicate': None if predicate is None else str(predicate),
+            'columns': columns,
+            'custom_read_kwargs': self._custom_read_kwargs,
+            'float_dtype': self._float_dtype,
+        }
+
+        for fileinfo_row, gaze_df in zip(self.fileinfo.to_dicts(), self.gaze):
+            filepath = self.raw_rootpath / fileinfo_row['filepath']
+            if preprocessed:
+                filepath = self._raw_to_preprocessed_filepath(
+                    filepath, preprocessed_dirname=preprocessed_dirname, extension=extension,
+                )
+            file_stat = os.stat(filepath)
+
+            fingerprint = StageCache.make_key(
+                'load_gaze', None, fileinfo=fileinfo_row,
+                file_state=[file_stat.st_mtime_ns, file_stat.st_size], **settings,
+            )
+            self._set_gaze_fingerprint(gaze_df, fingerprint)
+
+    def _get_gaze_fingerprint(self, gaze_df: GazeDataFrame) -> str | None:
+        """Get the fingerprint of a gaze dataframe.
+
+        Returns None if the gaze dataframe has not been fingerprinted or if its frame has been
+        replaced since.
+        """
+        frame_ref, fingerprint = self._gaze_fingerprints.get(gaze_df, (None, None))
+        if frame_ref is None or frame_ref() is not gaze_df.frame:
+            return None
+        return fingerprint
+
+    def _set_gaze_fingerprint(self, gaze_df: GazeDataFrame, fingerprint: str | None) -> None:
+        """Set the fingerprint of a gaze dataframe for its current frame."""
+        if fingerprint is None:
+            self._gaze_fingerprints.pop(gaze_df, None)
+        else:
+            self._gaze_fingerprints[gaze_df] = (weakref.ref(gaze_df.frame), fingerprint)
+
+    def _apply_gaze_step(
+            self,
+            gaze_df: GazeDataFrame,
+            name: str,
+            apply: Callable[[], None],
+            get_output_columns: Callable[[GazeDataFrame], list[str]],
+            cache: StageCache | None = None,
+            **parameters: Any,
+    ) -> None:
+        """Apply a processing step to a gaze dataframe and update its fingerprint.
+
+        If a cache is specified, the output columns of the step are looked up by the fingerprint
+        of the gaze dataframe and the parameters of the step. Lazy gaze dataframes and gaze
+        dataframes without a valid fingerprint are processed without cache.
+        """
+        fingerprint = self._get_gaze_fingerprint(gaze_df)
+        if fingerprint is None:
+            apply()
+            return
+
+        if cache is None or gaze_df.is_lazy:
+            apply()
+        else:
+            def compute() -> pl.DataFrame:
+                apply()
+                assert isinstance(gaze_df.frame, pl.DataFrame)
+                output_columns = set(get_output_columns(gaze_df))
+                return gaze_df.frame.select(
+                    [column for column in gaze_df.frame.columns if column in output_columns],
+                )
+
+            input_frame = gaze_df.frame
+            result = cache.get_or_compute(name, None, compute, source=fingerprint, **parameters)
+            # The frame has only been left untouched if the result has been read from the cache.
+            if gaze_df.frame is input_frame:
+                gaze_df.frame = gaze_df.frame.with_columns(result.get_columns())
+
+        self._set_gaze_fingerprint(
+            gaze_df, StageCache.make_key(name, None, source=fingerprint, **parameters),
+        )
+
+    def collect(self, verbose: bool = True) -> None:
+        """Execute the deferred query plans of all lazy gaze dataframes.
+
+        This only has an effect if the gaze files have been loaded with ``lazy=True``.
+
+        Parameters
+        ----------
+        verbose : bool
+            If ``True``, show progress bar.
+
+        Raises
+        ------
+        AttributeError
+            If `gaze` is None or there are no gaze dataframes present in the `gaze` attribute.
+        """
+        self._check_gaze_dataframe()
+
+        disable_progressbar = not verbose
+        for gaze_df in tqdm(self.gaze, disable=disable_progressbar):
+            # Collecting does not change the data, so the fingerprint stays valid.
+            fingerprint = self._get_gaze_fingerprint(gaze_df)
+            gaze_df.collect()
+            self._set_gaze_fingerprint(gaze_df, fingerprint)
+
     def clear_events(self) -> None:
         """Clear event DataFrame."""
         if len(self.events) == 0:
@@ -583,10 +2538,13 @@ class Dataset:
             preprocessed_dirname: str | None = None,
             verbose: int = 1,
             extension: str = 'feather',
+            compression: str | None = None,
+            row_group_size: int | None = None,
+            num_workers: int = 1,
     ):
         """Save preprocessed gaze and event files.
 
-        Data will be saved as feather/csv files to ``Dataset.preprocessed_roothpath`` or
+        Data will be saved as feather/csv/parquet files to ``Dataset.preprocessed_roothpath`` or
         ``Dataset.events_roothpath`` with the same directory structure as the raw data.
 
         Parameters
@@ -600,17 +2558,49 @@ class Dataset:
             This argument is used only for this single call and does not alter
             :py:meth:`pymovements.Dataset.preprocessed_rootpath`.
         verbose : int
-            Verbosity level (0: no print output, 1: show progress bar, 2: print saved filepaths)
+            Verbosity level (0: no print output, 1: show progress bar, 2: print saved filepaths
+            and write throughput)
         extension:
             extension specifies the fileformat to store the data
+        compression : str, optional
+            Compression codec for feather and parquet files. See :py:meth:`save_preprocessed` for
+            details.
+        row_group_size : int, optional
+            Number of rows per row group in parquet files.
+        num_workers : int
+            Number of worker threads used for writing files concurrently. Default: 1
+
+        Raises
+        ------
+        ValueError
+            If extension is not in list of valid extensions or `num_workers` is smaller than one.
         """
-        self.save_events(events_dirname, verbose=verbose, extension=extension)
-        self.save_preprocessed(preprocessed_dirname, verbose=verbose, extension=extension)
+        save_events = partial(
+            self.save_events, events_dirname, verbose=verbose, extension=extension,
+            compression=compression, row_group_size=row_group_size, num_workers=num_workers,
+        )
+        save_preprocessed = partial(
+            self.save_preprocessed, preprocessed_dirname, verbose=verbose, extension=extension,
+            compression=compression, row_group_size=row_group_size, num_workers=num_workers,
+        )
+
+        if self._is_deferred:
+            # Both outputs are written while each window of files is resident.
+            self._reload_stale_events(events_dirname, extension)
+            self._reload_stale_preprocessed(preprocessed_dirname, extension)
+            self._save_out_of_core([save_events, save_preprocessed], verbose=verbose)
+            return
+
+        save_events()
+        save_preprocessed()
 
     def save_events(
         self, events_dirname: str | None = None,
         verbose: int = 1,
         extension: str = 'feather',
+        compression: str | None = None,
+        row_group_size: int | None = None,
+        num_workers: int = 1,
     ):
         """Save events to files.
 
@@ -624,55 +2614,75 @@ class Dataset:
             This argument is used only for this single call and does not alter
             :py:meth:`pymovements.Dataset.events_rootpath`.
         verbose : int
-            Verbosity level (0: no print output, 1: show progress bar, 2: print saved filepaths)
+            Verbosity level (0: no print output, 1: show progress bar, 2: print saved filepaths
+            and write throughput)
         extension:
-            Specifies the file format for loading data. Valid options are: `csv`, `feather`.
+            Specifies the file format for loading data. Valid options are: `csv`, `feather`,
+            `parquet`.
             :Default: `feather`.
+        compression : str, optional
+            Compression codec for feather and parquet files. See :py:meth:`save_preprocessed` for
+            details.
+        row_group_size : int, optional
+            Number of rows per row group in parquet files.
+        num_workers : int
+            Number of worker threads used for writing files concurrently. Default: 1
 
         Raises
         ------
         ValueError
-            If extension is not in list of valid extensions.
+            If extension is not in list of valid extensions or `num_workers` is smaller than one.
         """
-        disable_progressbar = not verbose
+        self._reload_stale_events(events_dirname, extension)
+        if self._is_deferred:
+            self._save_out_of_core(
+                [
+                    partial(
+                        self.save_events, events_dirname, verbose=verbose, extension=extension,
+                        compression=compression, row_group_size=row_group_size,
+                        num_workers=num_workers,
+                    ),
+                ],
+                verbose=verbose,
+            )
+            return
 
-        for file_id, event_df in enumerate(tqdm(self.events, disable=disable_progressbar)):
-            raw_filepath = self.raw_rootpath / Path(self.fileinfo[file_id, 'filepath'])
+        write_jobs = []
+        event_frames = [df.frame for df in self.events]
+        for fileinfo, event_df in self._split_files(event_frames, verbose=False):
+            raw_filepath = self.raw_rootpath / Path(fileinfo['filepath'])
             events_filepath = self._raw_to_event_filepath(
                 raw_filepath, events_dirname=events_dirname,
                 extension=extension,
             )
 
-            event_df_out = event_df.frame.clone()
-            for column in event_df_out.columns:
-                if column in self.fileinfo.columns:
-                    event_df_out = event_df_out.drop(column)
-
-            if verbose >= 2:
-                print('Save file to', events_filepath)
+            write_jobs.append((self._drop_fileinfo_columns(event_df), events_filepath))
 
-            events_filepath.parent.mkdir(parents=True, exist_ok=True)
-            if extension == 'feather':
-                event_df_out.write_ipc(events_filepath)
-            elif extension == 'csv':
-                event_df_out.write_csv(events_filepath)
-            else:
-                valid_extensions = ['csv', 'feather']
-                raise ValueError(
-                    f'unsupported file format "{extension}".'
-                    f'Supported formats are: {valid_extensions}',
-                )
+        self._write_files(
+            write_jobs, extension=extension, compression=compression,
+            row_group_size=row_group_size, num_workers=num_workers, verbose=verbose,
+            on_file_written=self._get_manifest_recorder(
+                'events', [filepath for _, filepath in write_jobs],
+            ),
+            stage='save_events',
+        )
 
     def save_preprocessed(
         self, preprocessed_dirname: str | None = None,
         verbose: int = 1,
         extension: str = 'feather',
+        compression: str | None = None,
+        row_group_size: int | None = None,
+        num_workers: int = 1,
     ):
         """Save preprocessed gaze files.
 
         Data will be saved as feather files to ``Dataset.preprocessed_roothpath`` with the same
         directory structure as the raw data.
 
+        Parquet files are written with min/max statistics for each row group. Loading them with a
+        ``predicate`` (e.g. on ``time``) will then skip all row groups that cannot match.
+
         Parameters
         ----------
         preprocessed_dirname : str
@@ -680,44 +2690,593 @@ class Dataset:
             This argument is used only for this single call and does not alter
             :py:meth:`pymovements.Dataset.preprocessed_rootpath`.
         verbose : int
-            Verbosity level (0: no print output, 1: show progress bar, 2: print saved filepaths)
+            Verbosity level (0: no print output, 1: show progress bar, 2: print saved filepaths
+            and write throughput)
         extension:
-            Specifies the file format for loading data. Valid options are: `csv`, `feather`.
+            Specifies the file format for loading data. Valid options are: `csv`, `feather`,
+            `parquet`.
             :Default: `feather`.
+        compression : str, optional
+            Compression codec. Valid options for feather files are `uncompressed`, `lz4` and
+            `zstd` (default: `uncompressed`). Valid options for parquet files are `uncompressed`,
+            `snappy`, `gzip`, `lzo`, `brotli`, `lz4` and `zstd` (default: `zstd`). Ignored for csv
+            files.
+        row_group_size : int, optional
+            Number of rows per row group in parquet files. Smaller row groups allow for a more
+            fine-grained skipping of data on load. Ignored for other file formats.
+        num_workers : int
+            Number of worker threads used for writing files concurrently. Default: 1
 
         Raises
         ------
         ValueError
-            If extension is not in list of valid extensions.
+            If extension is not in list of valid extensions or `num_workers` is smaller than one.
         """
-        disable_progressbar = not verbose
+        self._reload_stale_preprocessed(preprocessed_dirname, extension)
+        if self._is_deferred:
+            self._save_out_of_core(
+                [
+                    partial(
+                        self.save_preprocessed, preprocessed_dirname, verbose=verbose,
+                        extension=extension, compression=compression,
+                        row_group_size=row_group_size, num_workers=num_workers,
+                    ),
+                ],
+                verbose=verbose,
+            )
+            return
 
-        for file_id, gaze_df in enumerate(tqdm(self.gaze, disable=disable_progressbar)):
-            raw_filepath = self.raw_rootpath / Path(self.fileinfo[file_id, 'filepath'])
+        write_jobs: list[tuple[pl.DataFrame | pl.LazyFrame, Path]] = []
+        for fileinfo, gaze_df in self._split_files([df.frame for df in self.gaze], verbose=False):
+            raw_filepath = self.raw_rootpath / Path(fileinfo['filepath'])
             preprocessed_filepath = self._raw_to_preprocessed_filepath(
                 raw_filepath, preprocessed_dirname=preprocessed_dirname,
                 extension=extension,
             )
 
-            gaze_df_out = gaze_df.frame.clone()
-            for column in gaze_df.columns:
-                if column in self.fileinfo.columns:
-                    gaze_df_out = gaze_df_out.drop(column)
+            # The lazy query is collected by the writer threads.
+            gaze_df = self._cast_float_columns(self._drop_fileinfo_columns(gaze_df).lazy())
+            write_jobs.append((gaze_df, preprocessed_filepath))
+
+        self._write_files(
+            write_jobs, extension=extension, compression=compression,
+            row_group_size=row_group_size, num_workers=num_workers, verbose=verbose,
+            on_file_written=self._get_manifest_recorder(
+                'preprocessed', [filepath for _, filepath in write_jobs],
+            ),
+            stage='save_preprocessed',
+        )
 
-            if verbose >= 2:
-                print('Save file to', preprocessed_filepath)
+    def save_partitioned(
+            self,
+            preprocessed_dirname: str | None = None,
+            partition_by: str | list[str] | None = None,
+            verbose: int = 1,
+            extension: str = 'feather',
+            compression: str | None = None,
+            row_group_size: int | None = None,
+            num_workers: int = 1,
+    ) -> None:
+        """Save preprocessed gaze files as a single hive-partitioned dataset store.
+
+        Instead of mirroring the raw directory structure, each gaze file is written to a directory
+        encoding its fileinfo values, e.g. ``subject_id=12/session_id=3/``. The store can be loaded
+        as one concatenated frame with :py:meth:`load_partitioned`, which only reads the partition
+        directories matching the requested subset.
+
+        Parameters
+        ----------
+        preprocessed_dirname : str
+            One-time usage of an alternative directory name to save data relative to dataset path.
+            This argument is used only for this single call and does not alter
+            :py:meth:`pymovements.Dataset.preprocessed_rootpath`.
+        partition_by : str, list[str], optional
+            Fileinfo columns to partition by, in the order of the directory hierarchy. If None, all
+            fileinfo columns are used in their order of appearance.
+        verbose : int
+            Verbosity level (0: no print output, 1: show progress bar, 2: print saved filepaths
+            and write throughput)
+        extension:
+            Specifies the file format for saving data. Valid options are: `csv`, `feather`,
+            `parquet`.
+            :Default: `feather`.
+        compression : str, optional
+            Compression codec for feather and parquet files. See :py:meth:`save_preprocessed` for
+            details.
+        row_group_size : int, optional
+            Number of rows per row group in parquet files.
+        num_workers : int
+            Number of worker threads used for writing files concurrently. Default: 1
+
+        Raises
+        ------
+        ValueError
+            If there are no columns to partition by, a partition column is not in the fileinfo
+            dataframe, the extension is not in list of valid extensions or `num_workers` is
+            smaller than one.
+        """
+        self._check_gaze_dataframe()
+
+        fileinfo_columns = [column for column in self.fileinfo.columns if column != 'filepath']
+
+        if partition_by is None:
+            partition_by = fileinfo_columns
+        elif isinstance(partition_by, str):
+            partition_by = [partition_by]
+
+        if not partition_by:
+            raise ValueError(
+                'there are no columns to partition by. Please specify named groups in'
+                ' filename_regex or pass partition_by explicitly.',
+            )
+        for partition_column in partition_by:
+            if partition_column not in fileinfo_columns:
+                raise ValueError(
+                    f'partition column {partition_column} must be a column in the fileinfo'
+                    f' attribute. Available columns are: {fileinfo_columns}',
+                )
+
+        if preprocessed_dirname is None:
+            partitioned_rootpath = self.preprocessed_rootpath
+        else:
+            partitioned_rootpath = self.path / preprocessed_dirname
+
+        # The partitioned store is always written as a whole.
+        self._reload_skipped_files(lambda filepath: True)
+        if self._is_deferred:
+            self._save_out_of_core(
+                [
+                    partial(
+                        self.save_partitioned, preprocessed_dirname, partition_by=partition_by,
+                        verbose=verbose, extension=extension, compression=compression,
+                        row_group_size=row_group_size, num_workers=num_workers,
+                    ),
+                ],
+                verbose=verbose,
+            )
+            return
+
+        write_jobs: list[tuple[pl.DataFrame | pl.LazyFrame, Path]] = []
+        for fileinfo, gaze_df in self._split_files([df.frame for df in self.gaze], verbose=False):
+            partition_dirpath = partitioned_rootpath.joinpath(*[
+                f'{partition_column}={quote(str(fileinfo[partition_column]), safe="")}'
+                for partition_column in partition_by
+            ])
+            filepath = partition_dirpath / f'{Path(fileinfo["filepath"]).stem}.{extension}'
+
+            # The lazy query is collected by the writer threads.
+            gaze_df = self._cast_float_columns(self._drop_fileinfo_columns(gaze_df).lazy())
+            write_jobs.append((gaze_df, filepath))
+
+        self._write_files(
+            write_jobs, extension=extension, compression=compression,
+            row_group_size=row_group_size, num_workers=num_workers, verbose=verbose,
+            stage='save_partitioned',
+        )
+
+    def load_partitioned(
+            self,
+            subset: None | dict[str, float | int | str | list[float | int | str]] = None,
+            preprocessed_dirname: str | None = None,
+            extension: str = 'feather',
+            lazy: bool = False,
+            predicate: pl.Expr | None = None,
+            memory_map: bool = True,
+    ) -> GazeDataFrame:
+        """Load a hive-partitioned dataset store as one concatenated gaze dataframe.
+
+        The store must have been written by :py:meth:`save_partitioned`. Partition values are added
+        as columns and cast according to ``filename_regex_dtypes``. Partition directories not
+        matching the subset are pruned without listing their contents.
+
+        Parameters
+        ----------
+        subset : dict, optional
+            If specified, load only a subset of the dataset. All keys in the dictionary must be
+            partition columns. Values can be either float, int , str or a list of these.
+        preprocessed_dirname : str
+            One-time usage of an alternative directory name to load data relative to
+            :py:meth:`pymovements.Dataset.path`.
+            This argument is used only for this single call and does not alter
+            :py:meth:`pymovements.Dataset.preprocessed_rootpath`.
+        extension:
+            Specifies the file format for loading data. Valid options are: `csv`, `feather`,
+            `parquet`.
+            :Default: `feather`.
+        lazy : bool
+            If ``True``, the returned gaze dataframe holds a :py:class:`polars.LazyFrame`.
+        predicate : pl.Expr, optional
+            If specified, only gaze samples matching this expression are loaded. The predicate can
+            also refer to partition columns.
+        memory_map : bool
+            If ``True``, uncompressed feather files are memory-mapped instead of being read into
+            memory. Default: True
+
+        Returns
+        -------
+        GazeDataFrame
+            Single gaze dataframe holding all matching files.
+
+        Raises
+        ------
+        ValueError
+            If extension is not in list of valid extensions or a subset key is not a partition
+            column.
+        RuntimeError
+            If no matching files have been found.
+        """
+        if extension not in self._valid_extensions:
+            raise ValueError(
+                f'unsupported file format "{extension}".'
+                f'Supported formats are: {self._valid_extensions}',
+            )
+
+        subset_values: dict[str, set[str]] = {}
+        if subset is not None:
+            subset_values = {
+                subset_key: {str(value) for value in column_values}
+                for subset_key, column_values in self._normalize_subset(subset).items()
+            }
+
+        if preprocessed_dirname is None:
+            partitioned_rootpath = self.preprocessed_rootpath
+        else:
+            partitioned_rootpath = self.path / preprocessed_dirname
+
+        partition_files = self._match_partition_files(
+            partitioned_rootpath, extension=extension, subset_values=subset_values,
+        )
+        if not partition_files:
+            raise RuntimeError(f'no matching files found in {partitioned_rootpath}')
+
+        partition_columns = set(partition_files[0][1].keys())
+        for subset_key in subset_values:
+            if subset_key not in partition_columns:
+                raise ValueError(
+                    f'subset key {subset_key} must be a partition column.'
+                    f' Available partition columns are: {sorted(partition_columns)}',
+                )
+
+        lazy_dfs = []
+        for filepath, partition_values in partition_files:
+            if extension == 'csv':
+                lazy_df = pl.scan_csv(filepath)
+            elif extension == 'feather':
+                lazy_df = pl.scan_ipc(filepath, memory_map=memory_map)
+            else:
+                lazy_df = pl.scan_parquet(filepath)
+
+            lazy_df = lazy_df.select(
+                [
+                    pl.lit(value).alias(partition_column)
+                    for partition_column, value in partition_values.items()
+                ] + [pl.all()],
+            )
+            lazy_dfs.append(lazy_df)
+
+        gaze_df = pl.concat(lazy_dfs, how='vertical')
+        gaze_df = gaze_df.with_columns([
+            pl.col(fileinfo_key).cast(fileinfo_dtype)
+            for fileinfo_key, fileinfo_dtype in self._filename_regex_dtypes.items()
+            if fileinfo_key in partition_columns
+        ])
+
+        if predicate is not None:
+            gaze_df = gaze_df.filter(predicate)
+        gaze_df = self._cast_float_columns(gaze_df)
+        if not lazy:
+            return GazeDataFrame(gaze_df.collect(), experiment=self.experiment)
+
+        return GazeDataFrame(gaze_df, experiment=self.experiment)
+
+    @staticmethod
+    def _match_partition_files(
+            path: Path,
+            extension: str,
+            subset_values: dict[str, set[str]],
+            partition_values: dict[str, str] | None = None,
+    ) -> list[tuple[Path, dict[str, str]]]:
+        """Find all files in a hive-partitioned directory tree.
 
-            preprocessed_filepath.parent.mkdir(parents=True, exist_ok=True)
+        Parameters
+        ----------
+        path : Path
+            Root path of the partitioned store.
+        extension : str
+            Extension of the data files.
+        subset_values : dict[str, set[str]]
+            Allowed partition values for each partition column. Directories with other values are
+            not traversed.
+        partition_values : dict[str, str], optional
+            Partition values of the parent directories. Files are only matched inside of partition
+            directories.
+
+        Returns
+        -------
+        list[tuple[Path, dict[str, str]]]
+            Sorted list of filepaths and their partition values.
+        """
+        if partition_values is None:
+            partition_values = {}
+            if not path.is_dir():
+                return []
+
+        partition_files = []
+        with os.scandir(path) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                if entry.is_dir():
+                    partition_column, separator, value = entry.name.partition('=')
+                    if not separator:
+                        continue
+
+                    value = unquote(value)
+                    if (
+                        partition_column in subset_values
+                        and value not in subset_values[partition_column]
+                    ):
+                        continue
+
+                    partition_files.extend(
+                        Dataset._match_partition_files(
+                            Path(entry.path),
+                            extension=extension,
+                            subset_values=subset_values,
+                            partition_values={**partition_values, partition_column: value},
+                        ),
+                    )
+                elif partition_values and entry.name.endswith(f'.{extension}'):
+                    partition_files.append((Path(entry.path), partition_values))
+        return partition_files
+
+    @classmethod
+    def _write_file(
+            cls,
+            df: pl.DataFrame,
+            filepath: Path,
+            extension: str,
+            compression: str | None = None,
+            row_group_size: int | None = None,
+    ) -> None:
+        """Write dataframe to file in the specified format.
+
+        The dataframe is first written to a temporary file in the destination directory, which is
+        then atomically renamed to ``filepath``. An interrupted write therefore never leaves a
+        truncated file behind.
+
+        Parameters
+        ----------
+        df : pl.DataFrame
+            Dataframe to write.
+        filepath : Path
+            Destination filepath.
+        extension : str
+            File format. Valid options are: `csv`, `feather`, `parquet`.
+        compression : str, optional
+            Compression codec for feather and parquet files.
+        row_group_size : int, optional
+            Number of rows per row group in parquet files.
+
+        Raises
+        ------
+        ValueError
+            If extension is not in list of valid extensions.
+        """
+        if extension not in cls._valid_extensions:
+            raise ValueError(
+                f'unsupported file format "{extension}".'
+                f'Supported formats are: {cls._valid_extensions}',
+            )
+
+        temp_filepath = create_temporary_file(filepath.parent, prefix=f'.{filepath.name}.')
+
+        try:
             if extension == 'feather':
-                gaze_df_out.write_ipc(preprocessed_filepath)
+                if compression is None:
+                    compression = 'uncompressed'
+                df.write_ipc(temp_filepath, compression=compression)  # type: ignore[call-overload]
             elif extension == 'csv':
-                gaze_df_out.write_csv(preprocessed_filepath)
-            else:
-                valid_extensions = ['csv', 'feather']
-                raise ValueError(
-                    f'unsupported file format "{extension}".'
-                    f'Supported formats are: {valid_extensions}',
+                df.write_csv(temp_filepath)
+            elif extension == 'parquet':
+                if compression is None:
+                    compression = 'zstd'
+                # The pyarrow writer is used as it reliably writes min/max row group statistics.
+                df.write_parquet(
+                    temp_filepath,
+                    compression=compression,  # type: ignore[arg-type]
+                    statistics=True,
+                    row_group_size=row_group_size,
+                    use_pyarrow=True,
                 )
+            os.replace(temp_filepath, filepath)
+        finally:
+            # The temporary file only remains if writing or renaming failed.
+            if os.path.exists(temp_filepath):
+                os.remove(temp_filepath)
+
+    def _reload_stale_events(self, events_dirname: str | None, extension: str) -> None:
+        """Reload skipped files whose event file is missing or stale."""
+        self._reload_skipped_files(
+            lambda filepath: self._is_skipped_output_stale(
+                filepath, 'events', self._raw_to_event_filepath(
+                    self.raw_rootpath / filepath, events_dirname=events_dirname,
+                    extension=extension,
+                ),
+            ),
+        )
+
+    def _reload_stale_preprocessed(self, preprocessed_dirname: str | None, extension: str) -> None:
+        """Reload skipped files whose preprocessed gaze file is missing or stale."""
+        self._reload_skipped_files(
+            lambda filepath: self._is_skipped_output_stale(
+                filepath, 'preprocessed', self._raw_to_preprocessed_filepath(
+                    self.raw_rootpath / filepath, preprocessed_dirname=preprocessed_dirname,
+                    extension=extension,
+                ),
+            ),
+        )
+
+    @property
+    def _is_deferred(self) -> bool:
+        """Whether processing is deferred until saving in out-of-core mode."""
+        return self._memory_budget is not None and not self._is_window_resident
+
+    def _save_out_of_core(self, save_functions: list[_SaveFunction], verbose: int = 1) -> None:
+        """Process and save files in windows that fit into the memory budget.
+
+        Each window of files is loaded, the recorded processing steps are applied and the save
+        functions are called, before the window is released again.
+
+        Parameters
+        ----------
+        save_functions : list[_SaveFunction]
+            Save methods to call on each resident window. They are called with the verbosity as
+            only keyword argument.
+        verbose : int
+            Verbosity level (0: no print output, 1: show progress bar, 2: also print output of the
+            save functions)
+        """
+        assert self._memory_budget is not None
+        fileinfo = self.fileinfo
+        raw_file_sizes = [
+            os.stat(self.raw_rootpath / filepath).st_size for filepath in fileinfo['filepath']
+        ]
+
+        # The first window consists of a single file to measure the resident bytes per raw byte.
+        bytes_per_raw_byte: float | None = None
+
+        self._is_window_resident = True
+        try:
+            with tqdm(total=len(fileinfo), disable=not verbose) as progress_bar:
+                window_start = 0
+                while window_start < len(fileinfo):
+                    window_end = window_start + 1
+                    if bytes_per_raw_byte is not None:
+                        window_size = raw_file_sizes[window_start] * bytes_per_raw_byte
+                        while (
+                            window_end < len(fileinfo)
+                            and window_size + raw_file_sizes[window_end] * bytes_per_raw_byte
+                            <= self._memory_budget
+                        ):
+                            window_size += raw_file_sizes[window_end] * bytes_per_raw_byte
+                            window_end += 1
+
+                    self.fileinfo = fileinfo.slice(window_start, window_end - window_start)
+                    self.gaze = self.load_gaze_files(**self._gaze_load_kwargs)
+                    self._fingerprint_gaze_files(
+                        predicate=self._gaze_load_kwargs['predicate'],
+                        columns=self._gaze_load_kwargs['columns'],
+                    )
+                    self.events = []
+                    for method, kwargs in self._processing_steps:
+                        method(self, verbose=False, **kwargs)
+
+                    # Out-of-core loading is never lazy, so all gaze frames are eager.
+                    resident_size: float = sum(
+                        gaze_df.frame.estimated_size() for gaze_df in self.gaze
+                        if isinstance(gaze_df.frame, pl.DataFrame)
+                    )
+                    resident_size += sum(
+                        event_df.frame.estimated_size() for event_df in self.events
+                    )
+                    window_raw_size = max(sum(raw_file_sizes[window_start:window_end]), 1)
+                    bytes_per_raw_byte = max(
+                        bytes_per_raw_byte or 0.0, resident_size / window_raw_size,
+                    )
+
+                    for save_function in save_functions:
+                        save_function(verbose=verbose if verbose >= 2 else 0)
+
+                    self.gaze = []
+                    self.events = []
+                    progress_bar.update(window_end - window_start)
+                    window_start = window_end
+        finally:
+            self._is_window_resident = False
+            self.fileinfo = fileinfo
+            self.gaze = []
+            self.events = []
+
+    def _write_files(
+            self,
+            jobs: list[tuple[pl.DataFrame | pl.LazyFrame, Path]],
+            extension: str,
+            compression: str | None = None,
+            row_group_size: int | None = None,
+            num_workers: int = 1,
+            verbose: int = 1,
+            on_file_written: Callable[[int], None] | None = None,
+            stage: str = 'save',
+    ) -> None:
+        """Write dataframes to their filepaths, optionally using multiple worker threads.
+
+        Parameters
+        ----------
+        jobs : list[tuple[pl.DataFrame | pl.LazyFrame, Path]]
+            Pairs of dataframe and destination filepath.
+        extension : str
+            File format. Valid options are: `csv`, `feather`, `parquet`.
+        compression : str, optional
+            Compression codec for feather and parquet files.
+        row_group_size : int, optional
+            Number of rows per row group in parquet files.
+        num_workers : int
+            Number of worker threads used for writing files concurrently.
+        verbose : int
+            Verbosity level (0: no print output, 1: show progress bar, 2: print saved filepaths
+            and write throughput)
+        on_file_written : Callable[[int], None], optional
+            Called with the job index after each written file. Calls are serialized.
+        stage : str
+            Name of the processing stage recorded while profiling. Default: `save`
+
+        Raises
+        ------
+        ValueError
+            If extension is not in list of valid extensions or `num_workers` is smaller than one.
+        """
+        if extension not in self._valid_extensions:
+            raise ValueError(
+                f'unsupported file format "{extension}".'
+                f'Supported formats are: {self._valid_extensions}',
+            )
+
+        callback_lock = threading.Lock()
+
+        def write_file(job: tuple[int, tuple[pl.DataFrame | pl.LazyFrame, Path]]) -> int:
+            job_index, (df, filepath) = job
+            measurement_id = self._start_measurement()
+            if isinstance(df, pl.LazyFrame):
+                df = df.collect()
+
+            if verbose >= 2:
+                print('Save file to', filepath)
+
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            self._write_file(
+                df, filepath, extension=extension,
+                compression=compression, row_group_size=row_group_size,
+            )
+
+            if on_file_written is not None:
+                with callback_lock:
+                    on_file_written(job_index)
+
+            file_size = filepath.stat().st_size
+            self._record_measurement(stage, measurement_id, filepath, bytes_written=file_size)
+            return file_size
+
+        start_time = time.perf_counter()
+        file_sizes = self._map_parallel(
+            write_file, list(enumerate(jobs)), num_workers=num_workers, verbose=bool(verbose),
+        )
+        elapsed_time = time.perf_counter() - start_time
+
+        if verbose >= 2:
+            total_megabytes = sum(file_sizes) / 2**20
+            print(
+                f'Saved {len(file_sizes)} files ({total_megabytes:.1f} MiB) in '
+                f'{elapsed_time:.2f} s ({total_megabytes / max(elapsed_time, 1e-9):.1f} MiB/s)',
+            )
 
     @property
     def path(self) -> Path:
@@ -946,19 +3505,19 @@ class Dataset:
 
         return events_file_dirpath / events_filename
 
-    def _add_fileinfo(self, df: pl.DataFrame, fileinfo: dict[str, Any]) -> pl.DataFrame:
+    def _add_fileinfo(self, df: _FrameT, fileinfo: dict[str, Any]) -> _FrameT:
         """Add columns from fileinfo to dataframe.
 
         Parameters
         ----------
-        df : pl.DataFrame
+        df : pl.DataFrame | pl.LazyFrame
             Base dataframe to add fileinfo to.
         fileinfo : dict[str, Any]
             Dictionary of fileinfo row.
 
         Returns
         -------
-        pl.DataFrame:
+        pl.DataFrame | pl.LazyFrame:
             Dataframe with added columns from fileinfo dictionary keys.
         """
 
@@ -974,5 +3533,6 @@ class Dataset:
         df = df.with_columns([
             pl.col(fileinfo_key).cast(fileinfo_dtype)
             for fileinfo_key, fileinfo_dtype in self._filename_regex_dtypes.items()
+            if fileinfo_key in fileinfo
         ])
         return df
@@ -21,6 +21,9 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
+
+import polars as pl
 
 from pymovements.datasets.public_dataset import PublicDataset
 from pymovements.gaze.experiment import Experiment
@@ -99,9 +102,19 @@ class GazeBase(PublicDataset):
         'yT': 'y_target_pos',
     }
 
+    _column_dtypes = {
+        'n': pl.Int64,
+        'x': pl.Float64,
+        'y': pl.Float64,
+        'val': pl.Int64,
+        'xT': pl.Float64,
+        'yT': pl.Float64,
+    }
+
     _read_csv_kwargs = {
         'columns': list(_column_map.keys()),
         'new_columns': list(_column_map.values()),
+        'dtypes': _column_dtypes,
     }
 
     def __init__(
@@ -115,6 +128,7 @@ class GazeBase(PublicDataset):
             raw_dirname: str = 'raw',
             preprocessed_dirname: str = 'preprocessed',
             events_dirname: str = 'events',
+            custom_read_kwargs: dict[str, Any] | None = None,
     ):
         """Initialize the GazeBase dataset object.
 
@@ -157,7 +171,14 @@ class GazeBase(PublicDataset):
         events_dirname : str, optional
             Name of directory under dataset path that will be used to store event data. We advise
             the user to keep the event data separate from the original raw data. Default: `events`
+        custom_read_kwargs : dict[str, Any], optional
+            Additional keyword arguments passed to :py:func:`polars.read_csv` when reading raw data,
+            e.g. ``n_threads`` or ``low_memory``. These take precedence over the keyword arguments
+            of the dataset definition.
         """
+        if custom_read_kwargs is None:
+            custom_read_kwargs = {}
+
         super().__init__(
             root=root,
             download=download,
@@ -166,7 +187,7 @@ class GazeBase(PublicDataset):
             experiment=self._experiment,
             filename_regex=self._filename_regex,
             filename_regex_dtypes=self._filename_regex_dtypes,
-            custom_read_kwargs=self._read_csv_kwargs,
+            custom_read_kwargs={**self._read_csv_kwargs, **custom_read_kwargs},
             dataset_dirname=dataset_dirname,
             downloads_dirname=downloads_dirname,
             raw_dirname=raw_dirname,
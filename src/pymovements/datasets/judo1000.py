@@ -21,6 +21,9 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
+
+import polars as pl
 
 from pymovements.datasets.public_dataset import PublicDataset
 from pymovements.gaze.experiment import Experiment
@@ -91,10 +94,21 @@ class JuDo1000(PublicDataset):
         'y_right': 'y_right_pix',
     }
 
+    _column_dtypes = {
+        'trialId': pl.Int64,
+        'pointId': pl.Int64,
+        'time': pl.Int64,
+        'x_left': pl.Float64,
+        'y_left': pl.Float64,
+        'x_right': pl.Float64,
+        'y_right': pl.Float64,
+    }
+
     _read_csv_kwargs = {
-        'sep': '\t',
+        'separator': '\t',
         'columns': list(_column_map.keys()),
         'new_columns': list(_column_map.values()),
+        'dtypes': _column_dtypes,
     }
 
     def __init__(
@@ -108,6 +122,7 @@ class JuDo1000(PublicDataset):
             raw_dirname: str = 'raw',
             preprocessed_dirname: str = 'preprocessed',
             events_dirname: str = 'events',
+            custom_read_kwargs: dict[str, Any] | None = None,
     ):
         """Initialize the JuDo1000 dataset object.
 
@@ -150,7 +165,14 @@ class JuDo1000(PublicDataset):
         events_dirname : str, optional
             Name of directory under dataset path that will be used to store event data. We advise
             the user to keep the event data separate from the original raw data. Default: `events`
+        custom_read_kwargs : dict[str, Any], optional
+            Additional keyword arguments passed to :py:func:`polars.read_csv` when reading raw data,
+            e.g. ``n_threads`` or ``low_memory``. These take precedence over the keyword arguments
+            of the dataset definition.
         """
+        if custom_read_kwargs is None:
+            custom_read_kwargs = {}
+
         super().__init__(
             root=root,
             download=download,
@@ -159,7 +181,7 @@ class JuDo1000(PublicDataset):
             experiment=self._experiment,
             filename_regex=self._filename_regex,
             filename_regex_dtypes=self._filename_regex_dtypes,
-            custom_read_kwargs=self._read_csv_kwargs,
+            custom_read_kwargs={**self._read_csv_kwargs, **custom_read_kwargs},
             dataset_dirname=dataset_dirname,
             downloads_dirname=downloads_dirname,
             raw_dirname=raw_dirname,
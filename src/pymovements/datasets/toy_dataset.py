@@ -21,6 +21,9 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
+
+import polars as pl
 
 from pymovements.datasets.public_dataset import PublicDataset
 from pymovements.gaze.experiment import Experiment
@@ -85,10 +88,17 @@ class ToyDataset(PublicDataset):
         'y': 'y_right_pix',
     }
 
+    _column_dtypes = {
+        'timestamp': pl.Int64,
+        'x': pl.Float64,
+        'y': pl.Float64,
+    }
+
     _read_csv_kwargs = {
-        'sep': '\t',
+        'separator': '\t',
         'columns': list(_column_map.keys()),
         'new_columns': list(_column_map.values()),
+        'dtypes': _column_dtypes,
         'null_values': '-32768.00',
     }
 
@@ -103,6 +113,7 @@ class ToyDataset(PublicDataset):
             raw_dirname: str = 'raw',
             preprocessed_dirname: str = 'preprocessed',
             events_dirname: str = 'events',
+            custom_read_kwargs: dict[str, Any] | None = None,
     ):
         """Initialize the pymovements example toy dataset object.
 
@@ -145,7 +156,14 @@ class ToyDataset(PublicDataset):
         events_dirname : str, optional
             Name of directory under dataset path that will be used to store event data. We advise
             the user to keep the event data separate from the original raw data. Default: `events`
+        custom_read_kwargs : dict[str, Any], optional
+            Additional keyword arguments passed to :py:func:`polars.read_csv` when reading raw data,
+            e.g. ``n_threads`` or ``low_memory``. These take precedence over the keyword arguments
+            of the dataset definition.
         """
+        if custom_read_kwargs is None:
+            custom_read_kwargs = {}
+
         super().__init__(
             root=root,
             download=download,
@@ -154,7 +172,7 @@ class ToyDataset(PublicDataset):
             experiment=self._experiment,
             filename_regex=self._filename_regex,
             filename_regex_dtypes=self._filename_regex_dtypes,
-            custom_read_kwargs=self._read_csv_kwargs,
+            custom_read_kwargs={**self._read_csv_kwargs, **custom_read_kwargs},
             dataset_dirname=dataset_dirname,
             downloads_dirname=downloads_dirname,
             raw_dirname=raw_dirname,
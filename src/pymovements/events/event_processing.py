@@ -178,7 +178,7 @@ class EventGazeProcessor:
                 property_kwargs[property_name]['position_columns'] = position_columns
 
         result = (
-            gaze.frame.join(events.frame, on=identifiers)
+            gaze.frame.lazy().join(events.frame.lazy(), on=identifiers)
             .filter(pl.col('time').is_between(pl.col('onset'), pl.col('offset')))
             .groupby([*identifiers, 'name', 'onset', 'offset'])
             .agg(
@@ -189,4 +189,4 @@ class EventGazeProcessor:
                 ],
             )
         )
-        return result
+        return result.collect()
@@ -36,12 +36,24 @@
 
    pymovements.gaze.transforms.pix2deg
    pymovements.gaze.transforms.pos2vel
+   pymovements.gaze.transforms.pos2vel_batch
+   pymovements.gaze.transforms.savitzky_golay
+   pymovements.gaze.transforms.smooth_pos2vel
    pymovements.gaze.transforms.norm
    pymovements.gaze.transforms.split
    pymovements.gaze.transforms.downsample
    pymovements.gaze.transforms.consecutive
+
+.. rubric:: Polars Expression Transformations
+
+.. autosummary::
+   :toctree:
+
+   pymovements.gaze.transforms_pl.pix2deg
+   pymovements.gaze.transforms_pl.pos2vel
 """
 from pymovements.gaze import transforms  # noqa: F401
+from pymovements.gaze import transforms_pl  # noqa: F401
 from pymovements.gaze.experiment import Experiment
 from pymovements.gaze.gaze_dataframe import GazeDataFrame  # noqa: F401
 from pymovements.gaze.screen import Screen
@@ -52,4 +64,5 @@ __all__ = [
     'GazeDataFrame',
     'Screen',
     'transforms',
+    'transforms_pl',
 ]
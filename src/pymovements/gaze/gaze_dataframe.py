@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import polars as pl
 
+from pymovements.gaze import transforms_pl
 from pymovements.gaze.experiment import Experiment
 
 
@@ -30,6 +31,10 @@ class GazeDataFrame:
 
     Each row is a sample at a specific timestep.
     Each column is a channel in the gaze time series.
+
+    The underlying frame can either be an eager :py:class:`polars.DataFrame` or a
+    :py:class:`polars.LazyFrame`. In the lazy case, transformations like :py:meth:`pix2deg` and
+    :py:meth:`pos2vel` only extend the query plan, which is executed on :py:meth:`collect`.
     """
 
     _valid_pixel_position_columns = [
@@ -52,41 +57,59 @@ class GazeDataFrame:
 
     def __init__(
             self,
-            data: pl.DataFrame | None = None,
+            data: pl.DataFrame | pl.LazyFrame | None = None,
             experiment: Experiment | None = None,
+            copy: bool = True,
     ):
         """Initialize a :py:class:`pymovements.gaze.gaze_dataframe.GazeDataFrame`.
 
         Parameters
         ----------
-        data: pl.DataFrame
-            A dataframe to be transformed to a polars dataframe.
+        data: pl.DataFrame, pl.LazyFrame
+            A dataframe to be transformed to a polars dataframe. If a lazy frame is passed, all
+            transformations will be deferred until :py:meth:`collect` is called.
         experiment : Experiment
             The experiment definition.
+        copy : bool
+            If ``False``, the dataframe is not cloned. This avoids a copy if the dataframe is not
+            referenced anywhere else, e.g. directly after reading it from a file. Default: True
         """
         if data is None:
             data = pl.DataFrame()
 
-        self.frame = data.clone()
+        self.frame = data.clone() if copy else data
         self.experiment = experiment
 
-    def pix2deg(self) -> None:
+    def pix2deg(self, method: str = 'exact') -> None:
         """Compute gaze positions in degrees of visual angle from pixel position coordinates.
 
         This method requires a properly initialized :py:attr:`~.GazeDataFrame.experiment` attribute.
 
         After success, the gaze dataframe is extended by the resulting dva position columns.
 
+        Parameters
+        ----------
+        method : str
+            Conversion method. See :py:meth:`~pymovements.gaze.screen.Screen.pix2deg` for details.
+            Exact conversions run as polars expressions. Lazy gaze dataframes are always converted
+            exactly, as the lookup tables only pay off on materialized coordinates. Default: exact
+
         Raises
         ------
         AttributeError
             If `gaze` is None or there are no gaze dataframes present in the `gaze` attribute, or
             if experiment is None.
+        ValueError
+            If the method is not supported.
         """
         self._check_experiment()
         # mypy does not get that experiment now cannot be None anymore
         assert self.experiment is not None
 
+        valid_methods = ['exact', 'lookup', 'interpolate']
+        if method not in valid_methods:
+            raise ValueError(f'Method needs to be in {valid_methods} (is: {method})')
+
         pix_position_columns = self.pixel_position_columns
         if not pix_position_columns:
             raise AttributeError(
@@ -97,8 +120,16 @@ class GazeDataFrame:
 
         dva_position_columns = self._pixel_to_dva_position_columns(pix_position_columns)
 
+        if method == 'exact' or isinstance(self.frame, pl.LazyFrame):
+            # The conversion runs on the polars columns without copying them to numpy arrays.
+            self.frame = self.frame.with_columns([
+                self._pix2deg_expression(pix_column).alias(dva_column)
+                for pix_column, dva_column in zip(pix_position_columns, dva_position_columns)
+            ])
+            return
+
         pixel_positions = self.frame.select(pix_position_columns)
-        dva_positions = self.experiment.screen.pix2deg(pixel_positions.to_numpy())
+        dva_positions = self.experiment.screen.pix2deg(pixel_positions.to_numpy(), method=method)
 
         self.frame = self.frame.with_columns(
             [
@@ -107,7 +138,12 @@ class GazeDataFrame:
             ],
         )
 
-    def pos2vel(self, method: str = 'smooth', **kwargs) -> None:
+    def pos2vel(
+            self,
+            method: str = 'smooth',
+            over: str | list[str] | None = None,
+            **kwargs,
+    ) -> None:
         """Compute gaze velocites in dva/s from dva position coordinates.
 
         This method requires a properly initialized :py:attr:`~.GazeDataFrame.experiment` attribute.
@@ -118,6 +154,9 @@ class GazeDataFrame:
         ----------
         method : str
             Computation method. See :func:`~transforms.pos2vel()` for details, default: smooth.
+        over : str, list[str], optional
+            If specified, velocities are computed separately for each group of rows with equal
+            values in these columns, e.g. for each file of a dataset held in a single dataframe.
         **kwargs
             Additional keyword arguments to be passed to the :func:`~transforms.pos2vel()` method.
 
@@ -126,6 +165,9 @@ class GazeDataFrame:
         AttributeError
             If `gaze` is None or there are no gaze dataframes present in the `gaze` attribute, or
             if experiment is None.
+        ValueError
+            If the frame or one of its groups has fewer samples than required by the method. The
+            number of samples of lazy frames is not checked.
         """
         self._check_experiment()
         # mypy does not get that experiment now cannot be None anymore
@@ -139,17 +181,68 @@ class GazeDataFrame:
                 f' Available columns are: {self.frame.columns}.',
             )
         velocity_columns = self._position_to_velocity_columns(position_columns)
+        experiment = self.experiment
 
-        positions = self.frame.select(position_columns)
+        if isinstance(self.frame, pl.DataFrame) and over is None:
+            positions = self.frame.select(position_columns)
 
-        velocities = self.experiment.pos2vel(positions.to_numpy(), method=method, **kwargs)
+            velocities = experiment.pos2vel(positions.to_numpy(), method=method, **kwargs)
 
-        self.frame = self.frame.with_columns(
-            [
-                pl.Series(name=velocity_column_name, values=velocities[:, column_id])
-                for column_id, velocity_column_name in enumerate(velocity_columns)
-            ],
-        )
+            self.frame = self.frame.with_columns(
+                [
+                    pl.Series(name=velocity_column_name, values=velocities[:, column_id])
+                    for column_id, velocity_column_name in enumerate(velocity_columns)
+                ],
+            )
+            return
+
+        # Velocities of lazy and grouped frames are computed by numpy as well. In polars 0.17, the
+        # shifted columns of the expressions in transforms_pl are considerably slower, above all
+        # within groups.
+        schema = self.frame.schema
+        if over is not None:
+            if isinstance(self.frame, pl.DataFrame) and method in transforms_pl.POS2VEL_MIN_SAMPLES:
+                # Exceptions raised within the groups are not passed on by polars.
+                self._check_group_sizes(over, transforms_pl.POS2VEL_MIN_SAMPLES[method], method)
+
+            # Passing the return dtype to apply results in missing values within groups, so the
+            # schema of lazy frames is set by a cast instead.
+            velocity_expressions = [
+                pl.col(position_column).apply(
+                    lambda series: pl.Series(
+                        experiment.pos2vel(series.to_numpy(), method=method, **kwargs),
+                    ),
+                ).over(over).cast(
+                    self._get_float_dtype(schema[position_column]),
+                ).alias(velocity_column)
+                for position_column, velocity_column in zip(position_columns, velocity_columns)
+            ]
+        else:
+            velocity_expressions = [
+                pl.col(position_column).map(
+                    lambda series: pl.Series(
+                        experiment.pos2vel(series.to_numpy(), method=method, **kwargs),
+                    ),
+                    return_dtype=self._get_float_dtype(schema[position_column]),
+                ).alias(velocity_column)
+                for position_column, velocity_column in zip(position_columns, velocity_columns)
+            ]
+
+        self.frame = self.frame.with_columns(velocity_expressions)
+
+    def collect(self) -> None:
+        """Execute the deferred query plan of a lazy gaze dataframe.
+
+        After success, the ``frame`` attribute holds an eager :py:class:`polars.DataFrame`. Calling
+        this method on an eager gaze dataframe has no effect.
+        """
+        if isinstance(self.frame, pl.LazyFrame):
+            self.frame = self.frame.collect()
+
+    @property
+    def is_lazy(self) -> bool:
+        """Whether the underlying frame is a :py:class:`polars.LazyFrame`."""
+        return isinstance(self.frame, pl.LazyFrame)
 
     @property
     def schema(self) -> pl.datatypes.SchemaDict:
@@ -164,20 +257,20 @@ class GazeDataFrame:
     @property
     def velocity_columns(self) -> list[str]:
         """Velocity columns (in degrees of visual angle per second) of dataframe."""
-        velocity_columns = list(set(self._valid_velocity_columns) & set(self.frame.columns))
-        return velocity_columns
+        columns = set(self.frame.columns)
+        return [column for column in self._valid_velocity_columns if column in columns]
 
     @property
     def pixel_position_columns(self) -> list[str]:
         """Pixel position columns for this dataset."""
-        pixel_position_columns = set(self._valid_pixel_position_columns) & set(self.frame.columns)
-        return list(pixel_position_columns)
+        columns = set(self.frame.columns)
+        return [column for column in self._valid_pixel_position_columns if column in columns]
 
     @property
     def position_columns(self) -> list[str]:
         """Position columns (in degrees of visual angle) for this dataset."""
-        position_columns = set(self._valid_position_columns) & set(self.frame.columns)
-        return list(position_columns)
+        columns = set(self.frame.columns)
+        return [column for column in self._valid_position_columns if column in columns]
 
     @staticmethod
     def _pixel_to_dva_position_columns(columns: list[str]) -> list[str]:
@@ -197,6 +290,43 @@ class GazeDataFrame:
             if column.endswith('_pos')
         ]
 
+    @staticmethod
+    def _get_float_dtype(dtype: pl.PolarsDataType) -> pl.PolarsDataType:
+        """Get the floating point dtype of a column computed from a column of this dtype."""
+        if dtype == pl.Float32:
+            return pl.Float32
+        return pl.Float64
+
+    def _check_group_sizes(self, over: str | list[str], min_samples: int, method: str) -> None:
+        """Check that each group of an eager frame holds enough samples for the method."""
+        assert isinstance(self.frame, pl.DataFrame)
+        min_group_size = self.frame.groupby(over).agg(pl.count()).select(
+            pl.col('count').min(),
+        ).item()
+        if min_group_size is not None and min_group_size < min_samples:
+            raise ValueError(
+                f'each group has to have at least {min_samples} elements for method "{method}"'
+                f' (smallest group: {min_group_size})',
+            )
+
+    def _pix2deg_expression(self, pix_column: str) -> pl.Expr:
+        """Get expression for converting a single pixel column to dva."""
+        assert self.experiment is not None
+        screen = self.experiment.screen
+
+        if pix_column.startswith('x'):
+            screen_px, screen_cm = screen.width_px, screen.width_cm
+        else:
+            screen_px, screen_cm = screen.height_px, screen.height_cm
+
+        return transforms_pl.pix2deg(
+            pix_column,
+            screen_px=screen_px,
+            screen_cm=screen_cm,
+            distance_cm=screen.distance_cm,
+            origin=screen.origin,
+        )
+
     def _check_experiment(self) -> None:
         """Check if experiment attribute has been set."""
         if self.experiment is None:
@@ -20,6 +20,8 @@
 """This module holds the Screen class."""
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
 
 from pymovements.gaze import transforms
@@ -136,6 +138,7 @@ class Screen:
     def pix2deg(
             self,
             arr: float | list[float] | list[list[float]] | np.ndarray,
+            method: str = 'exact',
     ) -> np.ndarray:
         """
         Converts pixel screen coordinates to degrees of visual angle.
@@ -144,6 +147,22 @@ class Screen:
         ----------
         arr : float, array_like
             Pixel coordinates to transform into degrees of visual angle
+        method : str
+            Following methods are available:
+            * *exact*: each coordinate is converted by
+            :py:func:`~pymovements.gaze.transforms.pix2deg`.
+            * *lookup*: coordinates are rounded to the nearest pixel and looked up in a table
+            holding the converted coordinates of all pixels of the respective screen axis. Integer
+            coordinates result in the exact values. Sub-pixel coordinates deviate by at most
+            ``90 / (pi * distance_px)`` degrees, where ``distance_px`` is the eye-to-screen
+            distance in pixels of the respective axis.
+            * *interpolate*: coordinates are linearly interpolated between the table values of the
+            adjacent pixels. Sub-pixel coordinates deviate by at most
+            ``135 * sqrt(3) / (16 * pi * distance_px ** 2)`` degrees, e.g. by less than 1e-6
+            degrees for an eye-to-screen distance of more than 2200 pixels.
+
+            The tables are computed once per screen geometry. Coordinates outside of the screen and
+            missing coordinates are converted exactly with both table methods. Default: exact
 
         Returns
         -------
@@ -153,7 +172,7 @@ class Screen:
         Raises
         ------
         ValueError
-            If positions aren't two-dimensional.
+            If positions aren't two-dimensional or if the method is not supported.
 
         Examples
         --------
@@ -179,11 +198,95 @@ class Screen:
         ... )
         >>> screen.pix2deg(arr=arr)
         array([[ 3.07379946, 20.43909054]])
+
+        Integer pixel coordinates can be looked up instead of being computed:
+
+        >>> screen.pix2deg(arr=[(123, 865)], method='lookup')
+        array([[ 3.07379946, 20.43909054]])
         """
-        return transforms.pix2deg(
-            arr=arr,
-            screen_px=(self.width_px, self.height_px),
-            screen_cm=(self.width_cm, self.height_cm),
-            distance_cm=self.distance_cm,
-            origin=self.origin,
-        )
+        if method == 'exact':
+            return transforms.pix2deg(
+                arr=arr,
+                screen_px=(self.width_px, self.height_px),
+                screen_cm=(self.width_cm, self.height_cm),
+                distance_cm=self.distance_cm,
+                origin=self.origin,
+            )
+
+        valid_methods = ['exact', 'lookup', 'interpolate']
+        if method not in valid_methods:
+            raise ValueError(f'Method needs to be in {valid_methods} (is: {method})')
+
+        arr = np.array(arr)
+        if arr.ndim != 2 or arr.shape[-1] not in [2, 4]:
+            raise ValueError(
+                'Last coord dimension must have length 2 or 4.'
+                f' (arr.shape: {arr.shape})',
+            )
+
+        # Binocular data holds the x- and y-coordinates of the left eye followed by the ones of the
+        # right eye.
+        n_eyes = arr.shape[-1] // 2
+        screen_px = [self.width_px, self.height_px] * n_eyes
+        screen_cm = [self.width_cm, self.height_cm] * n_eyes
+
+        # The tables of all columns are concatenated, so that all coordinates are looked up at once.
+        tables = [
+            _get_pix2deg_lookup_table(column_px, column_cm, self.distance_cm, self.origin)
+            for column_px, column_cm in zip(screen_px, screen_cm)
+        ]
+        table = np.concatenate(tables)
+        offsets = np.cumsum([0] + screen_px[:-1])
+        max_pixels = np.array(screen_px) - 1
+
+        # Comparisons with NaN are false, so missing coordinates count as off-screen.
+        on_screen = (arr >= 0) & (arr <= max_pixels)
+        all_on_screen = bool(on_screen.all())
+        pixels = arr if all_on_screen else np.where(on_screen, arr, 0)
+
+        if np.issubdtype(arr.dtype, np.integer):
+            dva = table.take(pixels + offsets)
+        elif method == 'interpolate':
+            # The last pixel is interpolated from the second last one with a fraction of one.
+            indices = np.minimum(pixels.astype(np.intp), max_pixels - 1)
+            fractions = pixels - indices
+            indices += offsets
+            lower = table.take(indices)
+            dva = lower + fractions * (table.take(indices + 1) - lower)
+        else:
+            dva = table.take(np.rint(pixels).astype(np.intp) + offsets)
+
+        if arr.dtype == np.float32:
+            dva = dva.astype(np.float32)
+
+        if not all_on_screen:
+            for column, (column_px, column_cm) in enumerate(zip(screen_px, screen_cm)):
+                off_screen = ~on_screen[..., column]
+                # A single column keeps two off-screen coordinates from being taken as x and y.
+                dva[..., column][off_screen] = transforms.pix2deg(
+                    arr[..., column][off_screen, np.newaxis],
+                    screen_px=column_px,
+                    screen_cm=column_cm,
+                    distance_cm=self.distance_cm,
+                    origin=self.origin,
+                )[:, 0]
+        return dva
+
+
+@lru_cache(maxsize=32)
+def _get_pix2deg_lookup_table(
+        screen_px: int,
+        screen_cm: float,
+        distance_cm: float,
+        origin: str,
+) -> np.ndarray:
+    """Get the degrees of visual angle of all pixels along a single screen axis.
+
+    The table is cached per screen geometry and must not be modified.
+    """
+    table = transforms.pix2deg(
+        np.arange(screen_px, dtype=np.float64),
+        screen_px=screen_px, screen_cm=screen_cm, distance_cm=distance_cm, origin=origin,
+    )
+    table.flags.writeable = False
+    return table
@@ -22,13 +22,18 @@ Transforms module.
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 import numpy as np
-from scipy.signal import savgol_filter
+from scipy.ndimage import convolve1d
+from scipy.signal import savgol_coeffs
 
 from pymovements.utils import checks
 
+# Number of bytes of the position time series processed at once by pos2vel_batch().
+POS2VEL_BATCH_BLOCK_BYTES = 2 ** 20
+
 
 def pix2deg(
         arr: float | list[float] | list[list[float]] | np.ndarray,
@@ -56,7 +61,8 @@ def pix2deg(
     Returns
     -------
     np.ndarray
-        Coordinates in degrees of visual angle
+        Coordinates in degrees of visual angle. The floating point precision of arr is preserved,
+        other input types result in float64 coordinates.
 
     Raises
     ------
@@ -148,12 +154,16 @@ def pix2deg(
         screen_px = np.tile(screen_px, 2)
         screen_cm = np.tile(screen_cm, 2)
 
+    # Screen parameters are computed in double precision and then cast to the precision of arr,
+    # so that single precision input is not promoted to double precision.
+    dtype = _get_float_dtype(arr)
+
     # Compute eye-to-screen-distance in pixels.
-    distance_px = distance_cm * (screen_px / screen_cm)
+    distance_px = (distance_cm * (screen_px / screen_cm)).astype(dtype)
 
     # If pixel coordinate system is not centered, shift pixel coordinate to the center.
     if origin == 'lower left':
-        arr = arr - (screen_px - 1) / 2
+        arr = arr - ((screen_px - 1) / 2).astype(dtype)
     elif origin != 'center':
         raise ValueError(f'origin {origin} is not supported.')
 
@@ -165,6 +175,7 @@ def pos2vel(
         arr: list[float] | list[list[float]] | np.ndarray,
         sampling_rate: float = 1000,
         method: str = 'smooth',
+        out: np.ndarray | None = None,
         **kwargs,
 ) -> np.ndarray:
     """Compute velocity time series from 2-dimensional position time series.
@@ -186,19 +197,29 @@ def pos2vel(
         sample and the preceding sample
         * *preceding*: velocity is calculated from the difference of the current
         sample to the preceding sample
+    out : np.ndarray, optional
+        Array with the shape of arr the velocities are written to. Passing the same array for
+        consecutive calls avoids allocating a new array each time. If out shares memory with arr,
+        the velocities are computed from a copy of arr. Default: None
     kwargs: dict
-        Additional keyword arguments used for savitzky golay method.
+        Additional keyword arguments used for savitzky golay method: ``window_length``,
+        ``polyorder``, ``delta``, ``axis`` (0 or -1), ``mode`` and ``cval``. See
+        :py:func:`scipy.signal.savgol_filter` for details. Other keyword arguments of
+        :py:func:`scipy.signal.savgol_filter` are not supported.
 
     Returns
     -------
     np.ndarray
-        Velocity time series in input_unit / sec
+        Velocity time series in input_unit / sec. The floating point precision of arr is
+        preserved, other input types result in float64 velocities. If out is passed, out is
+        returned.
 
     Raises
     ------
     ValueError
         If selected method is invalid, input array is too short for the
-        selected method or the sampling rate is below zero
+        selected method, the sampling rate is below zero, out has a different shape than arr or
+        the kwargs are not supported by the selected method
 
     Examples
     --------
@@ -215,25 +236,128 @@ def pos2vel(
            [1000., 1000.],
            [ 500.,  500.]])
     """
-    if sampling_rate <= 0:
-        raise ValueError('sampling_rate needs to be above zero')
-
-    # make sure that we're operating on a numpy array
-    arr = np.array(arr)
+    # make sure that we're operating on a numpy array, without copying arrays
+    arr = np.asarray(arr)
 
     if arr.ndim not in [1, 2]:
         raise ValueError(
             'arr needs to have 1 or 2 dimensions (are: {arr.ndim = })',
         )
-    if method == 'smooth' and arr.shape[0] < 6:
+    _check_pos2vel_arguments(arr.shape[0], sampling_rate, method, kwargs)
+
+    out = _get_pos2vel_out(arr, out)
+    _pos2vel_along_axis(arr, out, 0, sampling_rate, method, kwargs)
+    return out
+
+
+def pos2vel_batch(
+        arr: np.ndarray,
+        sampling_rate: float = 1000,
+        method: str = 'smooth',
+        out: np.ndarray | None = None,
+        **kwargs,
+) -> np.ndarray:
+    """Compute velocity time series from a batch of equally long position time series.
+
+    All time series of the batch are differentiated in a single call. The time series are
+    processed in blocks of about :py:data:`POS2VEL_BATCH_BLOCK_BYTES` bytes, so that each block
+    stays in the CPU cache. Passing the same `out` array for consecutive batches avoids allocating
+    a new array for each batch.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Position time series of shape (time series, samples, channels), e.g. one time series per
+        file.
+    sampling_rate : int
+        Sampling rate of input time series
+    method : str
+        Computation method. See :py:func:`~pymovements.gaze.transforms.pos2vel` for details.
+    out : np.ndarray, optional
+        Array with the shape of arr the velocities are written to. Default: None
+    kwargs: dict
+        Additional keyword arguments used for savitzky golay method: ``window_length``,
+        ``polyorder``, ``delta``, ``axis`` (0 or -1), ``mode`` and ``cval``. See
+        :py:func:`scipy.signal.savgol_filter` for details. Other keyword arguments of
+        :py:func:`scipy.signal.savgol_filter` are not supported.
+
+    Returns
+    -------
+    np.ndarray
+        Velocity time series in input_unit / sec with the shape of arr.
+
+    Raises
+    ------
+    ValueError
+        If arr is not 3-dimensional, selected method is invalid, the time series are too short for
+        the selected method, the sampling rate is below zero, out has a different shape than arr or
+        the kwargs are not supported by the selected method
+
+    Examples
+    --------
+    >>> arr = np.array([
+    ...     [(0., 0.), (1., 2.), (2., 4.), (3., 6.), (4., 8.), (5., 10.)],
+    ...     [(0., 0.), (0., 0.), (0., 0.), (0., 0.), (0., 0.), (0., 0.)],
+    ... ])
+    >>> pos2vel_batch(arr, sampling_rate=1000, method='preceding')
+    array([[[   0.,    0.],
+            [1000., 2000.],
+            [1000., 2000.],
+            [1000., 2000.],
+            [1000., 2000.],
+            [1000., 2000.]],
+    <BLANKLINE>
+           [[   0.,    0.],
+            [   0.,    0.],
+            [   0.,    0.],
+            [   0.,    0.],
+            [   0.,    0.],
+            [   0.,    0.]]])
+    """
+    arr = np.asarray(arr)
+
+    if arr.ndim != 3:
+        raise ValueError(
+            'arr needs to have 3 dimensions (time series, samples, channels)'
+            f' (arr.ndim: {arr.ndim})',
+        )
+    _check_pos2vel_arguments(arr.shape[1], sampling_rate, method, kwargs)
+
+    out = _get_pos2vel_out(arr, out)
+
+    # The time series are processed in blocks, which stay in the CPU cache during all steps of the
+    # computation. Large batches would otherwise be read from memory again in each step.
+    series_nbytes = max(1, arr.itemsize * arr.shape[1] * arr.shape[2])
+    block_size = max(1, POS2VEL_BATCH_BLOCK_BYTES // series_nbytes)
+    for block_start in range(0, arr.shape[0], block_size):
+        block = slice(block_start, block_start + block_size)
+        _pos2vel_along_axis(arr[block], out[block], 1, sampling_rate, method, kwargs)
+    return out
+
+
+# Keyword arguments of method 'savitzky_golay', following scipy.signal.savgol_filter.
+_SAVITZKY_GOLAY_KWARGS = ['window_length', 'polyorder', 'delta', 'axis', 'mode', 'cval']
+
+
+def _check_pos2vel_arguments(
+        n_samples: int,
+        sampling_rate: float,
+        method: str,
+        kwargs: dict[str, Any],
+) -> None:
+    """Check the arguments of a velocity computation."""
+    if sampling_rate <= 0:
+        raise ValueError('sampling_rate needs to be above zero')
+
+    if method == 'smooth' and n_samples < 6:
         raise ValueError(
             'arr has to have at least 6 elements for method "smooth"',
         )
-    if method == 'neighbors' and arr.shape[0] < 3:
+    if method == 'neighbors' and n_samples < 3:
         raise ValueError(
             'arr has to have at least 3 elements for method "neighbors"',
         )
-    if method == 'preceding' and arr.shape[0] < 2:
+    if method == 'preceding' and n_samples < 2:
         raise ValueError(
             'arr has to have at least 2 elements for method "preceding"',
         )
@@ -241,47 +365,111 @@ def pos2vel(
         raise ValueError(
             'selected method doesn\'t support any additional kwargs',
         )
+    if method == 'savitzky_golay':
+        unsupported_kwargs = sorted(set(kwargs) - set(_SAVITZKY_GOLAY_KWARGS))
+        if unsupported_kwargs:
+            raise ValueError(
+                f'method "savitzky_golay" doesn\'t support the kwargs {unsupported_kwargs}'
+                f' (supported kwargs: {_SAVITZKY_GOLAY_KWARGS})',
+            )
+        if kwargs.get('axis', 0) not in [0, -1]:
+            raise ValueError(
+                'axis needs to be 0 or -1 for method "savitzky_golay", as velocities are computed'
+                f' along the sample axis (is: {kwargs["axis"]})',
+            )
+        if kwargs.get('delta', 1.0) <= 0:
+            raise ValueError('delta needs to be above zero')
 
-    N = arr.shape[0]
-    v = np.zeros(arr.shape)
+
+def _get_pos2vel_out(arr: np.ndarray, out: np.ndarray | None) -> np.ndarray:
+    """Get the array velocities computed from arr are written to."""
+    if out is None:
+        # Every element is written by the velocity computation.
+        return np.empty(arr.shape, dtype=_get_float_dtype(arr))
+
+    if out.shape != arr.shape:
+        raise ValueError(
+            f'out needs to have the shape of arr (out.shape: {out.shape}, arr.shape: {arr.shape})',
+        )
+    return out
+
+
+def _pos2vel_along_axis(
+        arr: np.ndarray,
+        out: np.ndarray,
+        axis: int,
+        sampling_rate: float,
+        method: str,
+        kwargs: dict[str, Any],
+) -> None:
+    """Write velocities computed along the sample axis of arr to out.
+
+    All intermediate results are computed within out, so that no temporary arrays are allocated.
+    The kwargs of the savitzky golay method are passed as a dictionary, as they may hold an axis
+    referring to the sample axis of a single time series.
+    """
+    if np.may_share_memory(arr, out):
+        arr = arr.copy()
+
+    N = arr.shape[axis]
+
+    # Index of the samples start to stop, keeping all axes in front of the sample axis.
+    def samples(start: int, stop: int) -> tuple[slice, ...]:
+        return (slice(None),) * axis + (slice(start, stop),)
 
     valid_methods = ['smooth', 'neighbors', 'preceding', 'savitzky_golay']
     if method == 'smooth':
         # center is N - 2
-        moving_avg = arr[4:N] + arr[3:N - 1] - arr[1:N - 3] - arr[0:N - 4]
         # mean(arr_-2, arr_-1) and mean(arr_1, arr_2) needs division by two
         # window is now 3 samples long (arr_-1.5, arr_0, arr_1+5)
         # we therefore need a divison by three, all in all it's a division by 6
-        v[2:N - 2] = moving_avg * sampling_rate / 6
-
-        # for second and second last sample:
-        # calculate vocity from preceding and subsequent sample
-        v[1] = (arr[2] - arr[0]) * sampling_rate / 2
-        v[N - 2] = (arr[N - 1] - arr[N - 3]) * sampling_rate / 2
+        center = out[samples(2, N - 2)]
+        np.add(arr[samples(4, N)], arr[samples(3, N - 1)], out=center)
+        np.subtract(center, arr[samples(1, N - 3)], out=center)
+        np.subtract(center, arr[samples(0, N - 4)], out=center)
+        np.multiply(center, sampling_rate, out=center)
+        np.divide(center, 6, out=center)
 
         # for first and second sample:
-        # calculate velocity from current and neighboring sample
-        v[0] = (arr[1] - arr[0]) * sampling_rate / 2
-        v[N - 1] = (arr[N - 1] - arr[N - 2]) * sampling_rate / 2
+        # calculate velocity from current and neighboring sample, and from preceding and
+        # subsequent sample
+        np.subtract(arr[samples(1, 3)], arr[samples(0, 1)], out=out[samples(0, 2)])
+        # for second last and last sample:
+        # calculate velocity from preceding and subsequent sample, and from current and
+        # neighboring sample
+        np.subtract(
+            arr[samples(N - 1, N)], arr[samples(N - 3, N - 1)], out=out[samples(N - 2, N)],
+        )
+        for boundary in (out[samples(0, 2)], out[samples(N - 2, N)]):
+            np.multiply(boundary, sampling_rate, out=boundary)
+            np.divide(boundary, 2, out=boundary)
 
     elif method == 'neighbors':
         # window size is two, so we need to divide by two
-        v[1:N - 1] = (arr[2:N] - arr[0:N - 2]) * sampling_rate / 2
+        center = out[samples(1, N - 1)]
+        np.subtract(arr[samples(2, N)], arr[samples(0, N - 2)], out=center)
+        np.multiply(center, sampling_rate, out=center)
+        np.divide(center, 2, out=center)
+        out[samples(0, 1)] = 0
+        out[samples(N - 1, N)] = 0
 
     elif method == 'preceding':
-        v[1:N] = (arr[1:N] - arr[0:N - 1]) * sampling_rate
+        center = out[samples(1, N)]
+        np.subtract(arr[samples(1, N)], arr[samples(0, N - 1)], out=center)
+        np.multiply(center, sampling_rate, out=center)
+        out[samples(0, 1)] = 0
 
     elif method == 'savitzky_golay':
-        # transform to velocities
-        if arr.ndim == 1:
-            v = savgol_filter(x=arr, deriv=1, **kwargs)
-        else:  # we already checked for error cases
-
-            for channel_id in range(arr.shape[1]):
-                v[:, channel_id] = savgol_filter(
-                    x=arr[:, channel_id], deriv=1, **kwargs,
-                )
-        v = v * sampling_rate
+        savitzky_golay_kwargs = dict(kwargs)
+        # The filter always runs along the sample axis, which the checked axis refers to.
+        savitzky_golay_kwargs.pop('axis', None)
+        # Derivatives are divided by the sample spacing as in scipy.signal.savgol_filter.
+        delta = savitzky_golay_kwargs.pop('delta', 1.0)
+
+        # transform to velocities, all channels are filtered at once
+        _savitzky_golay_along_axis(
+            arr, out, axis, deriv=1, sampling_rate=sampling_rate / delta, **savitzky_golay_kwargs,
+        )
 
     else:
         raise ValueError(
@@ -289,7 +477,242 @@ def pos2vel(
             f' (is: {method})',
         )
 
-    return v
+
+def savitzky_golay(
+        arr: list[float] | list[list[float]] | np.ndarray,
+        window_length: int,
+        polyorder: int,
+        deriv: int = 0,
+        sampling_rate: float = 1000,
+        mode: str = 'interp',
+        cval: float = 0.0,
+        out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Apply a Savitzky-Golay filter to all channels of a time series.
+
+    The results equal those of :py:func:`scipy.signal.savgol_filter` along the first axis up to
+    floating point rounding. The filter coefficients are computed once for each combination of
+    window length, polynomial order, derivative and sampling rate, and all channels are filtered in
+    a single pass.
+
+    Parameters
+    ----------
+    arr : array_like
+        Continuous 1D or 2D time series with samples along the first axis.
+    window_length : int
+        Number of samples of the filter window.
+    polyorder : int
+        Order of the polynomial fitted to each window. Must be less than window_length.
+    deriv : int
+        Order of the derivative to compute. Zero smoothes the time series. Default: 0
+    sampling_rate : float
+        Sampling rate of the time series. Derivatives are computed in input_unit / sec.
+        Default: 1000
+    mode : str
+        Extension of the time series at its boundaries. See :py:func:`scipy.signal.savgol_filter`
+        for details. Default: interp
+    cval : float
+        Value to fill past the boundaries if mode is 'constant'. Default: 0.0
+    out : np.ndarray, optional
+        Array with the shape of arr the results are written to. Default: None
+
+    Returns
+    -------
+    np.ndarray
+        Filtered time series. The floating point precision of arr is preserved, other input types
+        result in float64 values.
+
+    Raises
+    ------
+    ValueError
+        If arr is not 1D or 2D, if out has a different shape than arr, if polyorder is not less
+        than window_length, if mode is invalid or if mode is 'interp' and arr has less samples
+        than window_length.
+
+    Examples
+    --------
+    >>> arr = [(1., 1.), (4., 2.), (9., 3.), (16., 4.), (25., 5.), (36., 6.), (49., 7.)]
+    >>> savitzky_golay(arr, window_length=5, polyorder=2, deriv=1, sampling_rate=1).round(3)
+    array([[ 2.,  1.],
+           [ 4.,  1.],
+           [ 6.,  1.],
+           [ 8.,  1.],
+           [10.,  1.],
+           [12.,  1.],
+           [14.,  1.]])
+    """
+    arr = np.asarray(arr)
+
+    if arr.ndim not in [1, 2]:
+        raise ValueError(
+            'arr needs to have 1 or 2 dimensions'
+            f' (arr.ndim: {arr.ndim})',
+        )
+    if sampling_rate <= 0:
+        raise ValueError('sampling_rate needs to be above zero')
+
+    out = _get_pos2vel_out(arr, out)
+    _savitzky_golay_along_axis(
+        arr, out, 0, window_length, polyorder, deriv, sampling_rate, mode=mode, cval=cval,
+    )
+    return out
+
+
+def smooth_pos2vel(
+        arr: list[float] | list[list[float]] | np.ndarray,
+        window_length: int,
+        polyorder: int,
+        sampling_rate: float = 1000,
+        mode: str = 'interp',
+        cval: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Smooth a position time series and compute its velocities with one Savitzky-Golay filter.
+
+    Both results are computed from the same cached filter coefficients in a single call. The
+    velocities equal those of :py:func:`pos2vel` with method 'savitzky_golay'.
+
+    Parameters
+    ----------
+    arr : array_like
+        Continuous 1D or 2D position time series with samples along the first axis.
+    window_length : int
+        Number of samples of the filter window.
+    polyorder : int
+        Order of the polynomial fitted to each window. Must be less than window_length.
+    sampling_rate : float
+        Sampling rate of the time series. Default: 1000
+    mode : str
+        Extension of the time series at its boundaries. See :py:func:`scipy.signal.savgol_filter`
+        for details. Default: interp
+    cval : float
+        Value to fill past the boundaries if mode is 'constant'. Default: 0.0
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Smoothed positions and velocities in input_unit / sec.
+
+    Raises
+    ------
+    ValueError
+        If arr is not 1D or 2D, if polyorder is not less than window_length, if mode is invalid or
+        if mode is 'interp' and arr has less samples than window_length.
+
+    Examples
+    --------
+    >>> arr = [1., 4., 9., 16., 25., 36., 49.]
+    >>> positions, velocities = smooth_pos2vel(arr, window_length=5, polyorder=2, sampling_rate=1)
+    >>> positions.round(3)
+    array([ 1.,  4.,  9., 16., 25., 36., 49.])
+    >>> velocities.round(3)
+    array([ 2.,  4.,  6.,  8., 10., 12., 14.])
+    """
+    arr = np.asarray(arr)
+    if not np.issubdtype(arr.dtype, np.floating):
+        # Convert only once for both filters.
+        arr = arr.astype(np.float64)
+
+    positions = savitzky_golay(
+        arr, window_length, polyorder, deriv=0, sampling_rate=sampling_rate, mode=mode, cval=cval,
+    )
+    velocities = savitzky_golay(
+        arr, window_length, polyorder, deriv=1, sampling_rate=sampling_rate, mode=mode, cval=cval,
+    )
+    return positions, velocities
+
+
+@lru_cache(maxsize=64)
+def _get_savitzky_golay_coefficients(
+        window_length: int,
+        polyorder: int,
+        deriv: int,
+        sampling_rate: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get the coefficients of a Savitzky-Golay filter.
+
+    The coefficients include the scaling of derivatives by the sampling rate. They are cached and
+    must not be modified.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        Convolution coefficients, and the coefficients of the polynomials fitted to the first and
+        the last window evaluated at the leading and trailing samples, as used by mode 'interp'.
+    """
+    delta = 1 / sampling_rate
+    coefficients = savgol_coeffs(window_length, polyorder, deriv=deriv, delta=delta)
+
+    # The polynomial fit is linear in the samples of the window, so the polynomial evaluated at a
+    # position of the window is a dot product with fixed coefficients.
+    halflen = window_length // 2
+    leading_coefficients = np.stack([
+        savgol_coeffs(window_length, polyorder, deriv=deriv, delta=delta, pos=pos, use='dot')
+        for pos in range(halflen)
+    ]).reshape(halflen, window_length)
+    trailing_coefficients = np.stack([
+        savgol_coeffs(window_length, polyorder, deriv=deriv, delta=delta, pos=pos, use='dot')
+        for pos in range(window_length - halflen, window_length)
+    ]).reshape(halflen, window_length)
+
+    for array in (coefficients, leading_coefficients, trailing_coefficients):
+        array.flags.writeable = False
+    return coefficients, leading_coefficients, trailing_coefficients
+
+
+def _savitzky_golay_along_axis(
+        arr: np.ndarray,
+        out: np.ndarray,
+        axis: int,
+        window_length: int,
+        polyorder: int,
+        deriv: int,
+        sampling_rate: float,
+        mode: str = 'interp',
+        cval: float = 0.0,
+) -> None:
+    """Write the Savitzky-Golay filtered samples along the axis of arr to out."""
+    valid_modes = ['mirror', 'constant', 'nearest', 'interp', 'wrap']
+    if mode not in valid_modes:
+        raise ValueError(f'mode needs to be in {valid_modes} (is: {mode})')
+
+    N = arr.shape[axis]
+    if mode == 'interp' and window_length > N:
+        raise ValueError(
+            'If mode is \'interp\', window_length must be less than or equal to the size of arr.',
+        )
+
+    coefficients, leading_coefficients, trailing_coefficients = _get_savitzky_golay_coefficients(
+        window_length, polyorder, deriv, float(sampling_rate),
+    )
+
+    if not np.issubdtype(arr.dtype, np.floating):
+        arr = arr.astype(np.float64)
+
+    if mode != 'interp':
+        convolve1d(arr, coefficients, axis=axis, output=out, mode=mode, cval=cval)
+        return
+
+    convolve1d(arr, coefficients, axis=axis, output=out, mode='constant')
+
+    # Samples within half a window of the boundaries are computed from the polynomial fitted to
+    # the first and last window instead of padding the time series.
+    halflen = window_length // 2
+    leading_axes = (slice(None),) * axis
+    for edge_coefficients, window, edge in (
+        (leading_coefficients, slice(0, window_length), slice(0, halflen)),
+        (trailing_coefficients, slice(N - window_length, N), slice(N - halflen, N)),
+    ):
+        edge_values = np.tensordot(
+            edge_coefficients, arr[leading_axes + (window,)], axes=([1], [axis]),
+        )
+        out[leading_axes + (edge,)] = np.moveaxis(edge_values, 0, axis)
+
+
+def _get_float_dtype(arr: np.ndarray) -> np.dtype:
+    """Get the floating point dtype of results computed from arr."""
+    if np.issubdtype(arr.dtype, np.floating):
+        return arr.dtype
+    return np.dtype(np.float64)
 
 
 def norm(arr: np.ndarray, axis: int | None = None) -> np.ndarray | Any:
@@ -0,0 +1,243 @@
+# Copyright (c) 2023 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Transforms module implemented as polars expressions.
+
+In contrast to :py:mod:`pymovements.gaze.transforms`, these transforms never leave polars, so that
+they can be used in eager, lazy and grouped contexts without copying columns to numpy arrays.
+"""
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+
+from pymovements.utils import checks
+
+# Methods of :py:func:`pymovements.gaze.transforms.pos2vel` that are available as expressions.
+POS2VEL_METHODS = ['smooth', 'neighbors', 'preceding']
+
+# Minimum number of samples of the methods of :py:func:`pymovements.gaze.transforms.pos2vel`.
+POS2VEL_MIN_SAMPLES = {'smooth': 6, 'neighbors': 3, 'preceding': 2}
+
+
+def pix2deg(
+        pixels: str | pl.Expr,
+        screen_px: float,
+        screen_cm: float,
+        distance_cm: float,
+        origin: str,
+) -> pl.Expr:
+    """Converts pixel screen coordinates of a single axis to degrees of visual angle.
+
+    Single precision columns result in single precision coordinates, other columns result in double
+    precision coordinates.
+
+    Parameters
+    ----------
+    pixels : str | pl.Expr
+        Name of the pixel coordinate column or an expression evaluating to pixel coordinates.
+    screen_px : float
+        Screen dimension of this axis in pixels
+    screen_cm : float
+        Screen dimension of this axis in centimeters
+    distance_cm : float
+        Eye-to-screen distance in centimeters
+    origin : str
+        Specifies the screen location of the origin of the pixel coordinate system. Valid values
+        are: center, lower left.
+
+    Returns
+    -------
+    pl.Expr
+        Expression evaluating to coordinates in degrees of visual angle.
+
+    Raises
+    ------
+    ValueError
+        If screen_px, screen_cm or distance_cm is zero.
+        If origin value is not supported.
+
+    Examples
+    --------
+    >>> df = pl.DataFrame({'x_pix': [123.0], 'y_pix': [865.0]})
+    >>> df.select([
+    ...     pix2deg('x_pix', 1280, 38.0, 68.0, 'lower left'),
+    ...     pix2deg('y_pix', 1024, 30.0, 68.0, 'lower left'),
+    ... ])
+    shape: (1, 2)
+    ┌────────────┬─────────┐
+    │ x_pix      ┆ y_pix   │
+    │ ---        ┆ ---     │
+    │ f64        ┆ f64     │
+    ╞════════════╪═════════╡
+    │ -12.707322 ┆ 8.65964 │
+    └────────────┴─────────┘
+    """
+    checks.check_no_zeros(screen_px, 'screen_px')
+    checks.check_no_zeros(screen_cm, 'screen_cm')
+    checks.check_no_zeros(distance_cm, 'distance_cm')
+
+    if isinstance(pixels, str):
+        pixels = pl.col(pixels)
+
+    # Compute eye-to-screen-distance in pixels.
+    distance_px = distance_cm * (screen_px / screen_cm)
+
+    # If pixel coordinate system is not centered, shift pixel coordinate to the center.
+    if origin == 'lower left':
+        # The offset is added instead of subtracted, as polars infers a double precision schema for
+        # the subtraction of a Python float from a single precision column of a lazy frame.
+        pixels = pixels + (1 - screen_px) / 2
+    elif origin != 'center':
+        raise ValueError(f'origin {origin} is not supported.')
+
+    # Polars lacks arctan2, which equals arctan of the ratio for a positive distance. Python
+    # scalars keep the precision of single precision columns.
+    # 180 / pi transforms arc measure to degrees.
+    return (pixels / distance_px).arctan() * (180 / np.pi)
+
+
+def pos2vel(
+        positions: str | pl.Expr,
+        sampling_rate: float = 1000,
+        method: str = 'smooth',
+) -> pl.Expr:
+    """Compute velocities from positions of a single axis.
+
+    The methods and their handling of the first and last samples equal those of
+    :py:func:`pymovements.gaze.transforms.pos2vel`. Velocities are computed from shifted positions,
+    so applying ``.over()`` on the returned expression computes velocities separately for each
+    group, e.g. for each trial, without mixing samples of adjacent groups.
+
+    Single precision columns result in single precision velocities, other columns result in double
+    precision velocities. NaN positions result in NaN velocities as with numpy. Missing positions
+    result in missing velocities for all samples whose window includes them, where the numpy
+    implementation results in NaN velocities. This includes the first and last samples of methods
+    neighbors and preceding, whose velocities are zero unless their own position is missing.
+
+    The length of the positions is unknown when the expression is built, so it is not checked. The
+    methods require at least as many samples as listed in ``POS2VEL_MIN_SAMPLES`` (6 for smooth, 3
+    for neighbors and 2 for preceding), and velocities of shorter series or groups are meaningless.
+
+    Parameters
+    ----------
+    positions : str | pl.Expr
+        Name of the position column or an expression evaluating to positions.
+    sampling_rate : float
+        Sampling rate of the positions.
+    method : str
+        Following methods are available:
+        * *smooth*: velocity is calculated from the difference of the mean values
+        of the subsequent two samples and the preceding two samples
+        * *neighbors*: velocity is calculated from difference of the subsequent
+        sample and the preceding sample
+        * *preceding*: velocity is calculated from the difference of the current
+        sample to the preceding sample
+
+    Returns
+    -------
+    pl.Expr
+        Expression evaluating to velocities in input_unit / sec.
+
+    Raises
+    ------
+    ValueError
+        If selected method is invalid or the sampling rate is not above zero.
+
+    Examples
+    --------
+    >>> df = pl.DataFrame({
+    ...     'trial': [1, 1, 1, 2, 2, 2],
+    ...     'x_pos': [0., 1., 2., 10., 12., 14.],
+    ... })
+    >>> df.select(pos2vel('x_pos', sampling_rate=1000, method='preceding').over('trial'))
+    shape: (6, 1)
+    ┌────────┐
+    │ x_pos  │
+    │ ---    │
+    │ f64    │
+    ╞════════╡
+    │ 0.0    │
+    │ 1000.0 │
+    │ 1000.0 │
+    │ 0.0    │
+    │ 2000.0 │
+    │ 2000.0 │
+    └────────┘
+    """
+    if sampling_rate <= 0:
+        raise ValueError('sampling_rate needs to be above zero')
+
+    if isinstance(positions, str):
+        positions = pl.col(positions)
+
+    if method == 'smooth':
+        # Positions of the preceding and subsequent samples. The first and last positions are
+        # repeated at the boundaries, so that shifting never introduces missing values.
+        preceding = positions.shift_and_fill(positions.first(), periods=1)
+        subsequent = positions.shift_and_fill(positions.last(), periods=-1)
+
+        # mean(arr_-2, arr_-1) and mean(arr_1, arr_2) needs division by two
+        # window is now 3 samples long (arr_-1.5, arr_0, arr_1+5)
+        # we therefore need a divison by three, all in all it's a division by 6
+        moving_avg = (
+            positions.shift_and_fill(positions.last(), periods=-2) + subsequent
+            - preceding - positions.shift_and_fill(positions.first(), periods=2)
+        )
+
+        # For the first two and last two samples the velocity is calculated from the preceding and
+        # subsequent sample. The repeated boundary positions reduce this to the difference of the
+        # current and the neighboring sample for the very first and last sample.
+        is_inner_sample = (positions.cumcount() >= 2) & (positions.cumcount(reverse=True) >= 2)
+        return pl.when(is_inner_sample).then(
+            moving_avg * (sampling_rate / 6),
+        ).otherwise(
+            (subsequent - preceding) * (sampling_rate / 2),
+        )
+
+    if method == 'neighbors':
+        # window size is two, so we need to divide by two
+        is_inner_sample = (positions.cumcount() >= 1) & (positions.cumcount(reverse=True) >= 1)
+        return pl.when(is_inner_sample).then(
+            (positions.shift(-1) - positions.shift(1)) * (sampling_rate / 2),
+        ).otherwise(
+            _zeros_like(positions),
+        )
+
+    if method == 'preceding':
+        return pl.when(positions.cumcount() >= 1).then(
+            (positions - positions.shift(1)) * float(sampling_rate),
+        ).otherwise(
+            _zeros_like(positions),
+        )
+
+    raise ValueError(
+        f'Method needs to be in {POS2VEL_METHODS}'
+        f' (is: {method})',
+    )
+
+
+def _zeros_like(positions: pl.Expr) -> pl.Expr:
+    """Get zeros of the data type of the positions, keeping missing positions missing.
+
+    Zeros are derived from the positions instead of using a literal, so that the schema of lazy
+    frames keeps single precision columns. Any non-missing value to the power of zero is one, even
+    NaN and infinite values, so no predicate is needed that would be evaluated within ``.over()``.
+    """
+    return positions.pow(0) * 0.0
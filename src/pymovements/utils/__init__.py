@@ -26,14 +26,20 @@
    :template: module.rst
 
     pymovements.utils.archives
+    pymovements.utils.cache
     pymovements.utils.checks
     pymovements.utils.decorators
     pymovements.utils.downloads
     pymovements.utils.filters
     pymovements.utils.paths
+    pymovements.utils.prefetching
+    pymovements.utils.profiling
 """
 from pymovements.utils import archives  # noqa: F401
+from pymovements.utils import cache  # noqa: F401
 from pymovements.utils import checks  # noqa: F401
 from pymovements.utils import decorators  # noqa: F401
 from pymovements.utils import downloads  # noqa: F401
 from pymovements.utils import paths  # noqa: F401
+from pymovements.utils import prefetching  # noqa: F401
+from pymovements.utils import profiling  # noqa: F401
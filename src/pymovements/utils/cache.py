@@ -0,0 +1,277 @@
+# Copyright (c) 2022-2023 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Utils module for caching results of deterministic processing stages on disk.
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import marshal
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+from pymovements.utils.paths import create_temporary_file
+
+
+class StageCache:
+    """On-disk cache for results of deterministic processing stages.
+
+    Results are stored as feather files named by a cryptographic hash of the stage name, the input
+    data and the stage parameters. The input data is hashed in its Arrow IPC serialization, which
+    is lossless. Different inputs therefore never share a key, while a change of the serialization
+    in another polars version only results in cache misses. Serializing large inputs is costly, so
+    callers which can describe their input by a cheaper fingerprint, e.g. the state of the file it
+    was read from, pass no data and the fingerprint as a parameter instead. If the total size of the
+    cached files exceeds `max_size`, the least recently used files are evicted.
+
+    Attributes
+    ----------
+    path : Path
+        Directory holding the cached files.
+    max_size : int
+        Maximum total size of the cached files in bytes.
+    hits : int
+        Number of lookups which returned a cached result.
+    misses : int
+        Number of lookups which did not find a cached result.
+    """
+
+    def __init__(self, path: str | Path, max_size: int = 2**30):
+        """Initialize cache.
+
+        Parameters
+        ----------
+        path : str | Path
+            Directory holding the cached files. The directory is created if it does not exist.
+        max_size : int
+            Maximum total size of the cached files in bytes. Default: 1 GiB
+
+        Raises
+        ------
+        ValueError
+            If `max_size` is negative.
+        """
+        if max_size < 0:
+            raise ValueError(f'max_size must not be negative but is {max_size}')
+
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+
+        self._last_access_time = 0
+
+    def get_or_compute(
+            self,
+            name: str,
+            data: pl.DataFrame | None,
+            compute: Callable[[], pl.DataFrame],
+            **parameters: Any,
+    ) -> pl.DataFrame:
+        """Get the cached result of a stage or compute and cache it.
+
+        Parameters
+        ----------
+        name : str
+            Name of the processing stage.
+        data : pl.DataFrame | None
+            Input data of the stage. Only the columns the stage depends on should be passed. If
+            None, the input has to be described by the parameters.
+        compute : Callable[[], pl.DataFrame]
+            Computes the result if it is not cached.
+        **parameters
+            Parameters the result depends on, e.g. an :py:class:`~pymovements.gaze.Experiment` and
+            keyword arguments of the stage.
+
+        Returns
+        -------
+        pl.DataFrame
+            The cached or computed result.
+        """
+        key = self.make_key(name, data, **parameters)
+
+        result = self.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = compute()
+        self.put(key, result)
+        return result
+
+    @classmethod
+    def make_key(cls, name: str, data: pl.DataFrame | None, **parameters: Any) -> str:
+        """Compute the cache key of a stage.
+
+        Parameters
+        ----------
+        name : str
+            Name of the processing stage.
+        data : pl.DataFrame | None
+            Input data of the stage. If None, the key only depends on the name and the parameters.
+        **parameters
+            Parameters the result depends on. Objects are described by their attributes. Functions
+            are described by their qualified name, their compiled code, their default arguments and
+            the values of their closure variables. Functions called by a function are not part of
+            its description.
+
+        Returns
+        -------
+        str
+            Hexadecimal hash digest.
+        """
+        description: dict[str, Any] = {'name': name, 'parameters': parameters}
+        if data is not None:
+            description['schema'] = [[column, str(dtype)] for column, dtype in data.schema.items()]
+
+        digest = hashlib.blake2b(
+            json.dumps(description, sort_keys=True, default=cls._describe).encode('utf-8'),
+            digest_size=20,
+        )
+
+        if data is not None:
+            # Record batches follow the chunks, so equal data is rechunked to a single batch first.
+            serialized_data = io.BytesIO()
+            data.rechunk().write_ipc(serialized_data, compression='uncompressed')
+            digest.update(serialized_data.getbuffer())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def _describe(value: Any) -> Any:
+        """Describe a parameter which is not JSON serializable."""
+        if callable(value) and hasattr(value, '__qualname__'):
+            description: dict[str, Any] = {'name': f'{value.__module__}.{value.__qualname__}'}
+            function = getattr(value, '__func__', value)
+            if hasattr(function, '__code__'):
+                # The compiled code changes with the function body. Default arguments and closure
+                # variables distinguish functions sharing their code and name, e.g. lambdas.
+                description['code'] = hashlib.blake2b(
+                    marshal.dumps(function.__code__), digest_size=20,
+                ).hexdigest()
+                description['defaults'] = [function.__defaults__, function.__kwdefaults__]
+                description['closure'] = [
+                    cell.cell_contents for cell in function.__closure__ or ()
+                ]
+            return description
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        if hasattr(value, '__dict__'):
+            return {'type': type(value).__qualname__, 'attributes': vars(value)}
+        return repr(value)
+
+    def get(self, key: str) -> pl.DataFrame | None:
+        """Read a cached result and mark it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            Cache key as computed by :py:meth:`make_key`.
+
+        Returns
+        -------
+        pl.DataFrame, optional
+            The cached result or None if there is no result cached for this key.
+        """
+        filepath = self._get_filepath(key)
+        try:
+            result = pl.read_ipc(filepath, memory_map=False)
+            self._touch(filepath)
+        except (OSError, pl.ArrowError, pl.ComputeError):
+            return None
+        return result
+
+    def put(self, key: str, result: pl.DataFrame) -> None:
+        """Cache a result and evict least recently used results if the cache is full.
+
+        Parameters
+        ----------
+        key : str
+            Cache key as computed by :py:meth:`make_key`.
+        result : pl.DataFrame
+            Result to be cached.
+        """
+        temp_filepath = create_temporary_file(self.path)
+        try:
+            result.write_ipc(temp_filepath)
+            self._touch(temp_filepath)
+            os.replace(temp_filepath, self._get_filepath(key))
+        finally:
+            if os.path.exists(temp_filepath):
+                os.remove(temp_filepath)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove least recently used results until the cache does not exceed `max_size`."""
+        entries = []
+        with os.scandir(self.path) as directory_entries:
+            for entry in directory_entries:
+                if entry.name.endswith('.feather'):
+                    entry_stat = entry.stat()
+                    entries.append((entry_stat.st_mtime_ns, entry_stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, filepath in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            os.remove(filepath)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.feather'):
+                    os.remove(entry.path)
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached results in bytes."""
+        with os.scandir(self.path) as entries:
+            return sum(
+                entry.stat().st_size for entry in entries if entry.name.endswith('.feather')
+            )
+
+    def _touch(self, filepath: str | Path) -> None:
+        """Set the modification time of a cached file to the current time.
+
+        The modification time is used as access time for evicting least recently used files. It is
+        set explicitly and strictly increasing, as the timestamp resolution of the file system may
+        be too coarse to order consecutive accesses.
+        """
+        access_time = max(time.time_ns(), self._last_access_time + 1)
+        self._last_access_time = access_time
+        os.utime(filepath, ns=(access_time, access_time))
+
+    def _get_filepath(self, key: str) -> Path:
+        """Get the filepath of a cached result."""
+        return self.path / f'{key}.feather'
@@ -22,14 +22,110 @@ This module holds path specific funtions.
 """
 from __future__ import annotations
 
+import os
 import re
+import uuid
+from collections.abc import Callable
+from collections.abc import Iterator
 from pathlib import Path
 
 
+def walk_files(
+        path: str | Path,
+        prune: Callable[[str], bool] | None = None,
+) -> Iterator[tuple[str, os.DirEntry]]:
+    """Iteratively walk a directory tree and yield all files.
+
+    The tree is traversed with :py:func:`os.scandir`. File type information is taken from the
+    cached :py:class:`os.DirEntry` attributes, which avoids an additional ``stat`` call per
+    entry on most platforms.
+
+    Parameters
+    ----------
+    path: str | Path
+        Root path to be traversed.
+    prune: Callable[[str], bool], optional
+        Called with the directory path relative to ``path`` before descending into it. If it
+        returns True, the directory and all of its contents are skipped.
+
+    Yields
+    ------
+    tuple[str, os.DirEntry]
+        The directory path of the file relative to ``path`` (an empty string for files directly
+        in ``path``) and the directory entry of the file.
+    """
+    stack: list[tuple[str, str]] = [(str(path), '')]
+    while stack:
+        dirpath, relative_dirpath = stack.pop()
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    relative_childpath = os.path.join(relative_dirpath, entry.name)
+                    if prune is not None and prune(relative_childpath):
+                        continue
+                    stack.append((entry.path, relative_childpath))
+                else:
+                    yield relative_dirpath, entry
+
+
+def iter_filepaths(
+        path: str | Path,
+        extension: str | list[str] | None = None,
+        regex: re.Pattern | None = None,
+        prune: Callable[[str], bool] | None = None,
+) -> Iterator[Path]:
+    """
+    Iterate over filepaths from rootpath depending on extension or regular expression.
+    Passing extension and regex is mutually exclusive.
+
+    This is the generator version of :py:func:`get_filepaths`.
+
+    Parameters
+    ----------
+    path: str | Path
+        Root path to be traversed.
+    extension: str, list of str, optional
+        File extension to be filtered for.
+    regex: re.Pattern, optional
+        Regular expression filenames will be filtered for.
+    prune: Callable[[str], bool], optional
+        Called with each directory path relative to ``path``. Directories for which it returns
+        True are not traversed.
+
+    Yields
+    ------
+    Path
+
+    Raises
+    ------
+    ValueError
+        If both extension and regex is being passed.
+    """
+    if extension is not None and regex is not None:
+        raise ValueError('extension and regex are mutually exclusive')
+
+    if extension is not None and isinstance(extension, str):
+        extension = [extension]
+
+    path = Path(path)
+    if not path.is_dir():
+        return
+
+    for _, entry in walk_files(path, prune=prune):
+        # if extension specified and not matching, continue to next
+        if extension and os.path.splitext(entry.name)[1] not in extension:
+            continue
+        # if regex specified and not matching, continue to next
+        if regex and not regex.match(entry.name):
+            continue
+        yield Path(entry.path)
+
+
 def get_filepaths(
         path: str | Path,
         extension: str | list[str] | None = None,
         regex: re.Pattern | None = None,
+        prune: Callable[[str], bool] | None = None,
 ) -> list[Path]:
     """
     Get filepaths from rootpath depending on extension or regular expression.
@@ -43,6 +139,9 @@ def get_filepaths(
         File extension to be filtered for.
     regex: re.Pattern, optional
         Regular expression filenames will be filtered for.
+    prune: Callable[[str], bool], optional
+        Called with each directory path relative to ``path``. Directories for which it returns
+        True are not traversed.
 
     Returns
     -------
@@ -54,29 +153,72 @@ def get_filepaths(
         If both extension and regex is being passed.
 
     """
-    if extension is not None and regex is not None:
-        raise ValueError('extension and regex are mutually exclusive')
+    return list(iter_filepaths(path=path, extension=extension, regex=regex, prune=prune))
 
-    if extension is not None and isinstance(extension, str):
-        extension = [extension]
 
+def iter_match_filepaths(
+        path: str | Path,
+        regex: re.Pattern,
+        relative: bool = True,
+        relative_anchor: Path | None = None,
+        prune: Callable[[str], bool] | None = None,
+        match_filter: Callable[[re.Match], bool] | None = None,
+) -> Iterator[dict[str, str]]:
+    """Traverse path and match regular expression.
+
+    This is the generator version of :py:func:`match_filepaths`.
+
+    Parameters
+    ----------
+    path: str | Path
+        Root path to be traversed.
+    regex: re.Pattern, optional
+        Regular expression filenames will be matched against.
+    relative: bool
+        If True, specify filepath as relative to root path.
+    relative_anchor: Path, optional
+        Specifies root path in case of ``relative == True``. If None, ``path`` will be chosen
+        as `relative_anchor`.
+    prune: Callable[[str], bool], optional
+        Called with each directory path relative to ``path``. Directories for which it returns
+        True are not traversed.
+    match_filter: Callable[[re.Match], bool], optional
+        Called with each successful match of ``regex``. Files for which it returns False are
+        rejected before their match dictionary is built.
+
+    Yields
+    ------
+    dict[str, str]
+        The match group dictionary of the regular expression with an additional ``filepath`` key.
+
+    Raises
+    ------
+    ValueError
+        If ``path`` does not point to a directory.
+    """
     path = Path(path)
     if not path.is_dir():
-        return []
+        raise ValueError(f'path must point to a directory, but points to a file (path = {path})')
+
+    anchor_prefix = ''
+    if relative and relative_anchor is not None:
+        anchor_prefix = os.path.relpath(path, relative_anchor)
+        if anchor_prefix == os.curdir:
+            anchor_prefix = ''
+
+    for relative_dirpath, entry in walk_files(path, prune=prune):
+        match = regex.match(entry.name)
+        if match is None:
+            continue
+        if match_filter is not None and not match_filter(match):
+            continue
 
-    filepaths = []
-    for childpath in path.iterdir():
-        if childpath.is_dir():
-            filepaths.extend(get_filepaths(path=childpath, extension=extension, regex=regex))
+        match_dict = match.groupdict()
+        if relative:
+            match_dict['filepath'] = os.path.join(anchor_prefix, relative_dirpath, entry.name)
         else:
-            # if extension specified and not matching, continue to next
-            if extension and childpath.suffix not in extension:
-                continue
-            # if regex specified and not matching, continue to next
-            if regex and not regex.match(childpath.name):
-                continue
-            filepaths.append(childpath)
-    return filepaths
+            match_dict['filepath'] = entry.path
+        yield match_dict
 
 
 def match_filepaths(
@@ -84,6 +226,8 @@ def match_filepaths(
         regex: re.Pattern,
         relative: bool = True,
         relative_anchor: Path | None = None,
+        prune: Callable[[str], bool] | None = None,
+        match_filter: Callable[[re.Match], bool] | None = None,
 ) -> list[dict[str, str]]:
     """Traverse path and match regular expression.
 
@@ -97,7 +241,13 @@ def match_filepaths(
         If True, specify filepath as relative to root path.
     relative_anchor: Path, optional
         Specifies root path in case of ``relative == True``. If None, ``path`` will be chosen
-        as `relative_anchor` for recursive calls.
+        as `relative_anchor`.
+    prune: Callable[[str], bool], optional
+        Called with each directory path relative to ``path``. Directories for which it returns
+        True are not traversed.
+    match_filter: Callable[[re.Match], bool], optional
+        Called with each successful match of ``regex``. Files for which it returns False are
+        rejected before their match dictionary is built.
 
     Returns
     -------
@@ -109,32 +259,36 @@ def match_filepaths(
     ValueError
         If ``path`` does not point to a directory.
     """
-    path = Path(path)
-    if not path.is_dir():
-        raise ValueError(f'path must point to a directory, but points to a file (path = {path})')
+    return list(
+        iter_match_filepaths(
+            path=path, regex=regex, relative=relative, relative_anchor=relative_anchor,
+            prune=prune, match_filter=match_filter,
+        ),
+    )
 
-    if relative and relative_anchor is None:
-        relative_anchor = path
-
-    match_dicts: list[dict[str, str]] = []
-    for childpath in path.iterdir():
-        if childpath.is_dir():
-            recursive_results = match_filepaths(
-                path=childpath, regex=regex,
-                relative=relative, relative_anchor=relative_anchor,
-            )
-            match_dicts.extend(recursive_results)
-        else:
-            match = regex.match(childpath.name)
-            if match is not None:
-                match_dict = match.groupdict()
-
-                filepath = childpath
-                if relative:
-                    # mypy is unaware that 'relative_anchor' can never be None (l.116)
-                    assert relative_anchor is not None
-                    filepath = filepath.relative_to(relative_anchor)
-
-                match_dict['filepath'] = str(filepath)
-                match_dicts.append(match_dict)
-    return match_dicts
+
+def create_temporary_file(dirpath: str | Path, prefix: str = '') -> Path:
+    """Create an empty temporary file in a directory.
+
+    In contrast to :py:func:`tempfile.mkstemp`, which always creates files only accessible by the
+    owner, the file is created with the permissions of a regular file as determined by the umask
+    of the process. Renaming the file to its final destination therefore results in the same
+    permissions as writing the destination directly.
+
+    Parameters
+    ----------
+    dirpath: str | Path
+        Directory to create the file in.
+    prefix: str
+        Prefix of the filename.
+
+    Returns
+    -------
+    Path
+        Path to the created file. The filename ends with ``.tmp``.
+    """
+    filepath = Path(dirpath) / f'{prefix}{uuid.uuid4().hex}.tmp'
+    # O_EXCL guarantees that no existing file is reused.
+    file_descriptor = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    os.close(file_descriptor)
+    return filepath
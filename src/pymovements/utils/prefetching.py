@@ -0,0 +1,149 @@
+# Copyright (c) 2023 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Utils module for overlapping reading of files with their processing.
+"""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+_T = TypeVar('_T')
+
+
+class Prefetcher(Generic[_T]):
+    """Iterator applying a function to items in background threads ahead of the consumer.
+
+    While the consumer processes the current result, the results of the next `depth` items are
+    computed by worker threads. No further items are started until the consumer advances, so at most
+    ``depth + 1`` results are held in memory while the consumer processes a result. While advancing,
+    the consumer usually still references its previous result, so up to ``depth + 2`` results can be
+    alive for the duration of the call. Results are returned in the order of the items.
+
+    Polars releases the GIL while reading and parsing files, so reading the next files overlaps with
+    processing the current one.
+
+    Attributes
+    ----------
+    depth : int
+        Number of items processed ahead of the consumer.
+    num_workers : int
+        Number of worker threads.
+
+    Examples
+    --------
+    >>> with Prefetcher(lambda item: item ** 2, range(5), depth=2) as results:
+    ...     list(results)
+    [0, 1, 4, 9, 16]
+    """
+
+    def __init__(
+            self,
+            function: Callable[[Any], _T],
+            items: Iterable[Any],
+            depth: int = 1,
+            num_workers: int = 1,
+    ):
+        """Initialize prefetcher. No items are processed before the first result is requested.
+
+        Parameters
+        ----------
+        function : Callable[[Any], Any]
+            Function to be applied on each item.
+        items : Iterable[Any]
+            Items to apply the function on.
+        depth : int
+            Number of items processed ahead of the consumer. Default: 1
+        num_workers : int
+            Number of worker threads. More than one worker only pays off if ``depth`` is larger than
+            one. Default: 1
+
+        Raises
+        ------
+        ValueError
+            If `depth` or `num_workers` is smaller than one.
+        """
+        if depth < 1:
+            raise ValueError(f'depth must be at least 1 but is {depth}')
+        if num_workers < 1:
+            raise ValueError(f'num_workers must be at least 1 but is {num_workers}')
+
+        self.depth = depth
+        self.num_workers = num_workers
+
+        self._function = function
+        self._items = iter(items)
+        self._pending: deque[Future[_T]] = deque()
+        self._executor: ThreadPoolExecutor | None = None
+        self._is_closed = False
+
+    def __iter__(self) -> Prefetcher[_T]:
+        return self
+
+    def __next__(self) -> _T:
+        if self._is_closed:
+            raise StopIteration
+
+        self._fill()
+        if not self._pending:
+            self.close()
+            raise StopIteration
+
+        future = self._pending.popleft()
+        # Start the next item before waiting, so that the queue stays full.
+        self._fill()
+        try:
+            return future.result()
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> Prefetcher[_T]:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop prefetching. Pending items are cancelled and worker threads are joined."""
+        self._is_closed = True
+        while self._pending:
+            self._pending.popleft().cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _fill(self) -> None:
+        """Submit items until `depth` items are pending."""
+        while len(self._pending) < self.depth:
+            try:
+                item = next(self._items)
+            except StopIteration:
+                return
+
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.num_workers)
+            self._pending.append(self._executor.submit(self._function, item))
@@ -0,0 +1,313 @@
+# Copyright (c) 2023 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Utils module for measuring wall time, throughput and peak memory of processing stages.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # The resource module is not available on Windows.
+    resource = None  # type: ignore
+
+
+def get_peak_memory() -> int | None:
+    """Get the peak resident set size of the current process.
+
+    On Linux, the peak is reset at the start of each measurement of a :py:class:`Profiler`.
+
+    Returns
+    -------
+    int | None
+        Peak resident set size in bytes, or None if it is not available on this platform.
+    """
+    if resource is None:  # pragma: no cover
+        return None
+
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kibibytes, macOS reports bytes.
+    if sys.platform != 'darwin':
+        peak_memory *= 1024
+    return peak_memory
+
+
+def _reset_peak_memory() -> bool:
+    """Reset the peak resident set size of the current process to its current resident set size.
+
+    Returns
+    -------
+    bool
+        Whether the peak has been reset. Resetting is only supported on Linux.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w', encoding='ascii') as clear_refs_file:
+            clear_refs_file.write('5')
+    except OSError:
+        return False
+    return True
+
+
+def _get_memory_status() -> tuple[int, int] | None:
+    """Get the current and the peak resident set size of the current process since the last reset.
+
+    Returns
+    -------
+    tuple[int, int] | None
+        Current and peak resident set size in bytes, or None if they are not available.
+    """
+    status = {}
+    try:
+        with open('/proc/self/status', encoding='ascii') as status_file:
+            for line in status_file:
+                key, _, value = line.partition(':')
+                if key in {'VmRSS', 'VmHWM'}:
+                    status[key] = int(value.split()[0]) * 1024
+    except OSError:
+        return None
+
+    if len(status) < 2:
+        return None
+    return status['VmRSS'], status['VmHWM']
+
+
+class Profiler:
+    """Records wall time, throughput and peak memory of processing stages.
+
+    Each measurement refers to a single stage and optionally a single file. Measurements can be
+    recorded concurrently from multiple threads.
+
+    The peak memory of a measurement is the largest increase of the resident set size of the
+    process over its value at the start of the measurement. It covers memory allocated by polars
+    and numpy as well as by Python objects. The resident set size is shared by all threads, so the
+    peak memory of concurrent measurements includes the memory of the overlapping measurements.
+    It is measured by resetting the peak resident set size of the process at the start of each
+    measurement, which is only supported on Linux. On other platforms, no peak memory is recorded.
+
+    Attributes
+    ----------
+    records : list[dict[str, Any]]
+        Recorded measurements in the order of their completion.
+
+    Examples
+    --------
+    >>> profiler = Profiler()
+    >>> with profiler.measure('stage', filepath='a.csv') as values:
+    ...     values['num_samples'] = 1000
+    >>> profiler.to_frame().select(['stage', 'filepath', 'num_samples'])
+    shape: (1, 3)
+    ┌───────┬──────────┬─────────────┐
+    │ stage ┆ filepath ┆ num_samples │
+    │ ---   ┆ ---      ┆ ---         │
+    │ str   ┆ str      ┆ i64         │
+    ╞═══════╪══════════╪═════════════╡
+    │ stage ┆ a.csv    ┆ 1000        │
+    └───────┴──────────┴─────────────┘
+    """
+
+    schema = {
+        'stage': pl.Utf8,
+        'filepath': pl.Utf8,
+        'wall_time': pl.Float64,
+        'num_samples': pl.Int64,
+        'samples_per_second': pl.Float64,
+        'bytes_read': pl.Int64,
+        'bytes_written': pl.Int64,
+        'peak_memory': pl.Int64,
+    }
+
+    def __init__(self) -> None:
+        """Initialize profiler without any measurements."""
+        self.records: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+        # Start time, start memory and peak memory so far of the started measurements by their id.
+        self._started_measurements: dict[int, tuple[float, int | None, int | None]] = {}
+        self._next_measurement_id = 0
+
+    def record(
+            self,
+            stage: str,
+            wall_time: float,
+            filepath: str | Path | None = None,
+            num_samples: int | None = None,
+            bytes_read: int | None = None,
+            bytes_written: int | None = None,
+            peak_memory: int | None = None,
+    ) -> None:
+        """Record a measurement.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the processing stage.
+        wall_time : float
+            Elapsed wall time in seconds.
+        filepath : str | Path, optional
+            File the measurement refers to.
+        num_samples : int, optional
+            Number of processed gaze samples.
+        bytes_read : int, optional
+            Number of bytes read from disk.
+        bytes_written : int, optional
+            Number of bytes written to disk.
+        peak_memory : int, optional
+            Peak memory of the stage in bytes.
+        """
+        record = {
+            'stage': stage,
+            'filepath': None if filepath is None else str(filepath),
+            'wall_time': wall_time,
+            'num_samples': num_samples,
+            'bytes_read': bytes_read,
+            'bytes_written': bytes_written,
+            'peak_memory': peak_memory,
+        }
+        with self._lock:
+            self.records.append(record)
+
+    def start(self) -> int:
+        """Start a measurement.
+
+        The measurement is recorded by passing the returned id to :py:meth:`stop`. Measurements
+        which are never stopped are not recorded.
+
+        Returns
+        -------
+        int
+            Id of the started measurement.
+        """
+        with self._lock:
+            # The peak of the running measurements has to be kept before it is reset.
+            memory_status = _get_memory_status()
+            if memory_status is not None:
+                for measurement_id, measurement in self._started_measurements.items():
+                    start_time, start_memory, peak_memory = measurement
+                    if peak_memory is not None:
+                        peak_memory = max(peak_memory, memory_status[1])
+                    self._started_measurements[measurement_id] = (
+                        start_time, start_memory, peak_memory,
+                    )
+
+            start_memory = None
+            if _reset_peak_memory():
+                memory_status = _get_memory_status()
+                if memory_status is not None:
+                    start_memory = memory_status[0]
+
+            measurement_id = self._next_measurement_id
+            self._next_measurement_id += 1
+            self._started_measurements[measurement_id] = (
+                time.perf_counter(), start_memory, start_memory,
+            )
+        return measurement_id
+
+    def stop(
+            self,
+            measurement_id: int,
+            stage: str,
+            filepath: str | Path | None = None,
+            **values: Any,
+    ) -> None:
+        """Stop and record a measurement started with :py:meth:`start`.
+
+        Parameters
+        ----------
+        measurement_id : int
+            Id of the measurement as returned by :py:meth:`start`.
+        stage : str
+            Name of the processing stage.
+        filepath : str | Path, optional
+            File the measurement refers to.
+        **values
+            Additional values passed to :py:meth:`record`.
+        """
+        end_time = time.perf_counter()
+        with self._lock:
+            start_time, start_memory, peak_memory = self._started_measurements.pop(measurement_id)
+            memory_status = _get_memory_status()
+
+        if start_memory is None or peak_memory is None or memory_status is None:
+            values['peak_memory'] = None
+        else:
+            values['peak_memory'] = max(peak_memory, memory_status[1]) - start_memory
+
+        self.record(stage, wall_time=end_time - start_time, filepath=filepath, **values)
+
+    @contextmanager
+    def measure(self, stage: str, filepath: str | Path | None = None) -> Iterator[dict[str, Any]]:
+        """Measure the wall time and peak memory of the enclosed block.
+
+        The measurement is only recorded if the block completes without an exception.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the processing stage.
+        filepath : str | Path, optional
+            File the measurement refers to.
+
+        Yields
+        ------
+        dict[str, Any]
+            Additional values of the measurement. The block can set ``num_samples``,
+            ``bytes_read`` and ``bytes_written``.
+        """
+        values: dict[str, Any] = {}
+        measurement_id = self.start()
+        try:
+            yield values
+        except BaseException:
+            with self._lock:
+                del self._started_measurements[measurement_id]
+            raise
+        self.stop(measurement_id, stage, filepath=filepath, **values)
+
+    def to_frame(self) -> pl.DataFrame:
+        """Export the measurements as a dataframe.
+
+        Returns
+        -------
+        pl.DataFrame
+            One row per measurement with the columns ``stage``, ``filepath``, ``wall_time`` (in
+            seconds), ``num_samples``, ``samples_per_second``, ``bytes_read``, ``bytes_written``
+            and ``peak_memory`` (in bytes).
+        """
+        schema = {
+            column: dtype for column, dtype in self.schema.items()
+            if column != 'samples_per_second'
+        }
+        frame = pl.DataFrame(
+            {column: [record[column] for record in self.records] for column in schema},
+            schema=schema,
+        )
+        return frame.with_columns(
+            (pl.col('num_samples') / pl.col('wall_time')).alias('samples_per_second'),
+        ).select(list(self.schema))
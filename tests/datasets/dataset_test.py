@@ -20,6 +20,7 @@
 """Test all functionality in pymovements.datasets.dataset."""
 import os
 import shutil
+import sys
 import unittest
 from pathlib import Path
 
@@ -34,6 +35,7 @@ from pymovements.events.detection.engbert import microsaccades
 from pymovements.events.detection.ivt import ivt
 from pymovements.events.events import EventDataFrame
 from pymovements.gaze.experiment import Experiment
+from pymovements.utils.cache import StageCache
 
 
 def create_raw_gaze_files_from_fileinfo(gaze_dfs, fileinfo, rootpath):
@@ -303,6 +305,166 @@ def test_load_correct_event_dfs(dataset_configuration):
         assert_frame_equal(result_event_df.frame, expected_event_df)
 
 
+@pytest.mark.parametrize('num_workers', [2, 4])
+def test_load_num_workers_keeps_order(num_workers, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load(events=True, preprocessed=True, num_workers=num_workers)
+
+    expected_gaze_dfs = dataset_configuration['preprocessed_gaze_dfs']
+    for result_gaze_df, expected_gaze_df in zip(dataset.gaze, expected_gaze_dfs):
+        assert_frame_equal(result_gaze_df.frame, expected_gaze_df)
+
+    expected_event_dfs = dataset_configuration['event_dfs']
+    for result_event_df, expected_event_df in zip(dataset.events, expected_event_dfs):
+        assert_frame_equal(result_event_df.frame, expected_event_df)
+
+
+@pytest.mark.parametrize('preprocessed', [False, True])
+def test_load_lazy_gaze_dfs(preprocessed, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load(preprocessed=preprocessed, lazy=True)
+
+    assert all(gaze_df.is_lazy for gaze_df in dataset.gaze)
+
+    dataset.collect()
+
+    if preprocessed:
+        expected_gaze_dfs = dataset_configuration['preprocessed_gaze_dfs']
+    else:
+        expected_gaze_dfs = dataset_configuration['raw_gaze_dfs']
+    for result_gaze_df, expected_gaze_df in zip(dataset.gaze, expected_gaze_dfs):
+        assert not result_gaze_df.is_lazy
+        assert_frame_equal(result_gaze_df.frame, expected_gaze_df)
+
+
+def test_lazy_pipeline_equals_eager_pipeline(dataset_configuration):
+    eager_dataset = Dataset(**dataset_configuration['init_kwargs'])
+    eager_dataset.load()
+    eager_dataset.pix2deg()
+    eager_dataset.pos2vel()
+    eager_dataset.detect_events(method=microsaccades, threshold=1)
+
+    lazy_dataset = Dataset(**dataset_configuration['init_kwargs'])
+    lazy_dataset.load(lazy=True)
+    lazy_dataset.pix2deg()
+    lazy_dataset.pos2vel()
+    lazy_dataset.detect_events(method=microsaccades, threshold=1)
+
+    for lazy_event_df, eager_event_df in zip(lazy_dataset.events, eager_dataset.events):
+        assert_frame_equal(lazy_event_df.frame, eager_event_df.frame)
+
+    lazy_dataset.save_preprocessed(preprocessed_dirname='preprocessed_lazy')
+    lazy_dataset.load(preprocessed=True, preprocessed_dirname='preprocessed_lazy')
+
+    for lazy_gaze_df, eager_gaze_df in zip(lazy_dataset.gaze, eager_dataset.gaze):
+        assert_frame_equal(lazy_gaze_df.frame, eager_gaze_df.frame, check_column_order=False)
+
+
+def test_infer_fileinfo_index_is_reused(dataset_configuration, monkeypatch):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load(fileinfo_index=True)
+    assert (dataset.path / '.pymovements' / 'fileinfo.feather').is_file()
+
+    def match_filepaths_mock(*args, **kwargs):
+        raise AssertionError('raw directory must not be traversed with a valid index')
+
+    monkeypatch.setattr('pymovements.datasets.dataset.match_filepaths', match_filepaths_mock)
+
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load(fileinfo_index=True)
+
+    assert_frame_equal(dataset.fileinfo, dataset_configuration['fileinfo'])
+
+
+@pytest.mark.parametrize(
+    'modification',
+    [
+        pytest.param('add_file', id='add_file'),
+        pytest.param('remove_file', id='remove_file'),
+        pytest.param('add_nested_file', id='add_nested_file'),
+        pytest.param('change_regex', id='change_regex'),
+    ],
+)
+def test_infer_fileinfo_index_is_invalidated(modification, dataset_configuration):
+    init_kwargs = dataset_configuration['init_kwargs']
+    dataset = Dataset(**init_kwargs)
+    nested_dirpath = dataset.raw_rootpath / 'nested'
+    nested_dirpath.mkdir()
+    dataset.infer_fileinfo(fileinfo_index=True)
+
+    # Make sure that the modification results in a new mtime on coarse-grained filesystems.
+    mtime = os.stat(dataset.raw_rootpath).st_mtime_ns
+
+    expected_filepaths = dataset_configuration['fileinfo']['filepath'].to_list()
+    if modification == 'add_file':
+        shutil.copy(dataset.raw_rootpath / '1.csv', dataset.raw_rootpath / '21.csv')
+        expected_filepaths = sorted([*expected_filepaths, '21.csv'])
+    elif modification == 'remove_file':
+        (dataset.raw_rootpath / '1.csv').unlink()
+        expected_filepaths.remove('1.csv')
+    elif modification == 'add_nested_file':
+        shutil.copy(dataset.raw_rootpath / '1.csv', nested_dirpath / '21.csv')
+        expected_filepaths = sorted([*expected_filepaths, str(Path('nested') / '21.csv')])
+    elif modification == 'change_regex':
+        init_kwargs = {**init_kwargs, 'filename_regex': r'(?P<subject_id>1\d*).csv'}
+        expected_filepaths = [filepath for filepath in expected_filepaths if filepath[0] == '1']
+
+    os.utime(dataset.raw_rootpath, ns=(mtime + 1, mtime + 1))
+    os.utime(nested_dirpath, ns=(mtime + 1, mtime + 1))
+
+    dataset = Dataset(**init_kwargs)
+    fileinfo = dataset.infer_fileinfo(fileinfo_index=True)
+
+    assert fileinfo['filepath'].to_list() == expected_filepaths
+
+
+def test_infer_fileinfo_index_in_raw_directory(dataset_configuration):
+    init_kwargs = {**dataset_configuration['init_kwargs'], 'raw_dirname': '.'}
+    shutil.rmtree(init_kwargs['root'] / 'preprocessed')
+    shutil.rmtree(init_kwargs['root'] / 'events')
+    for filepath in (init_kwargs['root'] / 'raw').iterdir():
+        shutil.move(filepath, init_kwargs['root'] / filepath.name)
+
+    dataset = Dataset(**init_kwargs)
+    first_fileinfo = dataset.infer_fileinfo(fileinfo_index=True)
+    second_fileinfo = dataset.infer_fileinfo(fileinfo_index=True)
+
+    assert_frame_equal(first_fileinfo, second_fileinfo)
+    assert '.pymovements' not in ''.join(second_fileinfo['filepath'].to_list())
+
+
+def test_infer_fileinfo_index_skips_output_directories(dataset_configuration, monkeypatch):
+    init_kwargs = {**dataset_configuration['init_kwargs'], 'raw_dirname': '.'}
+    shutil.rmtree(init_kwargs['root'] / 'preprocessed')
+    shutil.rmtree(init_kwargs['root'] / 'events')
+    for filepath in (init_kwargs['root'] / 'raw').iterdir():
+        shutil.move(filepath, init_kwargs['root'] / filepath.name)
+
+    dataset = Dataset(**init_kwargs)
+    dataset.load(fileinfo_index=True)
+    expected_fileinfo = dataset.fileinfo
+    dataset.pix2deg()
+    dataset.pos2vel()
+    dataset.detect_events(microsaccades, threshold=1)
+
+    # Creating the output directories changes the mtime of the raw data directory once.
+    dataset.save_preprocessed(extension='csv')
+    dataset.save_events(extension='csv')
+    dataset.infer_fileinfo(fileinfo_index=True)
+
+    dataset.save_preprocessed(extension='csv')
+    dataset.save_events(extension='csv')
+
+    def match_filepaths_mock(*args, **kwargs):
+        raise AssertionError('raw directory must not be traversed with a valid index')
+
+    monkeypatch.setattr('pymovements.datasets.dataset.match_filepaths', match_filepaths_mock)
+
+    fileinfo = Dataset(**init_kwargs).infer_fileinfo(fileinfo_index=True)
+
+    assert_frame_equal(fileinfo, expected_fileinfo)
+
+
 @pytest.mark.parametrize(
     'subset, fileinfo_idx',
     [
@@ -328,6 +490,246 @@ def test_load_subset(subset, fileinfo_idx, dataset_configuration):
     assert_frame_equal(dataset.fileinfo, expected_fileinfo)
 
 
+@pytest.mark.parametrize('extension', ['csv', 'feather', 'parquet'])
+@pytest.mark.parametrize(
+    'lazy, predicate',
+    [
+        pytest.param(False, False, id='eager'),
+        pytest.param(True, False, id='lazy'),
+        pytest.param(False, True, id='predicate_other_column'),
+    ],
+)
+def test_load_preprocessed_columns(extension, lazy, predicate, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+    dataset.pix2deg()
+    dataset.pos2vel()
+
+    shutil.rmtree(dataset.preprocessed_rootpath, ignore_errors=True)
+    dataset.save_preprocessed(verbose=0, extension=extension)
+
+    columns = ['time', dataset.gaze[0].position_columns[0], 'subject_id']
+    # The predicate refers to a column which is not part of the projection.
+    predicate_expr = None
+    if predicate:
+        predicate_expr = pl.col(dataset.gaze[0].velocity_columns[0]).is_not_null()
+    expected_gaze_dfs = [
+        gaze_df.frame.filter(pl.lit(True) if predicate_expr is None else predicate_expr)
+        .select(columns)
+        for gaze_df in dataset.gaze
+    ]
+
+    dataset.load(
+        preprocessed=True, extension=extension, columns=columns, lazy=lazy,
+        predicate=predicate_expr,
+    )
+    dataset.collect()
+
+    for result_gaze_df, expected_gaze_df in zip(dataset.gaze, expected_gaze_dfs):
+        assert_frame_equal(result_gaze_df.frame, expected_gaze_df)
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_load_raw_columns_renamed(lazy, dataset_configuration):
+    init_kwargs = {
+        **dataset_configuration['init_kwargs'],
+        'custom_read_kwargs': {'columns': ['time'], 'new_columns': ['timestamp']},
+    }
+    dataset = Dataset(**init_kwargs)
+    dataset.load(columns=['subject_id', 'timestamp'], lazy=lazy)
+    dataset.collect()
+
+    for result_gaze_df, raw_gaze_df in zip(dataset.gaze, dataset_configuration['raw_gaze_dfs']):
+        assert result_gaze_df.frame.columns == ['subject_id', 'timestamp']
+        assert result_gaze_df.frame['timestamp'].to_list() == raw_gaze_df['time'].to_list()
+
+
+def test_load_raw_columns_renamed_unknown_column(dataset_configuration):
+    init_kwargs = {
+        **dataset_configuration['init_kwargs'],
+        'custom_read_kwargs': {'columns': ['time'], 'new_columns': ['timestamp']},
+    }
+    dataset = Dataset(**init_kwargs)
+
+    with pytest.raises(ValueError) as excinfo:
+        dataset.load(columns=['time'])
+    msg, = excinfo.value.args
+    assert msg == "column time is not available. Available columns are: ['timestamp']"
+
+
+def test_load_event_files_columns(dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load(events=True, event_columns=['subject_id', 'name', 'onset', 'offset'])
+
+    for result_event_df, expected_event_df in zip(
+            dataset.events, dataset_configuration['event_dfs'],
+    ):
+        assert_frame_equal(
+            result_event_df.frame.select(['subject_id', 'name', 'onset', 'offset']),
+            expected_event_df.select(['subject_id', 'name', 'onset', 'offset']),
+        )
+
+
+@pytest.mark.parametrize('batch_size', [100, 1000, 5000])
+def test_iter_gaze_batches(batch_size, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    batches = list(dataset.iter_gaze_batches(batch_size=batch_size))
+
+    dataset.load()
+
+    for batch in batches:
+        assert 0 < len(batch.frame) <= batch_size
+        assert batch.experiment is dataset.experiment
+
+    batch_subject_ids = [batch.frame['subject_id'][0] for batch in batches]
+    file_subject_ids = [
+        subject_id for i, subject_id in enumerate(batch_subject_ids)
+        if i == 0 or subject_id != batch_subject_ids[i - 1]
+    ]
+    assert file_subject_ids == dataset.fileinfo['subject_id'].to_list()
+
+    result_gaze_df = pl.concat([batch.frame for batch in batches])
+    expected_gaze_df = pl.concat([gaze_df.frame for gaze_df in dataset.gaze])
+    assert_frame_equal(result_gaze_df, expected_gaze_df)
+
+
+def test_iter_gaze_batches_uses_fileinfo_subset(dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.fileinfo = dataset.take_subset(dataset.infer_fileinfo(), subset={'subject_id': [2, 3]})
+
+    subject_ids = {
+        subject_id
+        for batch in dataset.iter_gaze_batches(batch_size=300)
+        for subject_id in batch.frame['subject_id'].unique().to_list()
+    }
+    assert subject_ids == {2, 3}
+
+
+def test_iter_gaze_batches_exceptions(dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+
+    with pytest.raises(ValueError) as excinfo:
+        next(dataset.iter_gaze_batches(batch_size=0))
+    msg, = excinfo.value.args
+    assert msg == 'batch_size must be at least 1 but is 0'
+
+
+@pytest.mark.parametrize(
+    ('prefetch', 'num_workers'),
+    [
+        pytest.param(0, 1, id='no_prefetch'),
+        pytest.param(1, 1, id='prefetch_1'),
+        pytest.param(3, 1, id='prefetch_3'),
+        pytest.param(3, 2, id='prefetch_3_two_workers'),
+    ],
+)
+def test_iter_gaze(prefetch, num_workers, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    items = list(dataset.iter_gaze(prefetch=prefetch, num_workers=num_workers))
+
+    assert dataset.gaze == []
+    assert [fileinfo for fileinfo, _ in items] == dataset_configuration['fileinfo'].to_dicts()
+    for (_, result_gaze_df), expected_gaze_df in zip(
+            items, dataset_configuration['raw_gaze_dfs'],
+    ):
+        assert_frame_equal(result_gaze_df.frame, expected_gaze_df)
+
+
+@pytest.mark.parametrize('prefetch', [0, 2])
+def test_iter_events(prefetch, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    items = list(dataset.iter_events(prefetch=prefetch))
+
+    assert dataset.events == []
+    assert [fileinfo for fileinfo, _ in items] == dataset_configuration['fileinfo'].to_dicts()
+    for (_, result_event_df), expected_event_df in zip(items, dataset_configuration['event_dfs']):
+        assert_frame_equal(result_event_df.frame, expected_event_df)
+
+
+def test_iter_gaze_preprocessed_columns(dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    fileinfo, gaze_df = next(dataset.iter_gaze(preprocessed=True, columns=['subject_id', 'time']))
+
+    assert gaze_df.columns == ['subject_id', 'time']
+    assert gaze_df.frame['subject_id'][0] == fileinfo['subject_id']
+
+
+@pytest.mark.parametrize('prefetch', [1, 3])
+def test_iter_gaze_prefetch_stays_bounded(prefetch, dataset_configuration, monkeypatch):
+    load_gaze_file = Dataset._load_gaze_file
+    num_loaded_files = 0
+
+    def counting_load_gaze_file(self, fileinfo, **kwargs):
+        nonlocal num_loaded_files
+        num_loaded_files += 1
+        return load_gaze_file(self, fileinfo, **kwargs)
+
+    monkeypatch.setattr(Dataset, '_load_gaze_file', counting_load_gaze_file)
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    items = dataset.iter_gaze(prefetch=prefetch)
+
+    next(items)
+    items.close()
+
+    assert num_loaded_files <= prefetch + 1
+
+
+def test_iter_gaze_exceptions(dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+
+    with pytest.raises(ValueError) as excinfo:
+        dataset.iter_gaze(prefetch=-1)
+    msg, = excinfo.value.args
+    assert msg == 'prefetch must not be negative but is -1'
+
+    with pytest.raises(ValueError) as excinfo:
+        dataset.iter_gaze(prefetch=1, num_workers=0)
+    msg, = excinfo.value.args
+    assert msg == 'num_workers must be at least 1 but is 0'
+
+
+@pytest.mark.parametrize(
+    'subset, expected_subject_ids',
+    [
+        pytest.param({'subject_id': 1}, [1], id='single_value'),
+        pytest.param({'subject_id': [1, 11, 12]}, [1, 11, 12], id='list_of_values'),
+        pytest.param({'subject_id': [1.0, 2.0]}, [1, 2], id='float_values_int_dtype'),
+        pytest.param({'subject_id': 100}, [], id='no_matching_value'),
+    ],
+)
+def test_infer_fileinfo_subset_pushdown(subset, expected_subject_ids, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    fileinfo = dataset.infer_fileinfo(subset=subset)
+
+    assert fileinfo.schema == dataset_configuration['fileinfo'].schema
+    assert fileinfo['subject_id'].to_list() == expected_subject_ids
+
+
+def test_infer_fileinfo_subset_pushdown_prunes_directories(dataset_configuration, monkeypatch):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    for filepath in list(dataset.raw_rootpath.iterdir()):
+        subject_dirpath = dataset.raw_rootpath / f'subject_id={filepath.stem}'
+        subject_dirpath.mkdir()
+        shutil.move(filepath, subject_dirpath / filepath.name)
+
+    scanned_dirpaths = []
+    scandir = os.scandir
+
+    def scandir_spy(path):
+        scanned_dirpaths.append(Path(path).name)
+        return scandir(path)
+
+    monkeypatch.setattr('pymovements.utils.paths.os.scandir', scandir_spy)
+
+    dataset.load(subset={'subject_id': [1, 2]})
+
+    assert dataset.fileinfo['subject_id'].to_list() == [1, 2]
+    assert dataset.fileinfo['filepath'].to_list() == [
+        str(Path('subject_id=1/1.csv')), str(Path('subject_id=2/2.csv')),
+    ]
+    assert sorted(scanned_dirpaths) == ['raw', 'subject_id=1', 'subject_id=2']
+
+
 @pytest.mark.parametrize(
     'init_kwargs, exception',
     [
@@ -375,6 +777,12 @@ def test_init_exceptions(init_kwargs, exception):
             TypeError,
             id='subset_value_invalid_type',
         ),
+        pytest.param(
+            {},
+            {'num_workers': 0},
+            ValueError,
+            id='num_workers_zero',
+        ),
     ],
 )
 def test_load_exceptions(init_kwargs, load_kwargs, exception, dataset_configuration):
@@ -508,6 +916,23 @@ def test_pix2deg(dataset_configuration):
         assert result_gaze_df.schema == expected_schema
 
 
+@pytest.mark.parametrize('method', ['exact', 'lookup', 'interpolate'])
+def test_pix2deg_method(method, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+    dataset.pix2deg(method=method)
+
+    screen = dataset.experiment.screen
+    for result_gaze_df in dataset.gaze:
+        pix_columns = result_gaze_df.pixel_position_columns
+        dva_columns = [column.replace('_pix', '_pos') for column in pix_columns]
+        pixel_positions = result_gaze_df.frame.select(pix_columns).to_numpy()
+        expected = screen.pix2deg(pixel_positions, method=method)
+        np.testing.assert_allclose(
+            result_gaze_df.frame.select(dva_columns).to_numpy(), expected, rtol=1e-12, atol=1e-12,
+        )
+
+
 def test_pos2vel(dataset_configuration):
     dataset = Dataset(**dataset_configuration['init_kwargs'])
     dataset.load()
@@ -804,6 +1229,13 @@ def test_save_events(
             {'extension': 'csv'},
             id='load_events_extension_csv',
         ),
+        pytest.param(
+            {'method': microsaccades, 'threshold': 1, 'eye': 'auto'},
+            None,
+            'events',
+            {'extension': 'parquet'},
+            id='load_events_extension_parquet',
+        ),
     ],
 )
 def test_load_previously_saved_events_gaze(
@@ -868,6 +1300,103 @@ def test_save_preprocessed(preprocessed_dirname, expected_save_dirpath, dataset_
     )
 
 
+@pytest.mark.parametrize(
+    'save_kwargs',
+    [
+        pytest.param({'extension': 'feather', 'compression': 'lz4'}, id='feather_lz4'),
+        pytest.param({'extension': 'feather', 'compression': 'zstd'}, id='feather_zstd'),
+        pytest.param({'extension': 'parquet'}, id='parquet_default'),
+        pytest.param({'extension': 'parquet', 'compression': 'snappy'}, id='parquet_snappy'),
+        pytest.param({'extension': 'parquet', 'compression': 'lz4'}, id='parquet_lz4'),
+        pytest.param(
+            {'extension': 'parquet', 'compression': 'zstd', 'row_group_size': 100},
+            id='parquet_zstd_row_group_size',
+        ),
+    ],
+)
+def test_save_preprocessed_compression_roundtrip(save_kwargs, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+    dataset.pix2deg()
+    dataset.pos2vel()
+
+    shutil.rmtree(dataset.preprocessed_rootpath, ignore_errors=True)
+    dataset.save_preprocessed(verbose=0, **save_kwargs)
+
+    expected_gaze_dfs = [gaze_df.frame for gaze_df in dataset.gaze]
+
+    dataset.load(preprocessed=True, extension=save_kwargs['extension'])
+    for result_gaze_df, expected_gaze_df in zip(dataset.gaze, expected_gaze_dfs):
+        assert_frame_equal(result_gaze_df.frame, expected_gaze_df)
+
+
+@pytest.mark.parametrize(
+    'compression',
+    [
+        pytest.param('uncompressed', id='uncompressed'),
+        pytest.param('zstd', id='zstd'),
+    ],
+)
+@pytest.mark.parametrize('memory_map', [True, False])
+def test_load_preprocessed_memory_map(compression, memory_map, dataset_configuration, capfd):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load(events=True)
+    dataset.pix2deg()
+    dataset.pos2vel()
+
+    shutil.rmtree(dataset.preprocessed_rootpath, ignore_errors=True)
+    dataset.save_preprocessed(verbose=0, compression=compression)
+    expected_gaze_dfs = [gaze_df.frame for gaze_df in dataset.gaze]
+
+    capfd.readouterr()
+    dataset.load(preprocessed=True, memory_map=memory_map)
+
+    for result_gaze_df, expected_gaze_df in zip(dataset.gaze, expected_gaze_dfs):
+        assert_frame_equal(result_gaze_df.frame, expected_gaze_df)
+
+    if not memory_map:
+        assert 'mmap' not in capfd.readouterr().err
+
+
+@pytest.mark.parametrize('extension', ['csv', 'feather', 'parquet'])
+def test_load_preprocessed_with_predicate(extension, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+    dataset.pix2deg()
+    dataset.pos2vel()
+
+    shutil.rmtree(dataset.preprocessed_rootpath, ignore_errors=True)
+    dataset.save_preprocessed(verbose=0, extension=extension, row_group_size=100)
+
+    predicate = pl.col('time').is_between(250, 349, closed='both')
+    expected_gaze_dfs = [gaze_df.frame.filter(predicate) for gaze_df in dataset.gaze]
+
+    dataset.load(preprocessed=True, extension=extension, predicate=predicate)
+    for result_gaze_df, expected_gaze_df in zip(dataset.gaze, expected_gaze_dfs):
+        assert result_gaze_df.frame.height == 100
+        assert_frame_equal(result_gaze_df.frame, expected_gaze_df)
+
+
+@pytest.mark.parametrize('dataset_configuration', ['ToyBino'], indirect=['dataset_configuration'])
+def test_save_preprocessed_parquet_writes_statistics(dataset_configuration):
+    pq = pytest.importorskip('pyarrow.parquet')
+
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+
+    shutil.rmtree(dataset.preprocessed_rootpath, ignore_errors=True)
+    dataset.save_preprocessed(verbose=0, extension='parquet', row_group_size=250)
+
+    filepath = dataset.preprocessed_rootpath / '1.parquet'
+    metadata = pq.ParquetFile(filepath).metadata
+    assert metadata.num_row_groups == 4
+
+    time_column_id = metadata.schema.names.index('time')
+    statistics = metadata.row_group(1).column(time_column_id).statistics
+    assert statistics.has_min_max
+    assert (statistics.min, statistics.max) == (250, 499)
+
+
 @pytest.mark.parametrize(
     'expected_save_preprocessed_path, expected_save_events_path, save_kwargs',
     [
@@ -949,6 +1478,12 @@ def test_save_creates_correct_directory(
             {'extension': 'csv'},
             id='extension_equals_csv',
         ),
+        pytest.param(
+            'preprocessed',
+            'events',
+            {'extension': 'parquet'},
+            id='extension_equals_parquet',
+        ),
     ],
 )
 def test_save_files_have_correct_extension(
@@ -992,6 +1527,65 @@ def test_save_files_have_correct_extension(
     )
 
 
+@pytest.mark.parametrize('extension', ['csv', 'feather', 'parquet'])
+def test_save_load_partitioned(extension, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+    dataset.pix2deg()
+    dataset.pos2vel()
+
+    dataset.save_partitioned(preprocessed_dirname='partitioned', extension=extension, verbose=0)
+
+    assert (dataset.path / 'partitioned' / 'subject_id=12' / f'12.{extension}').is_file()
+
+    gaze_df = dataset.load_partitioned(preprocessed_dirname='partitioned', extension=extension)
+
+    expected_df = pl.concat([gaze_df.frame for gaze_df in dataset.gaze]).sort('subject_id')
+    assert_frame_equal(gaze_df.frame.sort('subject_id'), expected_df)
+
+
+@pytest.mark.parametrize(
+    'subset, expected_subject_ids',
+    [
+        pytest.param({'subject_id': 1}, [1], id='single_value'),
+        pytest.param({'subject_id': [1, 11, 12]}, [1, 11, 12], id='list_value'),
+    ],
+)
+def test_load_partitioned_subset(subset, expected_subject_ids, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+    dataset.save_partitioned(verbose=0)
+
+    # Partitions not in the subset must not be touched at all.
+    shutil.rmtree(dataset.preprocessed_rootpath / 'subject_id=2')
+
+    gaze_df = dataset.load_partitioned(subset=subset, lazy=True)
+    assert gaze_df.is_lazy
+
+    gaze_df.collect()
+    assert gaze_df.frame['subject_id'].unique().sort().to_list() == expected_subject_ids
+    assert gaze_df.frame.height == 1000 * len(expected_subject_ids)
+
+
+@pytest.mark.parametrize(
+    'save_kwargs, load_kwargs, exception',
+    [
+        pytest.param({'partition_by': 'unknown'}, None, ValueError, id='unknown_partition_by'),
+        pytest.param({}, {'subset': {'unknown': 1}}, ValueError, id='unknown_subset_key'),
+        pytest.param({}, {'subset': {1: 1}}, TypeError, id='subset_no_str_key'),
+        pytest.param({}, {'extension': 'invalid'}, ValueError, id='invalid_extension'),
+        pytest.param({}, {'extension': 'csv'}, RuntimeError, id='no_files'),
+    ],
+)
+def test_partitioned_exceptions(save_kwargs, load_kwargs, exception, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+
+    with pytest.raises(exception):
+        dataset.save_partitioned(verbose=0, **save_kwargs)
+        dataset.load_partitioned(**load_kwargs)
+
+
 @pytest.mark.parametrize(
     'init_kwargs, expected_paths',
     [
@@ -1220,3 +1814,644 @@ def test_event_dataframe_add_property_effect_property_columns(
 
     for events_df in dataset.events:
         assert events_df.event_property_columns == expected_property_columns
+
+
+def test_load_unified(dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load(events=True, unified=True)
+
+    assert len(dataset.gaze) == 1
+    assert len(dataset.events) == 1
+
+    gaze_frames = dataset.gaze[0].frame.partition_by('file_id', as_dict=True)
+    for file_id, expected_gaze_df in enumerate(dataset_configuration['raw_gaze_dfs']):
+        assert_frame_equal(gaze_frames[file_id].drop('file_id'), expected_gaze_df)
+
+    assert dataset.events[0].frame['file_id'].unique().sort().to_list() == list(range(20))
+
+
+def replace_raw_positions_by_random_walks(dataset_configuration):
+    # Replace constant positions by random walks to get detected events.
+    rng = np.random.default_rng(42)
+    raw_rootpath = dataset_configuration['init_kwargs']['root'] / 'raw'
+    for raw_filepath in raw_rootpath.glob('*.csv'):
+        raw_gaze_df = pl.read_csv(raw_filepath)
+        raw_gaze_df = raw_gaze_df.with_columns([
+            pl.Series(column, np.cumsum(rng.normal(scale=5, size=len(raw_gaze_df))))
+            for column in raw_gaze_df.columns if column.endswith('_pix')
+        ])
+        raw_gaze_df.write_csv(raw_filepath)
+
+
+def test_unified_pipeline_equals_per_file_pipeline(dataset_configuration):
+    replace_raw_positions_by_random_walks(dataset_configuration)
+
+    per_file_dataset = Dataset(**dataset_configuration['init_kwargs'])
+    per_file_dataset.load()
+    per_file_dataset.pix2deg()
+    per_file_dataset.pos2vel()
+    per_file_dataset.detect_events(method=microsaccades, threshold=1)
+    per_file_dataset.compute_event_properties('peak_velocity')
+
+    unified_dataset = Dataset(**dataset_configuration['init_kwargs'])
+    unified_dataset.load(unified=True)
+    unified_dataset.pix2deg()
+    unified_dataset.pos2vel()
+    unified_dataset.detect_events(method=microsaccades, threshold=1)
+    unified_dataset.compute_event_properties('peak_velocity')
+
+    expected_gaze_df = pl.concat([gaze_df.frame for gaze_df in per_file_dataset.gaze])
+    result_gaze_df = unified_dataset.gaze[0].frame.drop('file_id')
+    assert_frame_equal(result_gaze_df, expected_gaze_df)
+
+    event_columns = ['subject_id', 'name', 'onset', 'offset', 'duration', 'peak_velocity']
+    expected_event_df = pl.concat([event_df.frame for event_df in per_file_dataset.events])
+    result_event_df = unified_dataset.events[0].frame
+    assert len(result_event_df) > 0
+    assert_frame_equal(
+        result_event_df.select(event_columns).sort(['subject_id', 'onset']),
+        expected_event_df.select(event_columns).sort(['subject_id', 'onset']),
+    )
+
+
+@pytest.mark.parametrize('extension', ['csv', 'feather', 'parquet'])
+def test_save_unified_equals_save_per_file(extension, dataset_configuration):
+    datasets = {}
+    for unified in [False, True]:
+        dataset = Dataset(**dataset_configuration['init_kwargs'])
+        dataset.load(unified=unified)
+        dataset.pix2deg()
+        dataset.pos2vel()
+        dataset.detect_events(method=microsaccades, threshold=1)
+        dataset.save(
+            events_dirname=f'events_{unified}', preprocessed_dirname=f'preprocessed_{unified}',
+            verbose=0, extension=extension,
+        )
+
+        datasets[unified] = Dataset(**dataset_configuration['init_kwargs'])
+        datasets[unified].load(
+            events=True, preprocessed=True, events_dirname=f'events_{unified}',
+            preprocessed_dirname=f'preprocessed_{unified}', extension=extension,
+        )
+
+    assert len(datasets[True].gaze) == len(datasets[False].gaze) == 20
+    for result_gaze_df, expected_gaze_df in zip(datasets[True].gaze, datasets[False].gaze):
+        assert_frame_equal(result_gaze_df.frame, expected_gaze_df.frame)
+    for result_event_df, expected_event_df in zip(datasets[True].events, datasets[False].events):
+        assert_frame_equal(result_event_df.frame, expected_event_df.frame)
+
+
+@pytest.mark.parametrize('extension', ['csv', 'feather', 'parquet'])
+def test_save_parallel_equals_save_serial(extension, dataset_configuration):
+    datasets = {}
+    for num_workers in [1, 4]:
+        dataset = Dataset(**dataset_configuration['init_kwargs'])
+        dataset.load()
+        dataset.pix2deg()
+        dataset.pos2vel()
+        dataset.detect_events(method=microsaccades, threshold=1)
+        dataset.save(
+            events_dirname=f'events_{num_workers}',
+            preprocessed_dirname=f'preprocessed_{num_workers}',
+            verbose=0, extension=extension, num_workers=num_workers,
+        )
+
+        datasets[num_workers] = Dataset(**dataset_configuration['init_kwargs'])
+        datasets[num_workers].load(
+            events=True, preprocessed=True, events_dirname=f'events_{num_workers}',
+            preprocessed_dirname=f'preprocessed_{num_workers}', extension=extension,
+        )
+
+    assert len(datasets[4].gaze) == len(datasets[1].gaze) == 20
+    for result_gaze_df, expected_gaze_df in zip(datasets[4].gaze, datasets[1].gaze):
+        assert_frame_equal(result_gaze_df.frame, expected_gaze_df.frame)
+    for result_event_df, expected_event_df in zip(datasets[4].events, datasets[1].events):
+        assert_frame_equal(result_event_df.frame, expected_event_df.frame)
+    assert not list(datasets[4].path.rglob('*.tmp'))
+
+
+def test_save_preprocessed_failed_write_keeps_existing_file(dataset_configuration, monkeypatch):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+    dataset.save_preprocessed(verbose=0)
+    filepaths = sorted(dataset.preprocessed_rootpath.rglob('*.feather'))
+    expected_contents = [filepath.read_bytes() for filepath in filepaths]
+
+    def write_ipc(self, file, **kwargs):
+        Path(file).write_bytes(b'truncated')
+        raise OSError('disk full')
+
+    monkeypatch.setattr(pl.DataFrame, 'write_ipc', write_ipc)
+    dataset.pix2deg()
+    with pytest.raises(OSError, match='disk full'):
+        dataset.save_preprocessed(verbose=0, num_workers=4)
+
+    assert [filepath.read_bytes() for filepath in filepaths] == expected_contents
+    assert not list(dataset.preprocessed_rootpath.rglob('*.tmp'))
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='file modes are not supported on windows')
+@pytest.mark.parametrize('extension', ['csv', 'feather', 'parquet'])
+def test_save_file_mode_follows_umask(extension, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+    dataset.pix2deg()
+    dataset.pos2vel()
+    dataset.detect_events(method=microsaccades, threshold=1)
+
+    previous_umask = os.umask(0o022)
+    try:
+        dataset.save(verbose=0, extension=extension, num_workers=2)
+        dataset.save_partitioned(
+            'partitioned', partition_by=['subject_id'], verbose=0, extension=extension,
+        )
+    finally:
+        os.umask(previous_umask)
+
+    filepaths = [
+        *dataset.preprocessed_rootpath.rglob(f'*.{extension}'),
+        *dataset.events_rootpath.rglob(f'*.{extension}'),
+        *(dataset.path / 'partitioned').rglob(f'*.{extension}'),
+    ]
+    assert len(filepaths) == 60
+    assert {os.stat(filepath).st_mode & 0o777 for filepath in filepaths} == {0o644}
+
+
+def test_save_preprocessed_num_workers_raises_value_error(dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+
+    with pytest.raises(ValueError, match='num_workers must be at least 1'):
+        dataset.save_preprocessed(verbose=0, num_workers=0)
+
+
+def test_save_preprocessed_verbose_prints_throughput(dataset_configuration, capsys):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+    dataset.save_preprocessed(verbose=2, num_workers=2)
+
+    stdout = capsys.readouterr().out
+    assert stdout.count('Save file to') == 20
+    assert 'Saved 20 files (' in stdout
+    assert 'MiB/s)' in stdout
+
+
+def run_incremental_pipeline(dataset_configuration, method='smooth', save_events=True):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load(incremental=True)
+    dataset.pix2deg(verbose=False)
+    dataset.pos2vel(method=method, verbose=False)
+    dataset.detect_events(method=microsaccades, threshold=1, verbose=False)
+    if save_events:
+        dataset.save(verbose=0)
+    else:
+        dataset.save_preprocessed(verbose=0)
+    return dataset
+
+
+def get_output_mtimes(dataset):
+    return {
+        filepath: filepath.stat().st_mtime_ns
+        for dirpath in [dataset.preprocessed_rootpath, dataset.events_rootpath]
+        for filepath in dirpath.rglob('*.feather')
+    }
+
+
+def test_load_incremental_skips_up_to_date_files(dataset_configuration):
+    dataset = run_incremental_pipeline(dataset_configuration)
+    assert len(dataset.fileinfo) == len(dataset.gaze) == len(dataset.events) == 20
+    output_mtimes = get_output_mtimes(dataset)
+    assert len(output_mtimes) == 40
+
+    dataset = run_incremental_pipeline(dataset_configuration)
+
+    assert len(dataset.fileinfo) == len(dataset.gaze) == len(dataset.events) == 0
+    assert get_output_mtimes(dataset) == output_mtimes
+
+
+def test_load_incremental_reloads_changed_raw_file(dataset_configuration):
+    dataset = run_incremental_pipeline(dataset_configuration)
+    output_mtimes = get_output_mtimes(dataset)
+
+    changed_filepath = dataset.fileinfo['filepath'][3]
+    raw_filepath = dataset.raw_rootpath / changed_filepath
+    raw_filepath.write_text(raw_filepath.read_text())
+    os.utime(raw_filepath, ns=(0, 0))
+
+    dataset = run_incremental_pipeline(dataset_configuration)
+
+    assert dataset.fileinfo['filepath'].to_list() == [changed_filepath]
+    changed_output_filepaths = {
+        filepath for filepath, mtime in get_output_mtimes(dataset).items()
+        if mtime != output_mtimes[filepath]
+    }
+    assert changed_output_filepaths == {
+        dataset._raw_to_preprocessed_filepath(raw_filepath),
+        dataset._raw_to_event_filepath(raw_filepath),
+    }
+
+
+@pytest.mark.parametrize(
+    ('first_run_kwargs', 'second_run_kwargs'),
+    [
+        pytest.param(
+            {'method': 'smooth'}, {'method': 'neighbors'},
+            id='changed_parameters',
+        ),
+        pytest.param(
+            {'save_events': False}, {'save_events': True},
+            id='missing_output',
+        ),
+    ],
+)
+def test_load_incremental_reprocesses_stale_files(
+        first_run_kwargs, second_run_kwargs, dataset_configuration,
+):
+    run_incremental_pipeline(dataset_configuration, **first_run_kwargs)
+    dataset = run_incremental_pipeline(dataset_configuration, **second_run_kwargs)
+
+    expected_dataset = Dataset(**dataset_configuration['init_kwargs'])
+    expected_dataset.load()
+    expected_dataset.pix2deg(verbose=False)
+    expected_dataset.pos2vel(method=second_run_kwargs.get('method', 'smooth'), verbose=False)
+    expected_dataset.detect_events(method=microsaccades, threshold=1, verbose=False)
+
+    assert_frame_equal(dataset.fileinfo, expected_dataset.fileinfo)
+    for result_gaze_df, expected_gaze_df in zip(dataset.gaze, expected_dataset.gaze):
+        assert_frame_equal(result_gaze_df.frame, expected_gaze_df.frame)
+    for result_event_df, expected_event_df in zip(dataset.events, expected_dataset.events):
+        assert_frame_equal(result_event_df.frame, expected_event_df.frame)
+
+    assert len(run_incremental_pipeline(dataset_configuration, **second_run_kwargs).gaze) == 0
+
+
+def test_load_incremental_resumes_interrupted_run(dataset_configuration, monkeypatch):
+    write_file = Dataset._write_file
+    num_written_files = 0
+
+    def interrupted_write_file(_, df, filepath, **kwargs):
+        nonlocal num_written_files
+        if num_written_files == 25:
+            raise KeyboardInterrupt
+        write_file(df, filepath, **kwargs)
+        num_written_files += 1
+
+    monkeypatch.setattr(Dataset, '_write_file', interrupted_write_file)
+    with pytest.raises(KeyboardInterrupt):
+        run_incremental_pipeline(dataset_configuration)
+    monkeypatch.undo()
+
+    dataset = run_incremental_pipeline(dataset_configuration)
+
+    assert len(dataset.fileinfo) == 15
+    assert len(run_incremental_pipeline(dataset_configuration).gaze) == 0
+
+
+@pytest.mark.parametrize(
+    'load_kwargs',
+    [
+        pytest.param({'events': True}, id='events'),
+        pytest.param({'preprocessed': True}, id='preprocessed'),
+        pytest.param({'unified': True}, id='unified'),
+    ],
+)
+def test_load_incremental_raises_value_error(load_kwargs, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+
+    with pytest.raises(ValueError, match='incremental loading is only supported'):
+        dataset.load(incremental=True, **load_kwargs)
+
+
+def test_detect_events_cache(dataset_configuration, tmp_path):
+    replace_raw_positions_by_random_walks(dataset_configuration)
+    cache = StageCache(tmp_path / 'cache')
+
+    datasets = []
+    for _ in range(2):
+        dataset = Dataset(**dataset_configuration['init_kwargs'])
+        dataset.load()
+        dataset.pix2deg()
+        dataset.pos2vel()
+        dataset.detect_events(method=microsaccades, threshold=1, minimum_duration=2, cache=cache)
+        datasets.append(dataset)
+
+    assert (cache.hits, cache.misses) == (20, 20)
+    for result_event_df, expected_event_df in zip(datasets[1].events, datasets[0].events):
+        assert_frame_equal(result_event_df.frame, expected_event_df.frame)
+
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+    dataset.pix2deg()
+    dataset.pos2vel()
+    dataset.detect_events(method=microsaccades, threshold=2, minimum_duration=2, cache=cache)
+    assert cache.misses == 40
+
+
+@pytest.mark.parametrize(
+    'load_kwargs',
+    [
+        pytest.param({}, id='per_file'),
+        pytest.param({'unified': True}, id='unified'),
+    ],
+)
+def test_pix2deg_pos2vel_cache(load_kwargs, dataset_configuration, tmp_path):
+    replace_raw_positions_by_random_walks(dataset_configuration)
+    cache = StageCache(tmp_path / 'cache')
+    num_gaze_dfs = 1 if load_kwargs else 20
+
+    expected_dataset = Dataset(**dataset_configuration['init_kwargs'])
+    expected_dataset.load(**load_kwargs)
+    expected_dataset.pix2deg()
+    expected_dataset.pos2vel()
+
+    for expected_hits in [0, 2 * num_gaze_dfs]:
+        dataset = Dataset(**dataset_configuration['init_kwargs'])
+        dataset.load(**load_kwargs)
+        dataset.pix2deg(cache=cache)
+        dataset.pos2vel(cache=cache)
+
+        assert (cache.hits, cache.misses) == (expected_hits, 2 * num_gaze_dfs)
+        for result_gaze_df, expected_gaze_df in zip(dataset.gaze, expected_dataset.gaze):
+            assert_frame_equal(result_gaze_df.frame, expected_gaze_df.frame)
+
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load(**load_kwargs)
+    dataset.pix2deg(cache=cache)
+    dataset.pos2vel(method='neighbors', cache=cache)
+    assert cache.misses == 3 * num_gaze_dfs
+
+
+def test_pix2deg_cache_changed_file_is_cache_miss(dataset_configuration, tmp_path):
+    cache = StageCache(tmp_path / 'cache')
+
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+    dataset.pix2deg(cache=cache)
+
+    raw_filepath = dataset.raw_rootpath / dataset.fileinfo['filepath'][0]
+    raw_file_stat = os.stat(raw_filepath)
+    os.utime(raw_filepath, ns=(raw_file_stat.st_atime_ns, raw_file_stat.st_mtime_ns + 10**9))
+
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+    dataset.pix2deg(cache=cache)
+
+    assert (cache.hits, cache.misses) == (19, 21)
+
+
+def test_pos2vel_cache_skips_modified_gaze_dataframe(dataset_configuration, tmp_path):
+    cache = StageCache(tmp_path / 'cache')
+
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load()
+    dataset.pix2deg(cache=cache)
+    gaze_df = dataset.gaze[0]
+    gaze_df.frame = gaze_df.frame.with_columns(pl.col(gaze_df.position_columns) + 1)
+    dataset.pos2vel(cache=cache)
+
+    assert (cache.hits, cache.misses) == (0, 39)
+
+
+def test_float_dtype_float32(dataset_configuration):
+    replace_raw_positions_by_random_walks(dataset_configuration)
+
+    datasets = {}
+    for float_dtype in ['float32', 'float64']:
+        dataset = Dataset(**dataset_configuration['init_kwargs'], float_dtype=float_dtype)
+        dataset.load()
+        dataset.pix2deg()
+        dataset.pos2vel()
+        datasets[float_dtype] = dataset
+
+    expected_dtype = {'float32': pl.Float32, 'float64': pl.Float64}
+    for float_dtype, dataset in datasets.items():
+        gaze_df = dataset.gaze[0]
+        gaze_columns = [
+            *gaze_df.pixel_position_columns, *gaze_df.position_columns, *gaze_df.velocity_columns,
+        ]
+        assert {gaze_df.schema[column] for column in gaze_columns} == {expected_dtype[float_dtype]}
+        assert gaze_df.schema['time'] == pl.Int64
+
+    for result_gaze_df, expected_gaze_df in zip(datasets['float32'].gaze, datasets['float64'].gaze):
+        for column in result_gaze_df.position_columns:
+            np.testing.assert_allclose(
+                result_gaze_df.frame[column].to_numpy(), expected_gaze_df.frame[column].to_numpy(),
+                rtol=1e-6, atol=1e-5,
+            )
+        for column in result_gaze_df.velocity_columns:
+            np.testing.assert_allclose(
+                result_gaze_df.frame[column].to_numpy(), expected_gaze_df.frame[column].to_numpy(),
+                atol=1e-2,
+            )
+
+
+def test_float_dtype_float32_lazy(dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'], float_dtype='float32')
+    dataset.load(lazy=True)
+    dataset.pix2deg()
+    dataset.pos2vel()
+
+    for gaze_df in dataset.gaze:
+        float_columns = [*gaze_df.position_columns, *gaze_df.velocity_columns]
+        assert {gaze_df.schema[column] for column in float_columns} == {pl.Float32}
+
+    dataset.collect(verbose=False)
+
+    for gaze_df in dataset.gaze:
+        float_columns = [*gaze_df.position_columns, *gaze_df.velocity_columns]
+        assert {gaze_df.schema[column] for column in float_columns} == {pl.Float32}
+
+
+def test_float_dtype_float32_save(dataset_configuration):
+    filesizes = {}
+    for float_dtype in ['float32', 'float64']:
+        dataset = Dataset(**dataset_configuration['init_kwargs'], float_dtype=float_dtype)
+        dataset.load()
+        dataset.pix2deg()
+        dataset.pos2vel()
+        dataset.save_preprocessed(f'preprocessed_{float_dtype}', verbose=0)
+        filesizes[float_dtype] = sum(
+            filepath.stat().st_size
+            for filepath in (dataset.path / f'preprocessed_{float_dtype}').rglob('*.feather')
+        )
+
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load(preprocessed=True, preprocessed_dirname='preprocessed_float32')
+    gaze_df = dataset.gaze[0]
+    assert gaze_df.schema[gaze_df.position_columns[0]] == pl.Float32
+    assert gaze_df.schema[gaze_df.velocity_columns[0]] == pl.Float32
+    assert filesizes['float32'] < filesizes['float64']
+
+
+def test_float_dtype_raises_value_error(dataset_configuration):
+    with pytest.raises(ValueError, match='unsupported float_dtype "float16"'):
+        Dataset(**dataset_configuration['init_kwargs'], float_dtype='float16')
+
+
+def run_out_of_core_pipeline(dataset_configuration, memory_budget, **load_kwargs):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load(memory_budget=memory_budget, **load_kwargs)
+    dataset.pix2deg(verbose=False)
+    dataset.pos2vel(verbose=False)
+    dataset.detect_events(method=microsaccades, threshold=1, verbose=False)
+    dataset.save(
+        preprocessed_dirname='preprocessed_out_of_core', events_dirname='events_out_of_core',
+        verbose=0,
+    )
+    return dataset
+
+
+def test_out_of_core_equals_in_memory(dataset_configuration):
+    dataset = run_out_of_core_pipeline(dataset_configuration, memory_budget=2**20)
+
+    assert dataset.gaze == [] and dataset.events == []
+    assert len(dataset.fileinfo) == 20
+
+    in_memory_dataset = Dataset(**dataset_configuration['init_kwargs'])
+    in_memory_dataset.load()
+    in_memory_dataset.pix2deg(verbose=False)
+    in_memory_dataset.pos2vel(verbose=False)
+    in_memory_dataset.detect_events(method=microsaccades, threshold=1, verbose=False)
+
+    out_of_core_dataset = Dataset(**dataset_configuration['init_kwargs'])
+    out_of_core_dataset.load(
+        events=True, events_dirname='events_out_of_core',
+        preprocessed=True, preprocessed_dirname='preprocessed_out_of_core',
+    )
+    for expected, result in zip(in_memory_dataset.gaze, out_of_core_dataset.gaze):
+        assert_frame_equal(expected.frame, result.frame)
+    for expected, result in zip(in_memory_dataset.events, out_of_core_dataset.events):
+        assert_frame_equal(expected.frame, result.frame, check_column_order=False)
+
+
+@pytest.mark.parametrize(
+    ('memory_budget', 'expected_window_sizes'),
+    [
+        pytest.param(1, [1] * 20, id='tiny_budget'),
+        pytest.param(2**40, [1, 19], id='huge_budget'),
+    ],
+)
+def test_out_of_core_window_sizes(
+        memory_budget, expected_window_sizes, dataset_configuration, monkeypatch,
+):
+    load_gaze_files = Dataset.load_gaze_files
+    window_sizes = []
+
+    def spy_load_gaze_files(self, **kwargs):
+        window_sizes.append(len(self.fileinfo))
+        return load_gaze_files(self, **kwargs)
+
+    monkeypatch.setattr(Dataset, 'load_gaze_files', spy_load_gaze_files)
+    run_out_of_core_pipeline(dataset_configuration, memory_budget=memory_budget)
+
+    assert window_sizes == expected_window_sizes
+
+
+def test_out_of_core_incremental(dataset_configuration):
+    dataset = run_out_of_core_pipeline(dataset_configuration, 2**20, incremental=True)
+    output_mtimes = get_output_mtimes(dataset)
+    assert len(output_mtimes) == 40
+
+    dataset = run_out_of_core_pipeline(dataset_configuration, 2**20, incremental=True)
+
+    assert len(dataset.fileinfo) == 0
+    assert get_output_mtimes(dataset) == output_mtimes
+
+
+@pytest.mark.parametrize(
+    ('load_kwargs', 'message'),
+    [
+        pytest.param({'events': True}, 'out-of-core loading is only supported', id='events'),
+        pytest.param(
+            {'preprocessed': True}, 'out-of-core loading is only supported', id='preprocessed',
+        ),
+        pytest.param({'unified': True}, 'out-of-core loading is only supported', id='unified'),
+        pytest.param({'lazy': True}, 'out-of-core loading is only supported', id='lazy'),
+        pytest.param({'memory_budget': 0}, 'memory_budget must be positive', id='zero_budget'),
+    ],
+)
+def test_load_out_of_core_raises_value_error(load_kwargs, message, dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+
+    with pytest.raises(ValueError, match=message):
+        dataset.load(**{'memory_budget': 2**20, **load_kwargs})
+
+
+@pytest.mark.parametrize(
+    ('float_dtype', 'expected_dtype'),
+    [
+        pytest.param(None, pl.Float64, id='default'),
+        pytest.param('float32', pl.Float32, id='float32'),
+    ],
+)
+@pytest.mark.parametrize('dataset_configuration', ['ToyMono'], indirect=['dataset_configuration'])
+def test_load_preprocessed_csv_explicit_float_dtypes(
+        float_dtype, expected_dtype, dataset_configuration,
+):
+    dataset = Dataset(**dataset_configuration['init_kwargs'], float_dtype=float_dtype)
+    dataset.fileinfo = dataset.infer_fileinfo()
+
+    # Schema inference would pick an integer dtype from the first rows and fail later on.
+    pixel_values = ['1'] * 500 + ['1.5'] * 500
+    for filepath in dataset.fileinfo['filepath']:
+        preprocessed_filepath = dataset._raw_to_preprocessed_filepath(
+            dataset.raw_rootpath / filepath, extension='csv',
+        )
+        pl.DataFrame({
+            'time': np.arange(1000),
+            'x_pix': pixel_values,
+            'y_pix': pixel_values,
+        }).write_csv(preprocessed_filepath)
+
+    dataset.load(preprocessed=True, extension='csv')
+
+    gaze_df = dataset.gaze[0]
+    assert gaze_df.schema['x_pix'] == gaze_df.schema['y_pix'] == expected_dtype
+    assert gaze_df.schema['time'] == pl.Int64
+    assert gaze_df.frame['x_pix'][999] == 1.5
+
+
+def test_load_event_csv_explicit_dtypes(dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+    dataset.load(events=True)
+    dataset.save_events('events_csv', extension='csv', verbose=0)
+
+    dataset.load(events=True, events_dirname='events_csv', extension='csv')
+
+    for event_df in dataset.events:
+        assert event_df.schema['name'] == pl.Utf8
+        assert event_df.schema['onset'] == event_df.schema['offset'] == pl.Int64
+
+
+def test_profile(dataset_configuration):
+    dataset = Dataset(**dataset_configuration['init_kwargs'])
+
+    with dataset.profile() as profiler:
+        dataset.load()
+        dataset.pix2deg(verbose=False)
+        dataset.pos2vel(verbose=False)
+        dataset.detect_events(method=microsaccades, threshold=1, verbose=False)
+        dataset.compute_event_properties('peak_velocity', verbose=False)
+        dataset.save(verbose=0)
+    dataset.load(events=True)
+
+    frame = profiler.to_frame()
+    stages = [
+        'load_gaze', 'pix2deg', 'pos2vel', 'detect_events', 'compute_event_properties',
+        'save_events', 'save_preprocessed',
+    ]
+    assert frame['stage'].unique(maintain_order=True).to_list() == stages
+
+    filepaths = dataset.fileinfo['filepath'].to_list()
+    for stage in stages[:5]:
+        stage_frame = frame.filter(pl.col('stage') == stage)
+        assert stage_frame['filepath'].to_list() == filepaths
+        assert (stage_frame['num_samples'] == 1000).all()
+        assert stage_frame['samples_per_second'].null_count() == 0
+
+    assert frame.filter(pl.col('stage') == 'load_gaze')['bytes_read'].min() > 0
+    assert frame.filter(pl.col('stage').str.starts_with('save'))['bytes_written'].min() > 0
+    if sys.platform.startswith('linux'):
+        assert frame['peak_memory'].null_count() == 0
+        assert frame['peak_memory'].min() >= 0
+    assert dataset._profiler is None
@@ -20,7 +20,10 @@
 """Test all functionality in pymovements.datasets.gazebase."""
 from pathlib import Path
 
+import numpy as np
+import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
 
 from pymovements.datasets.gazebase import GazeBase
 
@@ -68,3 +71,43 @@ def test_paths(init_kwargs, expected_paths):
     assert dataset.root == expected_paths['root']
     assert dataset.path == expected_paths['path']
     assert dataset.downloads_rootpath == expected_paths['download']
+
+
+def test_load_explicit_column_dtypes(tmp_path):
+    dataset = GazeBase(root=tmp_path, custom_read_kwargs={'n_threads': 1})
+    dataset.raw_rootpath.mkdir(parents=True)
+
+    # Schema inference would pick an integer dtype from the first rows and fail later on.
+    values = ['1'] * 500 + ['1.5'] * 500
+    pl.DataFrame({
+        'n': np.arange(1000), 'x': values, 'y': values, 'val': np.zeros(1000, dtype=int),
+        'dP': values, 'lab': values, 'xT': values, 'yT': values,
+    }).write_csv(dataset.raw_rootpath / 'S_1001_S1_TEX.csv')
+
+    dataset.load()
+
+    assert dataset._custom_read_kwargs['n_threads'] == 1
+    assert dataset.gaze[0].schema['x_left_pos'] == pl.Float64
+    assert dataset.gaze[0].schema['time'] == pl.Int64
+    assert dataset.gaze[0].frame['x_left_pos'][999] == 1.5
+
+
+def test_iter_gaze_batches_explicit_column_dtypes(tmp_path):
+    dataset = GazeBase(root=tmp_path)
+    dataset.raw_rootpath.mkdir(parents=True)
+
+    values = ['1'] * 10000 + ['1.5'] * 10000
+    pl.DataFrame({
+        'n': np.arange(20000), 'x': values, 'y': values, 'val': np.zeros(20000, dtype=int),
+        'dP': values, 'lab': values, 'xT': values, 'yT': values,
+    }).write_csv(dataset.raw_rootpath / 'S_1001_S1_TEX.csv')
+
+    batches = list(dataset.iter_gaze_batches(batch_size=1000))
+
+    # Explicit dtypes must not result in a single batch holding the whole file.
+    assert len(batches) >= 20
+    assert max(len(batch.frame) for batch in batches) <= 2000
+
+    dataset.load()
+    assert_frame_equal(pl.concat([batch.frame for batch in batches]), dataset.gaze[0].frame)
+    assert dataset.gaze[0].schema['x_left_pos'] == pl.Float64
@@ -20,7 +20,10 @@
 """Test all functionality in pymovements.datasets.judo1000."""
 from pathlib import Path
 
+import numpy as np
+import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
 
 from pymovements.datasets.judo1000 import JuDo1000
 
@@ -68,3 +71,45 @@ def test_paths(init_kwargs, expected_paths):
     assert dataset.root == expected_paths['root']
     assert dataset.path == expected_paths['path']
     assert dataset.downloads_rootpath == expected_paths['download']
+
+
+def test_load_explicit_column_dtypes(tmp_path):
+    dataset = JuDo1000(root=tmp_path, custom_read_kwargs={'n_threads': 1})
+    dataset.raw_rootpath.mkdir(parents=True)
+
+    # Schema inference would pick an integer dtype from the first rows and fail later on.
+    values = ['1'] * 500 + ['1.5'] * 500
+    pl.DataFrame({
+        'trialId': np.ones(1000, dtype=int), 'pointId': np.ones(1000, dtype=int),
+        'time': np.arange(1000), 'x_left': values, 'y_left': values,
+        'x_right': values, 'y_right': values,
+    }).write_csv(dataset.raw_rootpath / '1_1.csv', separator='\t')
+
+    dataset.load()
+
+    assert dataset._custom_read_kwargs['n_threads'] == 1
+    assert dataset.gaze[0].schema['x_left_pix'] == pl.Float64
+    assert dataset.gaze[0].schema['time'] == pl.Int64
+    assert dataset.gaze[0].frame['x_right_pix'][999] == 1.5
+
+
+def test_iter_gaze_batches_explicit_column_dtypes(tmp_path):
+    dataset = JuDo1000(root=tmp_path)
+    dataset.raw_rootpath.mkdir(parents=True)
+
+    values = ['1'] * 10000 + ['1.5'] * 10000
+    pl.DataFrame({
+        'trialId': np.ones(20000, dtype=int), 'pointId': np.ones(20000, dtype=int),
+        'time': np.arange(20000), 'x_left': values, 'y_left': values,
+        'x_right': values, 'y_right': values,
+    }).write_csv(dataset.raw_rootpath / '1_1.csv', separator='\t')
+
+    batches = list(dataset.iter_gaze_batches(batch_size=1000))
+
+    # Explicit dtypes must not result in a single batch holding the whole file.
+    assert len(batches) >= 20
+    assert max(len(batch.frame) for batch in batches) <= 2000
+
+    dataset.load()
+    assert_frame_equal(pl.concat([batch.frame for batch in batches]), dataset.gaze[0].frame)
+    assert dataset.gaze[0].schema['x_right_pix'] == pl.Float64
@@ -350,3 +350,181 @@ def test_gaze_dataframe_pos2vel_exceptions(init_kwargs, exception, msg_substring
     msg, = excinfo.value.args
     for msg_substring in msg_substrings:
         assert msg_substring.lower() in msg.lower()
+
+
+def test_gaze_dataframe_pix2deg_eager_equals_lazy(experiment_fixture):
+    frame = pl.DataFrame(
+        {'x_pix': np.arange(-10, 1100) + 0.25, 'y_pix': np.arange(1110) - 0.5},
+        schema={'x_pix': pl.Float64, 'y_pix': pl.Float64},
+    )
+    eager_gaze_df = GazeDataFrame(frame, experiment=experiment_fixture)
+    eager_gaze_df.pix2deg()
+
+    lazy_gaze_df = GazeDataFrame(frame.lazy(), experiment=experiment_fixture)
+    lazy_gaze_df.pix2deg()
+    lazy_gaze_df.collect()
+
+    expected = experiment_fixture.screen.pix2deg(frame.to_numpy())
+    np.testing.assert_allclose(eager_gaze_df.frame.select(['x_pos', 'y_pos']).to_numpy(), expected)
+    np.testing.assert_allclose(lazy_gaze_df.frame.select(['x_pos', 'y_pos']).to_numpy(), expected)
+
+
+@pytest.mark.parametrize('method', ['exact', 'lookup', 'interpolate'])
+def test_gaze_dataframe_pix2deg_method(method, experiment_fixture):
+    frame = pl.DataFrame(
+        {'x_pix': np.arange(-10, 1100) + 0.25, 'y_pix': np.arange(1110) - 0.5},
+        schema={'x_pix': pl.Float64, 'y_pix': pl.Float64},
+    )
+    gaze_df = GazeDataFrame(frame, experiment=experiment_fixture)
+    gaze_df.pix2deg(method=method)
+
+    expected = experiment_fixture.screen.pix2deg(frame.to_numpy(), method=method)
+    np.testing.assert_allclose(
+        gaze_df.frame.select(['x_pos', 'y_pos']).to_numpy(), expected, rtol=1e-12, atol=1e-12,
+    )
+
+
+def test_gaze_dataframe_pix2deg_invalid_method(experiment_fixture):
+    frame = pl.DataFrame(schema={'x_pix': pl.Float64, 'y_pix': pl.Float64})
+    gaze_df = GazeDataFrame(frame.lazy(), experiment=experiment_fixture)
+
+    with pytest.raises(ValueError, match='Method needs to be in'):
+        gaze_df.pix2deg(method='foo')
+
+
+def test_gaze_dataframe_lazy_pix2deg_pos2vel_is_deferred(experiment_fixture):
+    frame = pl.DataFrame(
+        {'x_pix': np.arange(100), 'y_pix': np.arange(100)},
+        schema={'x_pix': pl.Float64, 'y_pix': pl.Float64},
+    )
+    gaze_df = GazeDataFrame(frame.lazy(), experiment=experiment_fixture)
+    gaze_df.pix2deg()
+    gaze_df.pos2vel()
+
+    assert gaze_df.is_lazy
+    assert set(gaze_df.position_columns) == {'x_pos', 'y_pos'}
+    assert set(gaze_df.velocity_columns) == {'x_vel', 'y_vel'}
+
+    gaze_df.collect()
+    assert not gaze_df.is_lazy
+
+    screen = experiment_fixture.screen
+    expected_x_pos = screen.pix2deg(np.stack([np.arange(100), np.arange(100)], axis=1))[:, 0]
+    expected_x_vel = experiment_fixture.pos2vel(expected_x_pos)
+
+    np.testing.assert_allclose(gaze_df.frame['x_pos'].to_numpy(), expected_x_pos)
+    np.testing.assert_allclose(gaze_df.frame['x_vel'].to_numpy(), expected_x_vel)
+
+
+@pytest.mark.parametrize(
+    'method',
+    [
+        pytest.param('smooth', id='smooth'),
+        pytest.param('neighbors', id='neighbors'),
+        pytest.param('preceding', id='preceding'),
+        pytest.param('savitzky_golay', id='savitzky_golay'),
+    ],
+)
+@pytest.mark.parametrize('lazy', [False, True], ids=['eager', 'lazy'])
+def test_gaze_dataframe_pos2vel_over_equals_numpy_per_trial(method, lazy, experiment_fixture):
+    rng = np.random.default_rng(42)
+    trials = [rng.uniform(-10, 10, (n_samples, 2)) for n_samples in [30, 50, 20]]
+    frame = pl.DataFrame({
+        'trial': np.repeat(np.arange(len(trials)), [len(trial) for trial in trials]),
+        'x_pos': np.concatenate(trials)[:, 0],
+        'y_pos': np.concatenate(trials)[:, 1],
+    })
+    kwargs = {'window_length': 7, 'polyorder': 2} if method == 'savitzky_golay' else {}
+
+    gaze_df = GazeDataFrame(frame.lazy() if lazy else frame, experiment=experiment_fixture)
+    gaze_df.pos2vel(method=method, over='trial', **kwargs)
+    gaze_df.collect()
+
+    expected_velocities = np.concatenate([
+        experiment_fixture.pos2vel(trial, method=method, **kwargs) for trial in trials
+    ])
+    np.testing.assert_allclose(
+        gaze_df.frame.select(['x_vel', 'y_vel']).to_numpy(), expected_velocities,
+    )
+
+
+@pytest.mark.parametrize(
+    ('method', 'n_samples'),
+    [
+        pytest.param('smooth', 5, id='smooth'),
+        pytest.param('neighbors', 2, id='neighbors'),
+        pytest.param('preceding', 1, id='preceding'),
+    ],
+)
+@pytest.mark.parametrize('over', [None, 'trial'], ids=['no_over', 'over'])
+def test_gaze_dataframe_pos2vel_too_few_samples_raises(
+        method, n_samples, over, experiment_fixture,
+):
+    frame = pl.DataFrame({
+        'trial': [0] * 10 + [1] * n_samples,
+        'x_pos': np.arange(10 + n_samples, dtype=np.float64),
+        'y_pos': np.arange(10 + n_samples, dtype=np.float64),
+    })
+    if over is None:
+        frame = frame.filter(pl.col('trial') == 1)
+    gaze_df = GazeDataFrame(frame, experiment=experiment_fixture)
+
+    with pytest.raises(ValueError, match=f'at least {n_samples + 1} elements'):
+        gaze_df.pos2vel(method=method, over=over)
+
+
+@pytest.mark.parametrize(
+    'method',
+    [
+        pytest.param('smooth', id='smooth'),
+        pytest.param('neighbors', id='neighbors'),
+        pytest.param('preceding', id='preceding'),
+    ],
+)
+@pytest.mark.parametrize(
+    ('lazy', 'over'),
+    [
+        pytest.param(False, None, id='eager'),
+        pytest.param(True, None, id='lazy'),
+        pytest.param(False, 'trial', id='eager_over'),
+        pytest.param(True, 'trial', id='lazy_over'),
+    ],
+)
+def test_gaze_dataframe_pos2vel_nan_positions_equal_numpy(method, lazy, over, experiment_fixture):
+    positions = np.stack([np.arange(10, dtype=np.float64) ** 2] * 2, axis=1)
+    positions[[0, 4], 0] = np.nan
+    positions[[1, 9], 1] = np.nan
+    frame = pl.DataFrame({'trial': [0] * 10, 'x_pos': positions[:, 0], 'y_pos': positions[:, 1]})
+
+    gaze_df = GazeDataFrame(frame.lazy() if lazy else frame, experiment=experiment_fixture)
+    gaze_df.pos2vel(method=method, over=over)
+    gaze_df.collect()
+
+    np.testing.assert_array_equal(
+        gaze_df.frame.select(['x_vel', 'y_vel']).to_numpy(),
+        experiment_fixture.pos2vel(positions, method=method),
+    )
+
+
+@pytest.mark.parametrize('over', [None, 'trial'], ids=['no_over', 'over'])
+def test_gaze_dataframe_lazy_pos2vel_keeps_float32_schema(over, experiment_fixture):
+    frame = pl.DataFrame({
+        'trial': [0] * 10 + [1] * 10,
+        'x_pos': np.arange(20, dtype=np.float32),
+        'y_pos': np.arange(20, dtype=np.float32),
+    })
+    gaze_df = GazeDataFrame(frame.lazy(), experiment=experiment_fixture)
+    gaze_df.pos2vel(over=over)
+
+    assert gaze_df.schema['x_vel'] == pl.Float32
+    gaze_df.collect()
+    assert gaze_df.schema['x_vel'] == pl.Float32
+
+
+@pytest.mark.parametrize('copy', [True, False])
+def test_gaze_dataframe_copy(copy):
+    df = pl.DataFrame({'x_pix': [0.0, 1.0], 'y_pix': [1.0, 0.0]})
+    gaze = GazeDataFrame(df, copy=copy)
+
+    assert gaze.frame.frame_equal(df)
+    assert (gaze.frame is df) is not copy
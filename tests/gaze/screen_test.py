@@ -0,0 +1,137 @@
+# Copyright (c) 2022-2023 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Test pymovements.gaze.Screen.
+"""
+import numpy as np
+import pytest
+
+from pymovements.gaze import Screen
+
+
+@pytest.fixture(name='screen')
+def fixture_screen():
+    return Screen(1280, 1024, 38.0, 30.0, 68.0, 'lower left')
+
+
+def get_distance_px(screen):
+    return np.array([
+        screen.distance_cm * screen.width_px / screen.width_cm,
+        screen.distance_cm * screen.height_px / screen.height_cm,
+    ])
+
+
+@pytest.mark.parametrize('method', ['foo', 'nearest', None])
+def test_pix2deg_invalid_method_raises_value_error(method, screen):
+    with pytest.raises(ValueError, match='Method needs to be in'):
+        screen.pix2deg([[0, 0]], method=method)
+
+
+@pytest.mark.parametrize('method', ['lookup', 'interpolate'])
+@pytest.mark.parametrize(
+    'arr',
+    [
+        pytest.param([[[0, 0]]], id='3d_array'),
+        pytest.param([[0, 0, 0]], id='3_coords'),
+        pytest.param([0, 0], id='1d_array'),
+        pytest.param(0, id='scalar'),
+    ],
+)
+def test_pix2deg_lookup_invalid_shape_raises_value_error(method, arr, screen):
+    with pytest.raises(ValueError, match='Last coord dimension'):
+        screen.pix2deg(arr, method=method)
+
+
+@pytest.mark.parametrize('method', ['lookup', 'interpolate'])
+@pytest.mark.parametrize('origin', ['lower left', 'center'])
+@pytest.mark.parametrize('n_coords', [2, 4], ids=['monocular', 'binocular'])
+def test_pix2deg_lookup_integer_pixels_equal_exact(method, origin, n_coords):
+    screen = Screen(1280, 1024, 38.0, 30.0, 68.0, origin)
+    rng = np.random.default_rng(42)
+    arr = rng.integers(0, 1024, size=(1000, n_coords))
+
+    result = screen.pix2deg(arr, method=method)
+
+    np.testing.assert_array_equal(result, screen.pix2deg(arr.astype(np.float64)))
+
+
+@pytest.mark.parametrize(
+    'method, get_error_bound',
+    [
+        pytest.param(
+            'lookup',
+            lambda distance_px: 90 / (np.pi * distance_px),
+            id='lookup',
+        ),
+        pytest.param(
+            'interpolate',
+            lambda distance_px: 135 * np.sqrt(3) / (16 * np.pi * distance_px ** 2),
+            id='interpolate',
+        ),
+    ],
+)
+@pytest.mark.parametrize('distance_cm', [20.0, 68.0, 200.0])
+def test_pix2deg_lookup_subpixel_error_is_bounded(method, get_error_bound, distance_cm):
+    screen = Screen(1280, 1024, 38.0, 30.0, distance_cm, 'lower left')
+    rng = np.random.default_rng(42)
+    arr = rng.uniform(0, 1023, size=(100_000, 2))
+
+    error = np.abs(screen.pix2deg(arr, method=method) - screen.pix2deg(arr))
+
+    assert (error.max(axis=0) <= get_error_bound(get_distance_px(screen))).all()
+
+
+@pytest.mark.parametrize('method', ['lookup', 'interpolate'])
+def test_pix2deg_lookup_off_screen_and_missing_pixels_are_exact(method, screen):
+    arr = np.array([
+        [-100.5, 2000.25],
+        [np.nan, 512.0],
+        [1279.0, 1023.0],
+        [0.0, np.nan],
+    ])
+
+    result = screen.pix2deg(arr, method=method)
+
+    np.testing.assert_array_equal(result, screen.pix2deg(arr))
+
+
+@pytest.mark.parametrize('method', ['exact', 'lookup', 'interpolate'])
+@pytest.mark.parametrize(
+    'dtype, expected_dtype',
+    [
+        pytest.param(np.float32, np.float32, id='float32'),
+        pytest.param(np.float64, np.float64, id='float64'),
+        pytest.param(np.int32, np.float64, id='int32'),
+    ],
+)
+def test_pix2deg_dtype(method, dtype, expected_dtype, screen):
+    arr = np.array([[100, 200], [300, 400]], dtype=dtype)
+
+    assert screen.pix2deg(arr, method=method).dtype == expected_dtype
+
+
+def test_pix2deg_lookup_tables_are_shared_between_equal_screens():
+    screens = [Screen(1280, 1024, 38.0, 30.0, 68.0, 'center') for _ in range(2)]
+    arr = np.array([[100.5, 200.5]])
+
+    results = [screen.pix2deg(arr, method='lookup') for screen in screens]
+
+    np.testing.assert_array_equal(*results)
+    assert 'table' not in str(screens[0])
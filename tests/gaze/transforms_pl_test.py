@@ -0,0 +1,267 @@
+# Copyright (c) 2022-2023 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Test all functions in pymovements.gaze.transforms_pl.
+"""
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from pymovements.gaze import transforms
+from pymovements.gaze import transforms_pl
+
+
+@pytest.mark.parametrize(
+    'kwargs, expected_error',
+    [
+        pytest.param(
+            {'screen_px': 0, 'screen_cm': 1, 'distance_cm': 1, 'origin': 'center'},
+            ValueError,
+            id='screen_px_zero_raises_value_error',
+        ),
+        pytest.param(
+            {'screen_px': 1, 'screen_cm': 0, 'distance_cm': 1, 'origin': 'center'},
+            ValueError,
+            id='screen_cm_zero_raises_value_error',
+        ),
+        pytest.param(
+            {'screen_px': 1, 'screen_cm': 1, 'distance_cm': 0, 'origin': 'center'},
+            ValueError,
+            id='distance_cm_zero_raises_value_error',
+        ),
+        pytest.param(
+            {'screen_px': 1, 'screen_cm': 1, 'distance_cm': 1, 'origin': 'foobar'},
+            ValueError,
+            id='invalid_origin_raises_value_error',
+        ),
+    ],
+)
+def test_pix2deg_init_raises_error(kwargs, expected_error):
+    with pytest.raises(expected_error):
+        transforms_pl.pix2deg('x_pix', **kwargs)
+
+
+@pytest.mark.parametrize(
+    'screen_px, screen_cm, distance_cm, origin',
+    [
+        pytest.param(1280, 38.0, 68.0, 'lower left', id='lower_left'),
+        pytest.param(1280, 38.0, 68.0, 'center', id='center'),
+        pytest.param(1024, 30.0, 50.0, 'lower left', id='short_distance'),
+        pytest.param(1024, 30.0, 1000.0, 'center', id='long_distance'),
+    ],
+)
+def test_pix2deg_equals_numpy_transform(screen_px, screen_cm, distance_cm, origin):
+    pixels = np.linspace(-2000, 2000, num=1001)
+    frame = pl.DataFrame({'x_pix': pixels})
+
+    result = frame.select(
+        transforms_pl.pix2deg('x_pix', screen_px, screen_cm, distance_cm, origin),
+    )
+    expected = transforms.pix2deg(
+        pixels, screen_px=screen_px, screen_cm=screen_cm, distance_cm=distance_cm, origin=origin,
+    )
+
+    np.testing.assert_allclose(result['x_pix'].to_numpy(), expected, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    'dtype, expected_dtype',
+    [
+        pytest.param(pl.Float32, pl.Float32, id='float32_stays_float32'),
+        pytest.param(pl.Float64, pl.Float64, id='float64_stays_float64'),
+        pytest.param(pl.Int64, pl.Float64, id='int64_becomes_float64'),
+    ],
+)
+@pytest.mark.parametrize('origin', ['center', 'lower left'])
+@pytest.mark.parametrize('lazy', [False, True], ids=['eager', 'lazy'])
+def test_pix2deg_dtype(dtype, expected_dtype, origin, lazy):
+    frame = pl.DataFrame({'x_pix': pl.Series([0, 100, 1279], dtype=dtype)})
+    if lazy:
+        frame = frame.lazy()
+
+    result = frame.select(transforms_pl.pix2deg('x_pix', 1280, 38.0, 68.0, origin))
+
+    assert result.schema['x_pix'] == expected_dtype
+    if lazy:
+        assert result.collect().schema['x_pix'] == expected_dtype
+
+
+def test_pix2deg_accepts_expression():
+    frame = pl.DataFrame({'x_pix': [0.0, 100.0, 1279.0], 'x_pix_doubled': [0.0, 200.0, 2558.0]})
+
+    result = frame.select(
+        transforms_pl.pix2deg(pl.col('x_pix') * 2, 1280, 38.0, 68.0, 'center'),
+    )
+    expected = frame.select(
+        transforms_pl.pix2deg('x_pix_doubled', 1280, 38.0, 68.0, 'center').alias('x_pix'),
+    )
+
+    assert_frame_equal(result, expected)
+
+
+def test_pix2deg_lazy_equals_eager():
+    frame = pl.DataFrame({'x_pix': np.linspace(0, 1279, num=100)})
+    expression = transforms_pl.pix2deg('x_pix', 1280, 38.0, 68.0, 'lower left')
+
+    assert_frame_equal(frame.lazy().select(expression).collect(), frame.select(expression))
+
+
+def test_pix2deg_over_group():
+    frame = pl.DataFrame({
+        'trial': [1, 1, 2, 2],
+        'x_pix': [0.0, 100.0, 200.0, 300.0],
+    })
+
+    result = frame.select(
+        transforms_pl.pix2deg('x_pix', 1280, 38.0, 68.0, 'lower left').over('trial'),
+    )
+    expected = frame.select(transforms_pl.pix2deg('x_pix', 1280, 38.0, 68.0, 'lower left'))
+
+    assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    'kwargs, expected_error',
+    [
+        pytest.param(
+            {'sampling_rate': 0, 'method': 'smooth'},
+            ValueError,
+            id='sampling_rate_zero_raises_value_error',
+        ),
+        pytest.param(
+            {'sampling_rate': -1, 'method': 'smooth'},
+            ValueError,
+            id='sampling_rate_negative_raises_value_error',
+        ),
+        pytest.param(
+            {'sampling_rate': 1000, 'method': 'savitzky_golay'},
+            ValueError,
+            id='savitzky_golay_raises_value_error',
+        ),
+        pytest.param(
+            {'sampling_rate': 1000, 'method': 'foobar'},
+            ValueError,
+            id='invalid_method_raises_value_error',
+        ),
+    ],
+)
+def test_pos2vel_init_raises_error(kwargs, expected_error):
+    with pytest.raises(expected_error):
+        transforms_pl.pos2vel('x_pos', **kwargs)
+
+
+@pytest.mark.parametrize('method', transforms_pl.POS2VEL_METHODS)
+@pytest.mark.parametrize(
+    'n_samples',
+    [
+        pytest.param(6, id='6_samples'),
+        pytest.param(7, id='7_samples'),
+        pytest.param(100, id='100_samples'),
+    ],
+)
+@pytest.mark.parametrize(
+    'dtype',
+    [
+        pytest.param(np.float64, id='float64'),
+        pytest.param(np.float32, id='float32'),
+        pytest.param(np.int64, id='int64'),
+    ],
+)
+def test_pos2vel_equals_numpy_transform(method, n_samples, dtype):
+    positions = (np.random.default_rng(42).random(n_samples) * 100).astype(dtype)
+    frame = pl.DataFrame({'x_pos': positions})
+
+    result = frame.select(transforms_pl.pos2vel('x_pos', sampling_rate=500, method=method))
+    expected = transforms.pos2vel(positions, sampling_rate=500, method=method)
+
+    assert result['x_pos'].dtype == pl.Series(expected).dtype
+    np.testing.assert_allclose(result['x_pos'].to_numpy(), expected, rtol=1e-6)
+
+
+@pytest.mark.parametrize('method', transforms_pl.POS2VEL_METHODS)
+def test_pos2vel_over_group_equals_separate_groups(method):
+    rng = np.random.default_rng(42)
+    groups = [rng.random(n_samples) * 100 for n_samples in [10, 6, 20]]
+    frame = pl.DataFrame({
+        'trial': np.repeat(np.arange(len(groups)), [len(group) for group in groups]),
+        'x_pos': np.concatenate(groups),
+    })
+
+    result = frame.select(transforms_pl.pos2vel('x_pos', method=method).over('trial'))
+    expected = np.concatenate([transforms.pos2vel(group, method=method) for group in groups])
+
+    np.testing.assert_allclose(result['x_pos'].to_numpy(), expected)
+
+
+@pytest.mark.parametrize('method', transforms_pl.POS2VEL_METHODS)
+def test_pos2vel_lazy_equals_eager(method):
+    frame = pl.DataFrame({
+        'trial': [1] * 10 + [2] * 10,
+        'x_pos': np.linspace(0, 10, num=20) ** 2,
+    })
+    expression = transforms_pl.pos2vel('x_pos', method=method).over('trial')
+
+    assert_frame_equal(frame.lazy().select(expression).collect(), frame.select(expression))
+
+
+def test_pos2vel_missing_position_is_not_filled():
+    frame = pl.DataFrame({'x_pos': [0.0, 1.0, 2.0, None, 4.0, 5.0, 6.0, 7.0]})
+
+    result = frame.select(transforms_pl.pos2vel('x_pos', method='preceding'))
+
+    assert result['x_pos'].to_list() == [0.0, 1000.0, 1000.0, None, None, 1000.0, 1000.0, 1000.0]
+
+
+@pytest.mark.parametrize('method', transforms_pl.POS2VEL_METHODS)
+@pytest.mark.parametrize(
+    'nan_indices',
+    [
+        pytest.param([0], id='first'),
+        pytest.param([1], id='second'),
+        pytest.param([6], id='second_last'),
+        pytest.param([7], id='last'),
+        pytest.param([0, 3, 7], id='first_inner_last'),
+    ],
+)
+def test_pos2vel_nan_positions_equal_numpy_transform(method, nan_indices):
+    positions = np.arange(8, dtype=np.float64) ** 2
+    positions[nan_indices] = np.nan
+    frame = pl.DataFrame({'x_pos': positions})
+
+    result = frame.select(transforms_pl.pos2vel('x_pos', method=method))
+    expected = transforms.pos2vel(positions, method=method)
+
+    np.testing.assert_array_equal(result['x_pos'].to_numpy(), expected)
+
+
+@pytest.mark.parametrize('method', transforms_pl.POS2VEL_METHODS)
+def test_pos2vel_over_missing_boundary_positions_stay_missing(method, capfd):
+    frame = pl.DataFrame({
+        'trial': [1] * 8 + [2] * 8,
+        'x_pos': [None, *range(1, 15), None],
+    }, schema={'trial': pl.Int64, 'x_pos': pl.Float64})
+
+    result = frame.select(transforms_pl.pos2vel('x_pos', method=method).over('trial'))
+
+    assert result['x_pos'][0] is None
+    assert result['x_pos'][15] is None
+    # Polars prints a warning for predicates within groups that are not valid aggregations.
+    assert capfd.readouterr().err == ''
@@ -20,12 +20,19 @@
 """
 Test all functions in pymovements.transforms.
 """
+import tracemalloc
+
 import numpy as np
 import pytest
+from scipy.signal import savgol_filter
 
+from pymovements.gaze import transforms
 from pymovements.gaze.transforms import norm
 from pymovements.gaze.transforms import pix2deg
 from pymovements.gaze.transforms import pos2vel
+from pymovements.gaze.transforms import pos2vel_batch
+from pymovements.gaze.transforms import savitzky_golay
+from pymovements.gaze.transforms import smooth_pos2vel
 from pymovements.gaze.transforms import split
 
 n_coords = 100
@@ -603,6 +610,353 @@ def test_pos2vel_2d_stepped_input_returns(params, expected_value):
     assert np.allclose(actual_value[lpad:rpad], expected_value[lpad:rpad])
 
 
+@pytest.mark.parametrize(
+    ('dtype', 'expected_dtype'),
+    [
+        pytest.param(np.float32, np.float32, id='float32'),
+        pytest.param(np.float64, np.float64, id='float64'),
+        pytest.param(np.int64, np.float64, id='int64'),
+    ],
+)
+@pytest.mark.parametrize('origin', ['center', 'lower left'])
+def test_pix2deg_preserves_float_dtype(dtype, expected_dtype, origin):
+    arr = np.arange(200).reshape(100, 2).astype(dtype)
+
+    result = pix2deg(
+        arr, screen_px=(1280, 1024), screen_cm=(38, 30), distance_cm=68, origin=origin,
+    )
+
+    assert result.dtype == expected_dtype
+
+
+@pytest.mark.parametrize(
+    ('method', 'kwargs'),
+    [
+        pytest.param('smooth', {}, id='smooth'),
+        pytest.param('neighbors', {}, id='neighbors'),
+        pytest.param('preceding', {}, id='preceding'),
+        pytest.param('savitzky_golay', {'window_length': 7, 'polyorder': 2}, id='savitzky_golay'),
+    ],
+)
+@pytest.mark.parametrize(
+    ('dtype', 'expected_dtype'),
+    [
+        pytest.param(np.float32, np.float32, id='float32'),
+        pytest.param(np.float64, np.float64, id='float64'),
+        pytest.param(np.int64, np.float64, id='int64'),
+    ],
+)
+def test_pos2vel_preserves_float_dtype(method, kwargs, dtype, expected_dtype):
+    arr = np.arange(200).reshape(100, 2).astype(dtype)
+
+    result = pos2vel(arr, sampling_rate=1000, method=method, **kwargs)
+
+    assert result.dtype == expected_dtype
+
+
+@pytest.mark.parametrize('origin', ['center', 'lower left'])
+def test_pix2deg_float32_accuracy(origin):
+    rng = np.random.default_rng(42)
+    arr = rng.uniform(0, 1280, size=(100_000, 2))
+    kwargs = {'screen_px': (1280, 1024), 'screen_cm': (38, 30), 'distance_cm': 68}
+
+    expected = pix2deg(arr, origin=origin, **kwargs)
+    result = pix2deg(arr.astype(np.float32), origin=origin, **kwargs)
+
+    # Float32 pixel coordinates are exact up to 2^24, the remaining error is the float32 rounding
+    # of the result, i.e. well below a thousandth of a degree.
+    np.testing.assert_allclose(result, expected, rtol=1e-6, atol=1e-5)
+
+
+@pytest.mark.parametrize(
+    ('method', 'kwargs'),
+    [
+        pytest.param('smooth', {}, id='smooth'),
+        pytest.param('neighbors', {}, id='neighbors'),
+        pytest.param('preceding', {}, id='preceding'),
+        pytest.param('savitzky_golay', {'window_length': 7, 'polyorder': 2}, id='savitzky_golay'),
+    ],
+)
+def test_pos2vel_float32_accuracy(method, kwargs):
+    rng = np.random.default_rng(42)
+    positions = np.cumsum(rng.normal(scale=0.01, size=(100_000, 2)), axis=0)
+
+    expected = pos2vel(positions, sampling_rate=1000, method=method, **kwargs)
+    result = pos2vel(positions.astype(np.float32), sampling_rate=1000, method=method, **kwargs)
+
+    # Velocities are differences of positions, so the error is dominated by the float32 rounding
+    # of the positions scaled by the sampling rate.
+    position_resolution = np.spacing(np.abs(positions).max().astype(np.float32))
+    np.testing.assert_allclose(result, expected, atol=2 * 1000 * position_resolution)
+
+
+pos2vel_methods = [
+    pytest.param('smooth', {}, id='smooth'),
+    pytest.param('neighbors', {}, id='neighbors'),
+    pytest.param('preceding', {}, id='preceding'),
+    pytest.param('savitzky_golay', {'window_length': 7, 'polyorder': 2}, id='savitzky_golay'),
+]
+
+
+@pytest.mark.parametrize(('method', 'kwargs'), pos2vel_methods)
+@pytest.mark.parametrize('shape', [(100,), (100, 2), (100, 4)], ids=['1d', '2d', '4d'])
+def test_pos2vel_out_equals_returned_velocities(method, kwargs, shape):
+    arr = np.random.default_rng(42).normal(size=shape)
+    out = np.full(shape, np.nan)
+
+    result = pos2vel(arr, sampling_rate=1000, method=method, out=out, **kwargs)
+
+    assert result is out
+    np.testing.assert_array_equal(out, pos2vel(arr, sampling_rate=1000, method=method, **kwargs))
+
+
+@pytest.mark.parametrize(('method', 'kwargs'), pos2vel_methods)
+def test_pos2vel_out_in_place(method, kwargs):
+    arr = np.random.default_rng(42).normal(size=(100, 2))
+    expected = pos2vel(arr, sampling_rate=1000, method=method, **kwargs)
+
+    result = pos2vel(arr, sampling_rate=1000, method=method, out=arr, **kwargs)
+
+    assert result is arr
+    np.testing.assert_array_equal(arr, expected)
+
+
+@pytest.mark.parametrize(
+    'method',
+    [
+        pytest.param('smooth', id='smooth'),
+        pytest.param('neighbors', id='neighbors'),
+        pytest.param('preceding', id='preceding'),
+    ],
+)
+def test_pos2vel_out_does_not_allocate_temporary_arrays(method):
+    arr = np.random.default_rng(42).normal(size=(100_000, 2))
+    out = np.empty_like(arr)
+
+    tracemalloc.start()
+    pos2vel(arr, sampling_rate=1000, method=method, out=out)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak_memory < arr.nbytes / 100
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        pytest.param(
+            {'arr': np.ones((10, 2)), 'out': np.empty((10, 3))},
+            id='out_with_different_shape_raises_value_error',
+        ),
+        pytest.param(
+            {'arr': np.ones((10, 2)), 'out': np.empty((9, 2))},
+            id='out_with_fewer_samples_raises_value_error',
+        ),
+    ],
+)
+def test_pos2vel_out_raises_error(kwargs):
+    with pytest.raises(ValueError, match='out needs to have the shape of arr'):
+        pos2vel(**kwargs)
+
+
+@pytest.mark.parametrize(('method', 'kwargs'), pos2vel_methods)
+@pytest.mark.parametrize('use_out', [False, True], ids=['without_out', 'with_out'])
+def test_pos2vel_batch_equals_pos2vel(method, kwargs, use_out):
+    arr = np.random.default_rng(42).normal(size=(5, 100, 4))
+    out = np.empty_like(arr) if use_out else None
+
+    result = pos2vel_batch(arr, sampling_rate=500, method=method, out=out, **kwargs)
+
+    if use_out:
+        assert result is out
+    for series, velocities in zip(arr, result):
+        np.testing.assert_allclose(
+            velocities, pos2vel(series, sampling_rate=500, method=method, **kwargs),
+            rtol=1e-12, atol=1e-9,
+        )
+
+
+@pytest.mark.parametrize(('method', 'kwargs'), pos2vel_methods)
+@pytest.mark.parametrize('block_bytes', [1, 3200, 2 ** 40], ids=['1_series', '2_series', 'all'])
+def test_pos2vel_batch_blocks_equal_single_block(method, kwargs, block_bytes, monkeypatch):
+    arr = np.random.default_rng(42).normal(size=(5, 100, 2))
+    expected = pos2vel_batch(arr, sampling_rate=500, method=method, **kwargs)
+
+    monkeypatch.setattr(transforms, 'POS2VEL_BATCH_BLOCK_BYTES', block_bytes)
+    result = pos2vel_batch(arr, sampling_rate=500, method=method, **kwargs)
+
+    np.testing.assert_array_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    'kwargs, expected_error',
+    [
+        pytest.param({'arr': np.ones((10, 2))}, ValueError, id='2d_arr_raises_value_error'),
+        pytest.param({'arr': np.ones((2, 10, 2, 2))}, ValueError, id='4d_arr_raises_value_error'),
+        pytest.param(
+            {'arr': np.ones((2, 5, 2)), 'method': 'smooth'},
+            ValueError,
+            id='too_few_samples_raises_value_error',
+        ),
+        pytest.param(
+            {'arr': np.ones((2, 10, 2)), 'sampling_rate': 0},
+            ValueError,
+            id='sampling_rate_zero_raises_value_error',
+        ),
+        pytest.param(
+            {'arr': np.ones((2, 10, 2)), 'method': 'foo'},
+            ValueError,
+            id='invalid_method_raises_value_error',
+        ),
+        pytest.param(
+            {'arr': np.ones((2, 10, 2)), 'out': np.empty((2, 10, 4))},
+            ValueError,
+            id='out_with_different_shape_raises_value_error',
+        ),
+    ],
+)
+def test_pos2vel_batch_raises_error(kwargs, expected_error):
+    with pytest.raises(expected_error):
+        pos2vel_batch(**kwargs)
+
+
+@pytest.mark.parametrize('mode', ['interp', 'mirror', 'nearest', 'constant', 'wrap'])
+@pytest.mark.parametrize('deriv', [0, 1, 2])
+@pytest.mark.parametrize(
+    'window_length, polyorder',
+    [
+        pytest.param(7, 2, id='window_7_order_2'),
+        pytest.param(6, 3, id='window_6_order_3'),
+        pytest.param(21, 4, id='window_21_order_4'),
+    ],
+)
+@pytest.mark.parametrize('shape', [(100,), (100, 2), (100, 4)], ids=['1d', '2d', '4d'])
+def test_savitzky_golay_equals_scipy(mode, deriv, window_length, polyorder, shape):
+    arr = np.cumsum(np.random.default_rng(42).normal(size=shape), axis=0)
+
+    result = savitzky_golay(
+        arr, window_length, polyorder, deriv=deriv, sampling_rate=500, mode=mode,
+    )
+    expected = savgol_filter(
+        arr, window_length, polyorder, deriv=deriv, delta=1 / 500, axis=0, mode=mode,
+    )
+
+    np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-10 * np.abs(expected).max())
+
+
+@pytest.mark.parametrize(
+    ('dtype', 'expected_dtype'),
+    [
+        pytest.param(np.float32, np.float32, id='float32'),
+        pytest.param(np.float64, np.float64, id='float64'),
+        pytest.param(np.int64, np.float64, id='int64'),
+    ],
+)
+def test_savitzky_golay_preserves_float_dtype(dtype, expected_dtype):
+    arr = np.arange(200).reshape(100, 2).astype(dtype)
+
+    assert savitzky_golay(arr, 7, 2).dtype == expected_dtype
+
+
+def test_savitzky_golay_caches_coefficients():
+    arr = np.random.default_rng(42).normal(size=(100, 2))
+    transforms._get_savitzky_golay_coefficients.cache_clear()
+
+    for _ in range(3):
+        savitzky_golay(arr, 11, 3, deriv=1, sampling_rate=250)
+    savitzky_golay(arr, 11, 3, deriv=1, sampling_rate=500)
+
+    cache_info = transforms._get_savitzky_golay_coefficients.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (2, 2)
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        pytest.param({'arr': np.ones((2, 10, 2))}, id='3d_arr_raises_value_error'),
+        pytest.param({'arr': np.ones((10, 2)), 'sampling_rate': 0}, id='sampling_rate_zero'),
+        pytest.param({'arr': np.ones((10, 2)), 'mode': 'foo'}, id='invalid_mode'),
+        pytest.param({'arr': np.ones((5, 2))}, id='interp_with_too_few_samples'),
+        pytest.param({'arr': np.ones((10, 2)), 'polyorder': 7}, id='polyorder_not_below_window'),
+        pytest.param({'arr': np.ones((10, 2)), 'out': np.empty((10, 3))}, id='out_wrong_shape'),
+    ],
+)
+def test_savitzky_golay_raises_value_error(kwargs):
+    kwargs = {'window_length': 7, 'polyorder': 2, **kwargs}
+    with pytest.raises(ValueError):
+        savitzky_golay(**kwargs)
+
+
+@pytest.mark.parametrize('mode', ['interp', 'mirror'])
+@pytest.mark.parametrize('dtype', [np.float64, np.int64], ids=['float64', 'int64'])
+def test_smooth_pos2vel_equals_separate_filters(mode, dtype):
+    arr = (np.random.default_rng(42).normal(size=(100, 2)) * 100).astype(dtype)
+
+    positions, velocities = smooth_pos2vel(arr, 7, 2, sampling_rate=500, mode=mode)
+
+    np.testing.assert_array_equal(
+        positions, savitzky_golay(arr, 7, 2, deriv=0, sampling_rate=500, mode=mode),
+    )
+    np.testing.assert_array_equal(
+        velocities,
+        pos2vel(
+            arr, sampling_rate=500, method='savitzky_golay',
+            window_length=7, polyorder=2, mode=mode,
+        ),
+    )
+
+
+def test_pos2vel_savitzky_golay_equals_scipy():
+    arr = np.cumsum(np.random.default_rng(42).normal(size=(1000, 2)), axis=0)
+
+    result = pos2vel(arr, sampling_rate=500, method='savitzky_golay', window_length=7, polyorder=2)
+    expected = savgol_filter(arr, 7, 2, deriv=1, axis=0) * 500
+
+    np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-10)
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        pytest.param({'delta': 0.5}, id='delta'),
+        pytest.param({'axis': 0}, id='axis_0'),
+        pytest.param({'axis': -1, 'mode': 'nearest'}, id='axis_-1_mode_nearest'),
+        pytest.param({'delta': 2.0, 'mode': 'constant', 'cval': 1.0}, id='delta_mode_constant'),
+    ],
+)
+def test_pos2vel_savitzky_golay_kwargs_equal_scipy(kwargs):
+    arr = np.cumsum(np.random.default_rng(42).normal(size=(100, 2)), axis=0)
+
+    result = pos2vel(
+        arr, sampling_rate=500, method='savitzky_golay', window_length=7, polyorder=2, **kwargs,
+    )
+    expected = np.stack([
+        savgol_filter(arr[:, channel], 7, 2, deriv=1, **kwargs) for channel in range(2)
+    ], axis=1) * 500
+
+    np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-10)
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'msg_substrings'),
+    [
+        pytest.param({'deriv': 2}, ('support', 'deriv'), id='deriv'),
+        pytest.param({'foo': 1}, ('support', 'foo'), id='unknown'),
+        pytest.param({'axis': 1}, ('axis', '0 or -1'), id='axis_1'),
+        pytest.param({'delta': 0}, ('delta', 'above zero'), id='delta_zero'),
+    ],
+)
+def test_pos2vel_savitzky_golay_unsupported_kwargs_raise_value_error(kwargs, msg_substrings):
+    with pytest.raises(ValueError) as excinfo:
+        pos2vel(
+            np.ones((100, 2)), method='savitzky_golay', window_length=7, polyorder=2, **kwargs,
+        )
+
+    msg, = excinfo.value.args
+    for msg_substring in msg_substrings:
+        assert msg_substring in msg
+
+
 @pytest.mark.parametrize(
     'params, expected_value',
     [
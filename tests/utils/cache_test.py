@@ -0,0 +1,254 @@
+# Copyright (c) 2023 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test pymovements stage cache."""
+import os
+
+import numpy as np
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from pymovements.gaze.experiment import Experiment
+from pymovements.utils.cache import StageCache
+
+
+def test_stage_cache_get_or_compute(tmp_path):
+    cache = StageCache(tmp_path)
+    data = pl.DataFrame({'x': [1.0, 2.0, 3.0]})
+    num_computations = 0
+
+    def compute():
+        nonlocal num_computations
+        num_computations += 1
+        return data.select(pl.col('x') * 2)
+
+    first_result = cache.get_or_compute('double', data, compute, factor=2)
+    second_result = cache.get_or_compute('double', data, compute, factor=2)
+
+    assert num_computations == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert_frame_equal(first_result, pl.DataFrame({'x': [2.0, 4.0, 6.0]}))
+    assert_frame_equal(second_result, first_result)
+
+
+@pytest.mark.parametrize(
+    ('other_name', 'other_data', 'other_parameters'),
+    [
+        pytest.param(
+            'other', pl.DataFrame({'x': [1.0, 2.0]}), {'factor': 2},
+            id='different_name',
+        ),
+        pytest.param(
+            'stage', pl.DataFrame({'x': [1.0, 2.5]}), {'factor': 2},
+            id='different_values',
+        ),
+        pytest.param(
+            'stage', pl.DataFrame({'y': [1.0, 2.0]}), {'factor': 2},
+            id='different_column_name',
+        ),
+        pytest.param(
+            'stage', pl.DataFrame({'x': [1.0, 2.0]}, schema={'x': pl.Float32}), {'factor': 2},
+            id='different_dtype',
+        ),
+        pytest.param(
+            'stage', pl.DataFrame({'x': [1.0, 2.0]}), {'factor': 3},
+            id='different_parameter_value',
+        ),
+        pytest.param(
+            'stage', pl.DataFrame({'x': [1.0, 2.0]}), {'factor': 2, 'offset': 0},
+            id='additional_parameter',
+        ),
+        pytest.param(
+            'stage', pl.DataFrame({'x': [1.0, 2.0]}), {'factor': np.int64(2)},
+            id='different_parameter_type',
+        ),
+    ],
+)
+def test_stage_cache_make_key_differs(other_name, other_data, other_parameters):
+    key = StageCache.make_key('stage', pl.DataFrame({'x': [1.0, 2.0]}), factor=2)
+    other_key = StageCache.make_key(other_name, other_data, **other_parameters)
+
+    assert key != other_key
+
+
+def test_stage_cache_make_key_describes_objects():
+    data = pl.DataFrame({'x': [1.0, 2.0]})
+    experiment = Experiment(1024, 768, 38, 30, 60, 'center', 1000)
+
+    key = StageCache.make_key('stage', data, experiment=experiment, method=np.sum)
+    same_key = StageCache.make_key(
+        'stage', data,
+        experiment=Experiment(1024, 768, 38, 30, 60, 'center', 1000), method=np.sum,
+    )
+    other_experiment_key = StageCache.make_key(
+        'stage', data,
+        experiment=Experiment(1024, 768, 38, 30, 70, 'center', 1000), method=np.sum,
+    )
+    other_method_key = StageCache.make_key('stage', data, experiment=experiment, method=np.mean)
+
+    assert key == same_key
+    assert len({key, other_experiment_key, other_method_key}) == 3
+
+
+def test_stage_cache_make_key_ignores_chunks():
+    data = pl.DataFrame({'x': [1.0, 2.0, None]})
+    chunked_data = pl.concat([data.head(1), data.tail(2)], rechunk=False)
+
+    assert chunked_data.n_chunks() == 2
+    assert StageCache.make_key('stage', data) == StageCache.make_key('stage', chunked_data)
+
+
+def test_stage_cache_make_key_describes_lambdas_by_closure():
+    data = pl.DataFrame({'x': [1.0, 2.0]})
+    methods = [lambda x, factor=factor: x * factor for factor in [2, 2, 3]]
+
+    keys = [StageCache.make_key('stage', data, method=method) for method in methods]
+
+    assert keys[0] == keys[1]
+    assert keys[0] != keys[2]
+
+
+def test_stage_cache_make_key_describes_functions_by_code():
+    data = pl.DataFrame({'x': [1.0, 2.0]})
+
+    def method(x):
+        return x * 2
+
+    def edited_method(x):
+        return x * 3
+
+    # Simulate editing the body of a function.
+    edited_method.__qualname__ = method.__qualname__
+
+    key = StageCache.make_key('stage', data, method=method)
+    other_key = StageCache.make_key('stage', data, method=edited_method)
+
+    assert key != other_key
+
+
+def test_stage_cache_make_key_without_data():
+    key = StageCache.make_key('stage', None, source='a', factor=2)
+
+    assert key == StageCache.make_key('stage', None, source='a', factor=2)
+    assert key != StageCache.make_key('stage', None, source='b', factor=2)
+    assert key != StageCache.make_key('stage', pl.DataFrame(), source='a', factor=2)
+
+
+def test_stage_cache_get_or_compute_without_data(tmp_path):
+    cache = StageCache(tmp_path)
+
+    data = pl.DataFrame({'x': [1.0]})
+
+    first_result = cache.get_or_compute('stage', None, lambda: data, source='a')
+    second_result = cache.get_or_compute('stage', None, pl.DataFrame, source='a')
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert_frame_equal(second_result, first_result)
+
+
+def test_stage_cache_evicts_least_recently_used(tmp_path):
+    data = pl.DataFrame({'x': np.arange(1000, dtype=np.float64)})
+    cache = StageCache(tmp_path)
+    cache.put('a', data)
+    entry_size = cache.size
+    cache.max_size = 2 * entry_size
+
+    cache.put('b', data)
+    assert cache.get('a') is not None
+
+    cache.put('c', data)
+
+    assert cache.get('a') is not None
+    assert cache.get('b') is None
+    assert cache.get('c') is not None
+    assert cache.size == 2 * entry_size
+
+
+def test_stage_cache_clear(tmp_path):
+    cache = StageCache(tmp_path)
+    cache.put('a', pl.DataFrame({'x': [1.0]}))
+
+    cache.clear()
+
+    assert cache.get('a') is None
+    assert cache.size == 0
+
+
+@pytest.mark.parametrize(
+    'access_cache',
+    [
+        pytest.param(StageCache.evict, id='evict'),
+        pytest.param(StageCache.clear, id='clear'),
+        pytest.param(lambda cache: cache.size, id='size'),
+    ],
+)
+def test_stage_cache_closes_directory_iterators(access_cache, tmp_path, monkeypatch):
+    cache = StageCache(tmp_path)
+    cache.put('a', pl.DataFrame({'x': [1.0]}))
+
+    scandir = os.scandir
+    iterators = []
+
+    class ClosingScandirIterator:
+        def __init__(self, path):
+            self.iterator = scandir(path)
+            self.is_closed = False
+            iterators.append(self)
+
+        def __iter__(self):
+            return iter(self.iterator)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self.iterator.close()
+            self.is_closed = True
+
+    monkeypatch.setattr(os, 'scandir', ClosingScandirIterator)
+    access_cache(cache)
+
+    assert iterators
+    assert all(iterator.is_closed for iterator in iterators)
+
+
+def test_stage_cache_corrupt_file_is_cache_miss(tmp_path):
+    cache = StageCache(tmp_path)
+    (tmp_path / 'a.feather').write_bytes(b'corrupt')
+
+    assert cache.get('a') is None
+
+
+def test_stage_cache_negative_max_size_raises_value_error(tmp_path):
+    with pytest.raises(ValueError, match='max_size must not be negative'):
+        StageCache(tmp_path, max_size=-1)
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='file modes are not supported on windows')
+def test_stage_cache_put_file_mode_follows_umask(tmp_path):
+    cache = StageCache(tmp_path)
+
+    previous_umask = os.umask(0o022)
+    try:
+        cache.put('a', pl.DataFrame({'x': [1.0]}))
+    finally:
+        os.umask(previous_umask)
+
+    assert os.stat(tmp_path / 'a.feather').st_mode & 0o777 == 0o644
@@ -20,14 +20,19 @@
 """
 Test pymovements paths.
 """
+import os
 import pathlib
 import re
+import types
 import unittest
 from pathlib import Path
 
 import pytest
 
+from pymovements.utils.paths import create_temporary_file
 from pymovements.utils.paths import get_filepaths
+from pymovements.utils.paths import iter_filepaths
+from pymovements.utils.paths import iter_match_filepaths
 from pymovements.utils.paths import match_filepaths
 
 
@@ -186,3 +191,93 @@ def test_match_filepaths_no_directory_raises_value_error(tmp_path):
 
     assert 'must point to a directory' in msg
     assert str(filepath) in msg
+
+
+def test_match_filepaths_nested_relative(tmp_path):
+    (tmp_path / 'a' / 'b').mkdir(parents=True)
+    (tmp_path / 'a' / 'b' / 'foo.txt').write_text('test')
+    (tmp_path / 'bar.txt').write_text('test')
+
+    result_dicts = match_filepaths(path=tmp_path, regex=re.compile('.*'))
+
+    expected_dicts = [{'filepath': str(Path('a/b/foo.txt'))}, {'filepath': 'bar.txt'}]
+    case = unittest.TestCase()
+    case.assertCountEqual(result_dicts, expected_dicts)
+
+
+def test_match_filepaths_relative_anchor(tmp_path):
+    create_directory(tmp_path, ['tmp_dir'], ['foo.txt'])
+    result_dicts = match_filepaths(
+        path=tmp_path / 'tmp_dir', regex=re.compile('.*'), relative_anchor=tmp_path,
+    )
+
+    assert result_dicts == [{'filepath': str(Path('tmp_dir/foo.txt'))}]
+
+
+@pytest.mark.parametrize(
+    ('pruned_dirpath', 'expected_paths'),
+    [
+        pytest.param(None, ['a/foo.txt', 'a/c/foo.txt', 'b/foo.txt'], id='no_pruning'),
+        pytest.param('a', ['b/foo.txt'], id='prune_top_level'),
+        pytest.param(str(Path('a/c')), ['a/foo.txt', 'b/foo.txt'], id='prune_nested'),
+    ],
+)
+def test_filepaths_prune(pruned_dirpath, expected_paths, tmp_path):
+    create_directory(tmp_path, ['a', 'a/c', 'b'], ['foo.txt'])
+    visited_dirpaths = []
+
+    def prune(dirpath):
+        visited_dirpaths.append(dirpath)
+        return dirpath == pruned_dirpath
+
+    filepaths = get_filepaths(path=tmp_path, extension='.txt', prune=prune)
+    match_dicts = match_filepaths(path=tmp_path, regex=re.compile('foo'), prune=prune)
+
+    assert sorted(filepaths) == sorted(tmp_path / Path(path) for path in expected_paths)
+    assert sorted(match_dict['filepath'] for match_dict in match_dicts) == sorted(
+        str(Path(path)) for path in expected_paths
+    )
+    if pruned_dirpath is not None:
+        assert not any(
+            dirpath.startswith(pruned_dirpath + os.sep) for dirpath in visited_dirpaths
+        )
+
+
+def test_iter_filepaths_is_generator(tmp_path):
+    create_directory(tmp_path, ['tmp_dir'], ['foo.txt', 'bar.txt'])
+
+    filepaths = iter_filepaths(path=tmp_path, extension='.txt')
+    match_dicts = iter_match_filepaths(path=tmp_path, regex=re.compile('foo'))
+
+    assert isinstance(filepaths, types.GeneratorType)
+    assert isinstance(match_dicts, types.GeneratorType)
+    assert next(match_dicts) == {'filepath': str(Path('tmp_dir/foo.txt'))}
+    assert sorted(filepaths) == [tmp_path / 'tmp_dir/bar.txt', tmp_path / 'tmp_dir/foo.txt']
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='file modes are not supported on windows')
+@pytest.mark.parametrize(
+    'umask',
+    [
+        pytest.param(0o022, id='umask_022'),
+        pytest.param(0o077, id='umask_077'),
+    ],
+)
+def test_create_temporary_file_mode_follows_umask(umask, tmp_path):
+    previous_umask = os.umask(umask)
+    try:
+        filepath = create_temporary_file(tmp_path, prefix='.foo.')
+    finally:
+        os.umask(previous_umask)
+
+    assert filepath.parent == tmp_path
+    assert filepath.name.startswith('.foo.')
+    assert filepath.suffix == '.tmp'
+    assert os.stat(filepath).st_mode & 0o777 == 0o666 & ~umask
+
+
+def test_create_temporary_file_is_unique(tmp_path):
+    filepaths = {create_temporary_file(tmp_path) for _ in range(10)}
+
+    assert len(filepaths) == 10
+    assert all(filepath.stat().st_size == 0 for filepath in filepaths)
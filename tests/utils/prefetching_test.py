@@ -0,0 +1,143 @@
+# Copyright (c) 2023 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test pymovements prefetching."""
+import threading
+import time
+
+import pytest
+
+from pymovements.utils.prefetching import Prefetcher
+
+
+@pytest.mark.parametrize(
+    ('depth', 'num_workers'),
+    [
+        pytest.param(1, 1, id='depth_1'),
+        pytest.param(3, 1, id='depth_3'),
+        pytest.param(3, 3, id='depth_3_three_workers'),
+        pytest.param(20, 2, id='depth_larger_than_items'),
+    ],
+)
+def test_prefetcher_keeps_order(depth, num_workers):
+    def function(item):
+        # Later items finish earlier.
+        time.sleep((10 - item) / 1000)
+        return item * 2
+
+    with Prefetcher(function, range(10), depth=depth, num_workers=num_workers) as results:
+        assert list(results) == list(range(0, 20, 2))
+
+
+@pytest.mark.parametrize('depth', [1, 2, 5])
+def test_prefetcher_backpressure(depth):
+    num_consumed_items = 0
+
+    def items():
+        nonlocal num_consumed_items
+        for item in range(100):
+            num_consumed_items += 1
+            yield item
+
+    prefetcher = Prefetcher(lambda item: item, items(), depth=depth)
+    assert num_consumed_items == 0
+
+    for _ in range(3):
+        next(prefetcher)
+        time.sleep(0.01)
+        assert num_consumed_items <= 3 + depth
+    prefetcher.close()
+
+
+@pytest.mark.parametrize('depth', [1, 2, 5])
+def test_prefetcher_alive_results(depth):
+    num_alive_results = 0
+    max_num_alive_results = 0
+
+    class Result:
+        def __init__(self):
+            nonlocal num_alive_results, max_num_alive_results
+            num_alive_results += 1
+            max_num_alive_results = max(max_num_alive_results, num_alive_results)
+
+        def __del__(self):
+            nonlocal num_alive_results
+            num_alive_results -= 1
+
+    with Prefetcher(lambda item: Result(), range(20), depth=depth) as results:
+        for _ in results:
+            time.sleep(0.005)
+            assert num_alive_results <= depth + 1
+
+    assert max_num_alive_results <= depth + 2
+
+
+def test_prefetcher_overlaps_function_with_consumer():
+    next_item_started = threading.Event()
+
+    def function(item):
+        if item == 1:
+            next_item_started.set()
+        return item
+
+    with Prefetcher(function, range(3), depth=1) as results:
+        assert next(results) == 0
+        # The next item is processed while the consumer still holds the first one.
+        assert next_item_started.wait(timeout=10)
+        assert list(results) == [1, 2]
+
+
+def test_prefetcher_close_stops_iteration():
+    prefetcher = Prefetcher(lambda item: item, range(10), depth=2)
+    next(prefetcher)
+    prefetcher.close()
+
+    with pytest.raises(StopIteration):
+        next(prefetcher)
+
+
+def test_prefetcher_raises_function_exception():
+    def function(item):
+        if item == 2:
+            raise KeyError(item)
+        return item
+
+    prefetcher = Prefetcher(function, range(10), depth=2)
+    assert [next(prefetcher), next(prefetcher)] == [0, 1]
+
+    with pytest.raises(KeyError):
+        next(prefetcher)
+    with pytest.raises(StopIteration):
+        next(prefetcher)
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'expected_msg'),
+    [
+        pytest.param({'depth': 0}, 'depth must be at least 1 but is 0', id='depth_zero'),
+        pytest.param(
+            {'num_workers': 0}, 'num_workers must be at least 1 but is 0', id='num_workers_zero',
+        ),
+    ],
+)
+def test_prefetcher_exceptions(kwargs, expected_msg):
+    with pytest.raises(ValueError) as excinfo:
+        Prefetcher(lambda item: item, [], **kwargs)
+    msg, = excinfo.value.args
+    assert msg == expected_msg
@@ -0,0 +1,112 @@
+# Copyright (c) 2023 The pymovements Project Authors
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Test pymovements profiling."""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from pymovements.utils.profiling import get_peak_memory
+from pymovements.utils.profiling import Profiler
+
+
+def test_profiler_record():
+    profiler = Profiler()
+    profiler.record('load', wall_time=2.0, filepath='a.csv', num_samples=1000, bytes_read=10)
+    profiler.record('save', wall_time=0.5, bytes_written=20, peak_memory=30)
+
+    frame = profiler.to_frame()
+
+    assert frame.schema == Profiler.schema
+    assert frame['stage'].to_list() == ['load', 'save']
+    assert frame['filepath'].to_list() == ['a.csv', None]
+    assert frame['samples_per_second'].to_list() == [500.0, None]
+    assert frame['bytes_read'].to_list() == [10, None]
+    assert frame['bytes_written'].to_list() == [None, 20]
+    assert frame['peak_memory'].to_list() == [None, 30]
+
+
+def test_profiler_empty_frame():
+    frame = Profiler().to_frame()
+
+    assert frame.schema == Profiler.schema
+    assert len(frame) == 0
+
+
+def test_profiler_measure():
+    profiler = Profiler()
+    with profiler.measure('stage', filepath='a.csv') as values:
+        values['num_samples'] = 10
+
+    record, = profiler.records
+    assert record['stage'] == 'stage'
+    assert record['num_samples'] == 10
+    assert record['wall_time'] >= 0
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason='peak memory needs linux')
+def test_profiler_measure_peak_memory():
+    num_bytes = 2**27
+    profiler = Profiler()
+    with profiler.measure('allocate'):
+        np.ones(num_bytes // 8).sum()
+    with profiler.measure('sum'):
+        np.arange(10).sum()
+
+    allocate_record, sum_record = profiler.records
+    assert allocate_record['peak_memory'] > num_bytes // 2
+    assert 0 <= sum_record['peak_memory'] < num_bytes // 2
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason='peak memory needs linux')
+def test_profiler_overlapping_measurements_keep_peak_memory():
+    num_bytes = 2**27
+    profiler = Profiler()
+    first_measurement_id = profiler.start()
+    np.ones(num_bytes // 8).sum()
+    second_measurement_id = profiler.start()
+    profiler.stop(first_measurement_id, 'first')
+    profiler.stop(second_measurement_id, 'second')
+
+    first_record, second_record = profiler.records
+    assert first_record['peak_memory'] > num_bytes // 2
+    assert second_record['peak_memory'] < num_bytes // 2
+
+
+def test_profiler_measure_does_not_record_failed_block():
+    profiler = Profiler()
+    with pytest.raises(KeyError):
+        with profiler.measure('stage'):
+            raise KeyError
+
+    assert not profiler.records
+
+
+def test_profiler_record_concurrently():
+    profiler = Profiler()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda index: profiler.record('stage', wall_time=index), range(100)))
+
+    assert sorted(record['wall_time'] for record in profiler.records) == list(range(100))
+
+
+def test_get_peak_memory():
+    assert get_peak_memory() > 2**20